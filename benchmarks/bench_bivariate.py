@@ -0,0 +1,66 @@
+"""Build and draw time of a bivariate color legend
+
+Compare a grid of rectangles, one per cell, with the single image
+drawn by BivariateColorArt.
+
+    python benchmarks/bench_bivariate.py
+
+"""
+
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.collections import PatchCollection  # noqa: E402
+from matplotlib.patches import Rectangle  # noqa: E402
+
+from legendkit import bivariate_colorart  # noqa: E402
+
+N = 256
+
+
+def make_lut(n):
+    x, y = np.meshgrid(np.linspace(0, 1, n), np.linspace(0, 1, n))
+    return np.dstack([x, 0.5 * (x + y), y])
+
+
+def grid_patches(ax, lut):
+    n = lut.shape[0]
+    rects = [
+        Rectangle((j / n, i / n), 1 / n, 1 / n, fc=lut[i, j])
+        for i in range(n)
+        for j in range(n)
+    ]
+    ax.add_collection(PatchCollection(rects, match_original=True))
+
+
+def bench(name, build):
+    fig, ax = plt.subplots()
+    ax.set_axis_off()
+    lut = make_lut(N)
+    t0 = time.perf_counter()
+    build(ax, lut)
+    fig.canvas.draw()
+    elapsed = time.perf_counter() - t0
+    buf = io.BytesIO()
+    fig.savefig(buf, format="svg")
+    plt.close(fig)
+    print(
+        f"{name:>7} build + agg draw: {elapsed * 1000:8.1f} ms  "
+        f"svg: {buf.tell() / 1024:8.1f} KiB"
+    )
+
+
+def main():
+    print(f"{N}x{N} colors")
+    bench("patches", grid_patches)
+    bench("image", lambda ax, lut: bivariate_colorart(lut, ax=ax, loc="center"))
+
+
+if __name__ == "__main__":
+    main()
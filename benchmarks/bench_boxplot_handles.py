@@ -0,0 +1,39 @@
+"""A legend of many boxplot groups saved as PDF and SVG
+
+python benchmarks/bench_boxplot_handles.py
+
+"""
+
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from legendkit import legend  # noqa: E402
+
+N_ITEMS = 300
+
+
+def main():
+    items = [("boxplot", f"Group {i}", {"fc": f"C{i % 10}"}) for i in range(N_ITEMS)]
+    print(f"{N_ITEMS} boxplot entries, time in ms")
+    for fmt in ["pdf", "svg"]:
+        fig, ax = plt.subplots(figsize=(10, 10))
+        ax.set_axis_off()
+        t0 = time.perf_counter()
+        legend(ax, legend_items=items, ncols=10, loc="center")
+        t_legend = time.perf_counter() - t0
+        buffer = io.BytesIO()
+        t0 = time.perf_counter()
+        fig.savefig(buffer, format=fmt)
+        t_save = time.perf_counter() - t0
+        plt.close(fig)
+        print(f"{fmt}: legend {t_legend * 1000:8.1f}, save {t_save * 1000:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Draw time and file size of discrete ColorArts
+
+Compare the legacy one-rectangle-per-bin rendering with the merged blocks
+drawn as a single collection, for a categorical colormap with repeated
+colors and a BoundaryNorm with many bins.
+
+    python benchmarks/bench_colorart_discrete.py
+
+"""
+
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib import colors  # noqa: E402
+from matplotlib.collections import PatchCollection  # noqa: E402
+from matplotlib.patches import Rectangle  # noqa: E402
+
+from legendkit import colorart  # noqa: E402
+
+N_BINS = 4096
+
+
+def legacy_patches(colors_list, width, height):
+    n = len(colors_list)
+    rects = [
+        Rectangle((0, height * i / n), width=width, height=height / n, fc=c)
+        for i, c in enumerate(colors_list)
+    ]
+    return PatchCollection(rects, match_original=True)
+
+
+CASES = {
+    "categorical": dict(
+        cmap=colors.ListedColormap(
+            np.repeat(plt.get_cmap("tab10").colors, N_BINS // 10, axis=0)
+        ),
+        norm=None,
+    ),
+    "boundary": dict(
+        cmap=colors.ListedColormap(
+            np.repeat(plt.get_cmap("tab20").colors, N_BINS // 20, axis=0)
+        ),
+        norm=colors.BoundaryNorm(np.linspace(0, 1, N_BINS // 20 * 20 + 1), N_BINS),
+    ),
+}
+
+
+def make_figure(case, legacy):
+    fig, ax = plt.subplots()
+    ax.set_axis_off()
+    m = ax.pcolormesh(np.random.rand(10, 10), **CASES[case])
+    ca = colorart(m, ax=ax, ticks=[0, 1])
+    if legacy:
+        canvas = ca._canvas
+        canvas._children.remove(ca._gradient)
+        lut = m.cmap(np.arange(m.cmap.N))
+        patches = legacy_patches(lut, ca.width, ca.height)
+        canvas._children.insert(0, patches)
+        patches.set_transform(canvas.get_transform())
+        patches.set_figure(fig)
+    return fig
+
+
+def bench(case, legacy, repeat=5):
+    fig = make_figure(case, legacy)
+    fig.canvas.draw()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fig.canvas.draw()
+    draw_time = (time.perf_counter() - t0) / repeat
+    sizes = {}
+    for fmt in ["svg", "pdf"]:
+        buf = io.BytesIO()
+        fig.savefig(buf, format=fmt)
+        sizes[fmt] = buf.tell()
+    plt.close(fig)
+    return draw_time, sizes
+
+
+def main():
+    print(f"{N_BINS} bins per colorart")
+    for case in CASES:
+        for legacy in [True, False]:
+            draw_time, sizes = bench(case, legacy)
+            name = "patches" if legacy else "blocks"
+            print(
+                f"{case:>12} {name:>8} "
+                f"agg draw: {draw_time * 1000:8.1f} ms  "
+                f"svg: {sizes['svg'] / 1024:8.1f} KiB  "
+                f"pdf: {sizes['pdf'] / 1024:8.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Draw time and file size of the ColorArt gradient
+
+Compare the legacy one-rectangle-per-color rendering
+with the single image used by ColorArt.
+
+    python benchmarks/bench_colorart_gradient.py
+
+"""
+
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.collections import PatchCollection  # noqa: E402
+from matplotlib.patches import Rectangle  # noqa: E402
+
+from legendkit import colorart  # noqa: E402
+from legendkit._gradient import GradientImage  # noqa: E402
+
+N_ART = 40
+
+
+def legacy_patches(colors_list, width, height):
+    n = len(colors_list)
+    rects = [
+        Rectangle(
+            (0, height * i / n),
+            width=width,
+            height=height / n,
+            fc=c,
+            antialiased=False,
+        )
+        for i, c in enumerate(colors_list)
+    ]
+    return PatchCollection(rects, match_original=True)
+
+
+def make_figure(legacy, rasterized):
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.set_axis_off()
+    m = ax.pcolormesh(np.random.rand(10, 10), cmap="viridis")
+    for i in range(N_ART):
+        ca = colorart(
+            m,
+            ax=ax,
+            loc="lower left",
+            bbox_to_anchor=((i % 8) / 8, (i // 8) / 5),
+            bbox_transform=ax.transAxes,
+            rasterized=rasterized,
+        )
+        if legacy:
+            canvas = ca._cbar_box.get_children()[0]
+            for c in canvas.get_children():
+                if isinstance(c, GradientImage):
+                    canvas._children.remove(c)
+                    patches = legacy_patches(
+                        m.cmap(np.arange(m.cmap.N)), ca.width, ca.height
+                    )
+                    patches.set_rasterized(rasterized)
+                    canvas._children.insert(0, patches)
+                    patches.set_transform(canvas.get_transform())
+                    patches.set_figure(fig)
+    return fig
+
+
+def bench(legacy, rasterized, repeat=5):
+    fig = make_figure(legacy, rasterized)
+    fig.canvas.draw()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fig.canvas.draw()
+    draw_time = (time.perf_counter() - t0) / repeat
+    sizes = {}
+    for fmt in ["svg", "pdf"]:
+        buf = io.BytesIO()
+        fig.savefig(buf, format=fmt)
+        sizes[fmt] = buf.tell()
+    plt.close(fig)
+    return draw_time, sizes
+
+
+def main():
+    print(f"{N_ART} colorarts per figure")
+    for rasterized in [True, False]:
+        for legacy in [True, False]:
+            draw_time, sizes = bench(legacy, rasterized)
+            name = "patches" if legacy else "image"
+            print(
+                f"{name:>8} rasterized={rasterized!s:<5} "
+                f"agg draw: {draw_time * 1000:8.1f} ms  "
+                f"svg: {sizes['svg'] / 1024:8.1f} KiB  "
+                f"pdf: {sizes['pdf'] / 1024:8.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
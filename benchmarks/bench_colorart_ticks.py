@@ -0,0 +1,77 @@
+"""Tick computation of ColorArt for different norms
+
+Compare the per-tick python loop with the vectorized tick location.
+
+    python benchmarks/bench_colorart_ticks.py
+
+"""
+
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib import colors  # noqa: E402
+
+from legendkit import colorart  # noqa: E402
+
+N_TICKS = 500
+
+
+def legacy_locate(ca, v):
+    if isinstance(ca.norm, (colors.NoNorm, colors.BoundaryNorm)):
+        arr = ca._boundaries
+        normalize = colors.Normalize(vmin=np.min(arr), vmax=np.max(arr))
+        locs = np.array([normalize(i) for i in v])
+    else:
+        locs = np.array([ca.norm(i) for i in v])
+    h, w = ca.height, ca.width
+    if isinstance(ca.norm, colors.BoundaryNorm) & (ca.spacing == "uniform"):
+        locs = np.linspace(0, h, len(locs))
+    else:
+        locs = (1 - locs) * h if ca.flip else locs * h
+    ticks1, ticks2 = [], []
+    for loc in locs:
+        if 0 <= loc <= h:
+            ticks1.append([(0, loc), (w * ca.tick_size, loc)])
+            ticks2.append([(w, loc), (w * (1 - ca.tick_size), loc)])
+    valid_indices = [i for i, loc in enumerate(locs) if 0 <= loc <= h]
+    return locs[valid_indices], ticks1, ticks2
+
+
+NORMS = {
+    "Normalize": (colors.Normalize(0, 1), np.linspace(0, 1, N_TICKS)),
+    "LogNorm": (colors.LogNorm(1e-3, 1), np.geomspace(1e-3, 1, N_TICKS)),
+    "SymLogNorm": (
+        colors.SymLogNorm(0.1, vmin=-1, vmax=1),
+        np.linspace(-1, 1, N_TICKS),
+    ),
+    "BoundaryNorm": (
+        colors.BoundaryNorm(np.linspace(0, 1, N_TICKS), ncolors=N_TICKS),
+        np.linspace(0, 1, N_TICKS),
+    ),
+    "NoNorm": (colors.NoNorm(), np.arange(N_TICKS) % 256),
+}
+
+
+def main():
+    fig, ax = plt.subplots()
+    print(f"{N_TICKS} ticks, time per call")
+    for name, (norm, ticks) in NORMS.items():
+        ca = colorart(cmap="viridis", norm=norm, ax=ax, ticks=[0.5])
+        n = 20
+        legacy = timeit.timeit(lambda: legacy_locate(ca, ticks), number=n) / n
+        vectorized = timeit.timeit(lambda: ca._locate(ticks), number=n) / n
+        print(
+            f"{name:>13}  loop: {legacy * 1000:8.3f} ms  "
+            f"vectorized: {vectorized * 1000:8.3f} ms  "
+            f"speedup: {legacy / vectorized:6.1f}x"
+        )
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    main()
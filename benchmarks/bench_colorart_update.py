@@ -0,0 +1,58 @@
+"""Sequential norm updates of a ColorArt
+
+Compare rebuilding the ColorArt on every update with the in-place update
+triggered by the mappable.
+
+    python benchmarks/bench_colorart_update.py
+
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from legendkit import colorart  # noqa: E402
+
+N_UPDATES = 1000
+
+
+def bench_rebuild(m, ax, vmax):
+    ca = colorart(m, ax=ax)
+    t0 = time.perf_counter()
+    for v in vmax:
+        ca.remove()
+        m.set_clim(0, v)
+        ca = colorart(m, ax=ax)
+    return time.perf_counter() - t0
+
+
+def bench_inplace(m, ax, vmax):
+    ca = colorart(m, ax=ax)
+    t0 = time.perf_counter()
+    for v in vmax:
+        m.set_clim(0, v)
+    elapsed = time.perf_counter() - t0
+    # Hold the colorart until the updates are timed
+    del ca
+    return elapsed
+
+
+def main():
+    vmax = np.linspace(1, 1000, N_UPDATES)
+    print(f"{N_UPDATES} norm updates, total time")
+    for name, func in [("rebuild", bench_rebuild), ("in-place", bench_inplace)]:
+        fig, ax = plt.subplots()
+        m = ax.pcolormesh(np.random.rand(10, 10), cmap="viridis")
+        elapsed = func(m, ax, vmax)
+        fig.canvas.draw()
+        plt.close(fig)
+        print(f"{name:>9}: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Animated limits of a shaped Colorbar
+
+Compare creating a new colorbar for every frame with updating
+the limits of the mappable, the shape clip is kept by the colorbar.
+
+    python benchmarks/bench_colorbar_shape.py
+
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from legendkit import colorbar  # noqa: E402
+
+N_FRAMES = 100
+
+
+def bench_recreate(fig, ax, m, vmax):
+    cb = colorbar(m, ax=ax, shape="ellipse")
+    t0 = time.perf_counter()
+    for v in vmax:
+        cb.ax.remove()
+        m.set_clim(0, v)
+        cb = colorbar(m, ax=ax, shape="ellipse")
+        fig.canvas.draw()
+    return time.perf_counter() - t0
+
+
+def bench_update(fig, ax, m, vmax):
+    colorbar(m, ax=ax, shape="ellipse")
+    t0 = time.perf_counter()
+    for v in vmax:
+        m.set_clim(0, v)
+        fig.canvas.draw()
+    return time.perf_counter() - t0
+
+
+def main():
+    vmax = np.linspace(1, 10, N_FRAMES)
+    print(f"{N_FRAMES} frames, time per frame")
+    for name, func in [("recreate", bench_recreate), ("update", bench_update)]:
+        fig, ax = plt.subplots()
+        m = ax.pcolormesh(np.random.rand(10, 10), cmap="viridis")
+        elapsed = func(fig, ax, m, vmax)
+        plt.close(fig)
+        print(f"{name:>9}: {elapsed * 1000 / N_FRAMES:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""A categorical legend with many entries saved in different formats
+
+Compare a handle artist for every entry with the batched handles.
+Most of the time to save is spent on the layout of the legend and
+its labels, the handles are timed by the boxes that draw them.
+
+    python benchmarks/bench_legend_batch.py
+
+"""
+
+import io
+import time
+from contextlib import contextmanager
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.offsetbox import DrawingArea  # noqa: E402
+
+from legendkit import cat_legend  # noqa: E402
+
+N_ITEMS = 500
+N_REPEATS = 3
+
+
+@contextmanager
+def handle_timer():
+    """Accumulate the time spent in drawing the handle boxes"""
+    elapsed = [0.0]
+    draw = DrawingArea.draw
+
+    def timed_draw(self, renderer):
+        t0 = time.perf_counter()
+        draw(self, renderer)
+        elapsed[0] += time.perf_counter() - t0
+
+    DrawingArea.draw = timed_draw
+    try:
+        yield elapsed
+    finally:
+        DrawingArea.draw = draw
+
+
+def bench(handle, fmt, batch_handles):
+    fig, ax = plt.subplots(figsize=(12, 12))
+    ax.set_axis_off()
+    cat_legend(
+        ax,
+        colors=[f"C{i % 10}" for i in range(N_ITEMS)],
+        labels=[f"Item {i}" for i in range(N_ITEMS)],
+        handle=handle,
+        ncols=10,
+        loc="center",
+        batch_handles=batch_handles,
+    )
+    fig.canvas.draw()
+    buffer = io.BytesIO()
+    with handle_timer() as handles:
+        t0 = time.perf_counter()
+        fig.savefig(buffer, format=fmt)
+        elapsed = time.perf_counter() - t0
+    plt.close(fig)
+    return handles[0], elapsed, buffer.getbuffer().nbytes / 1024
+
+
+def main():
+    print(f"{N_ITEMS} legend entries, time in ms, median of {N_REPEATS} runs")
+    print(f"{'':>20} {'handles':>8} {'save':>8} {'KiB':>8}")
+    for handle in ["circle", "rect"]:
+        for fmt in ["png", "svg", "pdf"]:
+            for label, batch_handles in [("per entry", False), ("batched", True)]:
+                t_handles, t_save, size = np.median(
+                    [bench(handle, fmt, batch_handles) for _ in range(N_REPEATS)],
+                    axis=0,
+                )
+                name = f"{handle} {fmt} {label}"
+                print(
+                    f"{name:>20} {t_handles * 1000:8.1f} {t_save * 1000:8.1f} "
+                    f"{size:8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Throughput of creating small legends
+
+Compare a handler map created for every legend with the shared one.
+
+    python benchmarks/bench_legend_construction.py
+
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from legendkit import legend  # noqa: E402
+from legendkit._handlers import (  # noqa: E402
+    BoxplotHandler,
+    CircleHandler,
+    RectHandler,
+)
+from legendkit.handles import BoxplotItem, CircleItem, RectItem  # noqa: E402
+
+N_LEGENDS = 2_000
+
+
+def main():
+    items = [
+        ("rect", "Rect", {"fc": "#01949A"}),
+        ("circle", "Circle", {"fc": "#004369"}),
+        ("line", "Line", {"color": "#DB1F48"}),
+    ]
+    _, ax = plt.subplots()
+
+    t0 = time.perf_counter()
+    for _ in range(N_LEGENDS):
+        handler_map = {
+            RectItem: RectHandler(),
+            CircleItem: CircleHandler(),
+            BoxplotItem: BoxplotHandler(),
+        }
+        legend(ax, legend_items=items, handler_map=handler_map, draw=False)
+    t_fresh = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(N_LEGENDS):
+        legend(ax, legend_items=items, draw=False)
+    t_shared = time.perf_counter() - t0
+    plt.close("all")
+
+    print(f"{N_LEGENDS} legends of {len(items)} items, legends per second")
+    print(f"new handler map:    {N_LEGENDS / t_fresh:8.0f}")
+    print(f"shared handler map: {N_LEGENDS / t_shared:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
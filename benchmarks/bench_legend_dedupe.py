@@ -0,0 +1,52 @@
+"""A figure legend of a facet grid
+
+Every facet plots the same groups, compare the legend with an entry
+for every artist and the legend deduplicated by style.
+
+    python benchmarks/bench_legend_dedupe.py
+
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from legendkit import legend  # noqa: E402
+
+GROUPS = ["Control", "Treated", "Placebo"]
+
+
+def make_figure():
+    fig, axes = plt.subplots(6, 6, figsize=(12, 12))
+    x = np.arange(10)
+    for ax in axes.flat:
+        for i, name in enumerate(GROUPS):
+            ax.plot(x, x * i, color=f"C{i}", label=name)
+            ax.scatter(x, x * i, color=f"C{i}", label=f"{name} points")
+    return fig
+
+
+def main():
+    print("6x6 facets, time in ms")
+    for dedupe in [False, True]:
+        fig = make_figure()
+        t0 = time.perf_counter()
+        leg = legend(fig, dedupe=dedupe)
+        t1 = time.perf_counter()
+        fig.canvas.draw()
+        t2 = time.perf_counter()
+        n = len(leg.get_texts())
+        plt.close(fig)
+        print(
+            f"dedupe={dedupe!s:>5}: create {(t1 - t0) * 1000:7.1f}, "
+            f"draw {(t2 - t1) * 1000:7.1f}, {n} entries"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Collecting the legend handles of a figure with many unlabeled artists
+
+Compare the discovery of ListLegend with the previous loop, which
+checked the type and looked up the handler of every artist.
+
+    python benchmarks/bench_legend_handles.py
+
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.collections import Collection  # noqa: E402
+from matplotlib.legend import Legend  # noqa: E402
+from matplotlib.lines import Line2D  # noqa: E402
+from matplotlib.patches import Patch  # noqa: E402
+
+from legendkit._legend import _get_legend_handles  # noqa: E402
+
+N_AXES = 100
+
+
+def previous_handles(axs):
+    handles = []
+    for ax in axs:
+        handles += [
+            *(a for a in ax._children if isinstance(a, (Line2D, Patch, Collection))),
+            *ax.containers,
+        ]
+    handler_map = Legend.get_default_handler_map()
+    for handle in handles:
+        label = handle.get_label()
+        if label != "_nolegend_" and Legend.get_legend_handler(handler_map, handle):
+            if label and not label.startswith("_"):
+                yield handle
+
+
+def make_figure(n_artists):
+    fig, axes = plt.subplots(10, 10)
+    for ax in axes.flat:
+        for _ in range(n_artists // N_AXES):
+            ax.add_line(Line2D([0, 1], [0, 1]))
+        ax.plot([0, 1], label="Control")
+        ax.plot([0, 1], label="Treated")
+    return fig
+
+
+def timeit(func, axes, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        n = len(list(func(axes)))
+        best = min(best, time.perf_counter() - t0)
+    return best, n
+
+
+def main():
+    print(f"{N_AXES} axes, time in ms")
+    print(f"{'artists':>8} {'previous':>9} {'indexed':>9} {'dedupe':>9}")
+    for n_artists in [1_000, 10_000, 50_000]:
+        fig = make_figure(n_artists)
+        axes = fig.get_axes()
+        t_prev, n_prev = timeit(previous_handles, axes)
+        t_new, n_new = timeit(_get_legend_handles, axes)
+        t_dedupe, n_dedupe = timeit(
+            lambda axs: _get_legend_handles(axs, dedupe=True), axes
+        )
+        assert n_prev == n_new
+        plt.close(fig)
+        print(
+            f"{n_artists:>8} {t_prev * 1000:9.2f} {t_new * 1000:9.2f} "
+            f"{t_dedupe * 1000:9.2f}  ({n_new} -> {n_dedupe} entries)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""A legend with many entries sharing one handle
+
+Compare creating the handle of every entry with the cached handles.
+
+    python benchmarks/bench_legend_items.py
+
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from legendkit import legend  # noqa: E402
+from legendkit._legend import _make_handle  # noqa: E402
+
+N_ITEMS = 10_000
+
+
+def main():
+    colors = ["#01949A", "#004369", "#DB1F48"]
+    items = [
+        ("circle", f"Item {i}", {"fc": colors[i % 3], "ec": "black"})
+        for i in range(N_ITEMS)
+    ]
+    _, ax = plt.subplots()
+    leg = legend(ax, legend_items=items[:1], draw=False)
+
+    t0 = time.perf_counter()
+    for handle, _, config in items:
+        _make_handle(handle, 1.0, leg._fontsize, config)
+    t_uncached = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    leg._parse_items(items)
+    t_cached = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    legend(ax, legend_items=items)
+    t_legend = time.perf_counter() - t0
+    plt.close("all")
+
+    print(f"{N_ITEMS} legend items, time in ms")
+    print(f"parse, uncached: {t_uncached * 1000:8.1f}")
+    print(f"parse, cached:   {t_cached * 1000:8.1f}")
+    print(f"whole legend:    {t_legend * 1000:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
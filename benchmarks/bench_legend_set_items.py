@@ -0,0 +1,53 @@
+"""A live-updating legend where one entry changes at every refresh
+
+Compare creating a new legend with updating the entries in place.
+
+    python benchmarks/bench_legend_set_items.py
+
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from legendkit import legend  # noqa: E402
+
+N_UPDATES = 1_000
+N_ITEMS = 20
+
+
+def frames():
+    labels = [f"Series {i}" for i in range(N_ITEMS)]
+    for i in range(N_UPDATES):
+        # one series disappears and a new one appears
+        labels[i % N_ITEMS] = f"Series {N_ITEMS + i}"
+        yield [("rect", label, {"fc": f"C{j % 10}"}) for j, label in enumerate(labels)]
+
+
+def main():
+    _, ax = plt.subplots()
+    leg = legend(ax, legend_items=next(frames()), loc="upper right")
+
+    t0 = time.perf_counter()
+    for items in frames():
+        ax.legend_ = None
+        leg = legend(ax, legend_items=items, loc="upper right")
+    t_rebuild = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for items in frames():
+        leg.set_items(items)
+    t_update = time.perf_counter() - t0
+    plt.close("all")
+
+    print(f"{N_UPDATES} updates of a legend of {N_ITEMS} entries, time in ms")
+    print(f"new legend: {t_rebuild * 1000:8.1f}")
+    print(f"set_items:  {t_update * 1000:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Many colorbars in one figure
+
+Compare the axes-based Colorbar with the LiteColorbar
+drawn as an offsetbox. The layout of the axes without any colorbar
+is the baseline, it takes most of the tight_layout time.
+
+    python benchmarks/bench_lite_colorbar.py
+
+"""
+
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from legendkit import colorbar, lite_colorbar  # noqa: E402
+
+N_COLORBARS = 100
+N_REPEATS = 5
+
+
+def bench(func):
+    fig, axes = plt.subplots(10, 10, figsize=(20, 20))
+    mappables = [ax.pcolormesh(np.random.rand(5, 5)) for ax in axes.flat]
+    t0 = time.perf_counter()
+    if func is not None:
+        for ax, m in zip(axes.flat, mappables):
+            func(m, ax=ax)
+    t1 = time.perf_counter()
+    fig.tight_layout()
+    t2 = time.perf_counter()
+    fig.canvas.draw()
+    t3 = time.perf_counter()
+    plt.close(fig)
+    return t1 - t0, t2 - t1, t3 - t2
+
+
+def main():
+    print(f"{N_COLORBARS} colorbars, time in ms")
+    print(f"{'':>14} {'create':>8} {'layout':>8} {'draw':>8}")
+    print(f"median of {N_REPEATS} runs")
+    for name, func in [
+        ("No colorbar", None),
+        ("Colorbar", colorbar),
+        ("LiteColorbar", lite_colorbar),
+    ]:
+        times = np.median([bench(func) for _ in range(N_REPEATS)], axis=0)
+        print(f"{name:>14} " + " ".join(f"{t * 1000:8.1f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
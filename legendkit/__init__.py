@@ -5,9 +5,11 @@ from ._version import version
 __version__ = version
 
 from ._colorart import ColorArt
-from ._colorbar import Colorbar
+from ._bivariate import BivariateColorArt
+from ._colorbar import Colorbar, LiteColorbar
 from ._legend import ListLegend, CatLegend, SizeLegend
 from ._paired_size import PairedSizeLegend
+from ._lut import lut_cache_info, clear_lut_cache
 
 # To register default setting and legend handlers
 from ._register import register
@@ -16,7 +18,9 @@ from .layout import vstack, hstack, stack
 register()
 
 colorbar = Colorbar
+lite_colorbar = LiteColorbar
 colorart = ColorArt
+bivariate_colorart = BivariateColorArt
 legend = ListLegend
 cat_legend = CatLegend
 size_legend = SizeLegend
@@ -25,7 +29,9 @@ paired_size_legend = PairedSizeLegend
 
 __all__ = [
     "colorbar",
+    "lite_colorbar",
     "colorart",
+    "bivariate_colorart",
     "legend",
     "cat_legend",
     "size_legend",
@@ -33,4 +39,6 @@ __all__ = [
     "vstack",
     "hstack",
     "stack",
+    "lut_cache_info",
+    "clear_lut_cache",
 ]
@@ -0,0 +1,130 @@
+"""Set the limits of a norm without scanning all the data
+
+Plotting functions like :meth:`imshow <matplotlib.axes.Axes.imshow>`
+already scale the norm, the scan is only needed when vmin or vmax is missing.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.cm import ScalarMappable
+
+_AUTOSCALE_OPTIONS = {"full", "sample", "none"}
+
+# The number of elements used to estimate the limits in 'sample' mode
+_MAX_SAMPLES = 1_000_000
+
+
+def sample_array(A, max_samples=_MAX_SAMPLES):
+    """Return a strided view of an array with at most about max_samples elements"""
+    A = np.asanyarray(A)
+    if A.size <= max_samples:
+        return A
+    step = int(np.ceil((A.size / max_samples) ** (1 / A.ndim)))
+    return A[(slice(None, None, step),) * A.ndim]
+
+
+def autoscale_norm(mappable, autoscale="full", data_range=None):
+    """Set the missing limits of the norm of a mappable
+
+    Parameters
+    ----------
+    mappable : :class:`ScalarMappable <matplotlib.cm.ScalarMappable>`
+    autoscale : {'full', 'sample', 'none'}
+        How to find the limits that are not set.
+        'full' scans the whole array, 'sample' scans a strided subsample
+        of the array, the extreme values may be missed. 'none' leaves
+        the norm as it is.
+    data_range : (vmin, vmax)
+        The precomputed limits of the data, used before scanning the array.
+
+    """
+    if autoscale not in _AUTOSCALE_OPTIONS:
+        raise ValueError("`autoscale` must be 'full', 'sample' or 'none'")
+    norm = mappable.norm
+    if data_range is not None:
+        vmin, vmax = data_range
+        if norm.vmin is None:
+            norm.vmin = vmin
+        if norm.vmax is None:
+            norm.vmax = vmax
+    # Reuse the limits on the norm, e.g. set when the mappable is plotted
+    if norm.scaled() or autoscale == "none":
+        return
+    A = mappable.get_array()
+    if A is None:
+        return
+    if autoscale == "sample":
+        A = sample_array(A)
+    norm.autoscale_None(A)
+
+
+def collect_mappables(items):
+    """The mappables in a list of mappables or axes
+
+    The images and collections with data are taken from an axes.
+    """
+    mappables = []
+    for item in np.ravel(np.asarray(items, dtype=object)):
+        if isinstance(item, Axes):
+            mappables.extend(
+                a
+                for a in [*item.images, *item.collections]
+                if isinstance(a, ScalarMappable) and a.get_array() is not None
+            )
+        else:
+            mappables.append(item)
+    if not mappables:
+        raise ValueError("No mappable is found")
+    return mappables
+
+
+def share_norm(mappables, autoscale="full", data_range=None):
+    """Let the mappables share the norm of the first one
+
+    The limits of the shared norm cover the limits of all the norms,
+    only the data of a norm without limits is scanned.
+
+    Parameters
+    ----------
+    mappables : list of :class:`ScalarMappable <matplotlib.cm.ScalarMappable>`
+    autoscale : {'full', 'sample', 'none'}
+        See :func:`autoscale_norm`.
+    data_range : (vmin, vmax)
+        The precomputed limits of all the data, nothing is scanned.
+
+    """
+    if autoscale not in _AUTOSCALE_OPTIONS:
+        raise ValueError("`autoscale` must be 'full', 'sample' or 'none'")
+    if data_range is None:
+        limits = np.full((len(mappables), 2), np.nan)
+        for i, m in enumerate(mappables):
+            autoscale_norm(m, autoscale=autoscale)
+            norm = m.norm
+            if norm.vmin is not None and norm.vmax is not None:
+                limits[i] = norm.vmin, norm.vmax
+        if np.isnan(limits).all():
+            vmin, vmax = None, None
+        else:
+            vmin, vmax = np.nanmin(limits[:, 0]), np.nanmax(limits[:, 1])
+    else:
+        vmin, vmax = data_range
+    first = mappables[0]
+    first.set_clim(vmin, vmax)
+    for m in mappables[1:]:
+        if m.norm is not first.norm:
+            m.set_norm(first.norm)
+    return first.norm
+
+
+def mappables_axes(mappables):
+    """The axes of the mappables, a list if there are several"""
+    axes = []
+    for m in mappables:
+        ax = getattr(m, "axes", None)
+        if ax is not None and ax not in axes:
+            axes.append(ax)
+    if len(axes) == 0:
+        return None
+    return axes[0] if len(axes) == 1 else axes
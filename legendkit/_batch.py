@@ -0,0 +1,209 @@
+"""Draw the handles of a legend in batches
+
+Every entry of a legend has its own handle artist, a legend with hundreds
+of entries is drawn with hundreds of draw calls. The patches of the same type,
+and the markers of the lines without a line, are merged into one collection,
+it's drawn with a single call. The handles are kept as the source of the
+style, changing a handle is reflected in the next draw.
+"""
+
+from __future__ import annotations
+
+from numbers import Real
+
+import numpy as np
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.offsetbox import DrawingArea
+from matplotlib.patches import Patch
+from matplotlib.transforms import Affine2D, IdentityTransform
+
+
+def _iter_handleboxes(box):
+    """Yield the boxes that hold the handles of a legend in drawing order"""
+    for child in box.get_children():
+        if isinstance(child, DrawingArea):
+            yield child
+        else:
+            yield from _iter_handleboxes(child)
+
+
+def _is_marker_only(line):
+    """A line that only draws filled markers at some of its points"""
+    marker = line._marker
+    markevery = line.get_markevery()
+    return (
+        line.get_linestyle() in ("None", "", " ")
+        and marker.get_marker() not in ("None", ",")
+        and marker.is_filled()
+        and marker.get_fillstyle() == "full"
+        # Without a threshold, Agg decides to snap by the shape of the path
+        and marker.get_snap_threshold() is not None
+        and (markevery is None or np.asarray(markevery).dtype.kind in "iu")
+    )
+
+
+def _marker_snap(line, renderer):
+    """Whether the markers of a line are snapped to the pixel grid"""
+    snap = line._marker.get_snap_threshold()
+    if isinstance(snap, Real):
+        snap = renderer.points_to_pixels(line.get_markersize()) >= snap
+    return snap
+
+
+def _batch_key(artist):
+    """The group of a handle, None if it's drawn on its own"""
+    if artist.get_path_effects():
+        return None
+    # A hatch is shared by all the paths of a collection
+    if isinstance(artist, Patch) and artist.get_hatch() is None:
+        return type(artist)
+    if isinstance(artist, Line2D) and _is_marker_only(artist):
+        marker = artist._marker
+        return type(artist), marker.get_joinstyle(), marker.get_capstyle()
+    return None
+
+
+class HandleBatch(PathCollection):
+    """The patches of the same type in a legend
+
+    The batch is drawn by the last handle box, all the handle boxes are placed
+    by then. It's part of the legend box, e.g. when the box is stacked.
+
+    Parameters
+    ----------
+    handles : list of (artist, handlebox)
+        The handles and the boxes they are taken from.
+
+    """
+
+    def __init__(self, handles):
+        # The vector backends translate the transform of the paths to the offsets
+        super().__init__([], transform=Affine2D(), offset_transform=IdentityTransform())
+        self.handles = handles
+        self._host = None
+
+    def attach(self, handlebox):
+        self._host = handlebox
+        handlebox.add_artist(self)
+
+    def restore(self):
+        """Put the handles back in their boxes"""
+        if self._host is not None:
+            self._host._children.remove(self)
+            self._host = None
+        for artist, handlebox in self.handles:
+            handlebox._children.append(artist)
+
+    def draw(self, renderer):
+        patches = [p for p, _ in self.handles if p.get_visible()]
+        if not patches:
+            return
+        self.set_paths(
+            [p.get_transform().transform_path(p.get_path()) for p in patches]
+        )
+        self.set_facecolor([p.get_facecolor() for p in patches])
+        self.set_edgecolor([p.get_edgecolor() for p in patches])
+        self.set_linewidth([p.get_linewidth() for p in patches])
+        self.set_linestyle([p.get_linestyle() for p in patches])
+        self.set_antialiased([p.get_antialiased() for p in patches])
+        self.set_joinstyle(patches[0].get_joinstyle())
+        self.set_capstyle(patches[0].get_capstyle())
+        super().draw(renderer)
+
+
+class MarkerBatch(HandleBatch):
+    """The markers of the lines in a legend that have no line
+
+    The markers share the join and cap style, a path is drawn at every
+    marked point as :meth:`Line2D.draw <matplotlib.lines.Line2D.draw>` does.
+
+    """
+
+    def draw(self, renderer):
+        groups = {}
+        for line, _ in self.handles:
+            if line.get_visible() and line.get_markersize() > 0:
+                groups.setdefault(_marker_snap(line, renderer), []).append(line)
+        # The snapping is shared by all the paths of a collection
+        for snap, lines in groups.items():
+            self._set_markers(lines, snap, renderer)
+            super(HandleBatch, self).draw(renderer)
+
+    def _set_markers(self, lines, snap, renderer):
+        paths, offsets, facecolors, edgecolors, linewidths = [], [], [], [], []
+        antialiased = []
+        unique_paths = {}
+        for line in lines:
+            xy = line.get_xydata()
+            markevery = line.get_markevery()
+            if markevery is not None:
+                xy = xy[markevery]
+            marker = line._marker
+            size = renderer.points_to_pixels(line.get_markersize())
+            path = marker.get_path().transformed(marker.get_transform().scale(size))
+            codes = None if path.codes is None else path.codes.tobytes()
+            path = unique_paths.setdefault((path.vertices.tobytes(), codes), path)
+            alpha = line.get_alpha()
+            fc = to_rgba(line.get_markerfacecolor(), alpha)
+            ec = to_rgba(line.get_markeredgecolor(), alpha)
+            # An auto edge color takes the alpha of the face
+            if line._markeredgecolor == "auto":
+                ec = ec[:3] + fc[3:]
+            n = len(xy)
+            paths += [path] * n
+            offsets.append(line.get_transform().transform(xy))
+            facecolors += [fc] * n
+            edgecolors += [ec] * n
+            linewidths += [line.get_markeredgewidth()] * n
+            antialiased += [line.get_antialiased()] * n
+        offsets = np.concatenate(offsets)
+        # A single marker is drawn as a marker by the collection, otherwise
+        # place them like Agg places markers, on whole pixels,
+        # at the center of the pixel if the marker is not snapped
+        if len(offsets) > 1:
+            offsets = np.column_stack(
+                [np.floor(offsets[:, 0] + 0.5), np.ceil(offsets[:, 1] - 0.5)]
+            )
+            if not snap:
+                offsets += [0.5, -0.5]
+        # The paths are cycled, the vector backends define each path once
+        if len(unique_paths) == 1:
+            paths = paths[:1]
+        self.set_paths(paths)
+        self.set_offsets(offsets)
+        self.set_facecolor(facecolors)
+        self.set_edgecolor(edgecolors)
+        self.set_linewidth(linewidths)
+        self.set_antialiased(antialiased)
+        self.set_joinstyle(lines[0]._marker.get_joinstyle())
+        self.set_capstyle(lines[0]._marker.get_capstyle())
+        self.set_snap(snap)
+
+
+def make_batches(legend):
+    """Take the patch and marker handles out of their boxes and group them
+
+    Other handles, e.g. lines and collections, are left in place.
+
+    Returns
+    -------
+    list of :class:`HandleBatch`
+
+    """
+    groups = {}
+    handlebox = None
+    for handlebox in _iter_handleboxes(legend._legend_handle_box):
+        for artist in list(handlebox._children):
+            key = _batch_key(artist)
+            if key is not None:
+                handlebox._children.remove(artist)
+                groups.setdefault(key, []).append((artist, handlebox))
+    batches = [
+        MarkerBatch(handles) if isinstance(key, tuple) else HandleBatch(handles)
+        for key, handles in groups.items()
+    ]
+    for batch in batches:
+        batch.attach(handlebox)
+    return batches
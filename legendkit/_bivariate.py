@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib import colors
+from matplotlib import pyplot as plt
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.offsetbox import AnchoredOffsetbox, TextArea, VPacker
+from matplotlib.text import Text
+
+from ._colorart import (
+    DrawingArea,
+    get_locator_formatter,
+    get_tick_values,
+    parse_ticks_format,
+)
+from ._gradient import GradientImage
+from ._locs import Locs
+from ._text import measure_text
+
+
+def _as_rgba_bytes(lut, alpha=None):
+    """Convert a 2-D lookup table to an uint8 RGBA array"""
+    lut = np.asarray(lut)
+    if lut.ndim != 3 or lut.shape[-1] not in (3, 4):
+        raise ValueError("`lut` must be an array of shape (M, N, 3) or (M, N, 4)")
+    if lut.dtype != np.uint8:
+        lut = np.round(np.clip(lut, 0, 1) * 255).astype(np.uint8)
+    if lut.shape[-1] == 3:
+        opaque = np.full(lut.shape[:2] + (1,), 255, dtype=np.uint8)
+        lut = np.concatenate([lut, opaque], axis=-1)
+    if alpha is not None:
+        lut = lut.copy()
+        lut[..., -1] = np.round(alpha * 255)
+    return lut
+
+
+def _check_norm(norm, name):
+    if norm is None:
+        return colors.Normalize(vmin=0, vmax=1)
+    if isinstance(norm, colors.NoNorm):
+        raise ValueError(f"`{name}` cannot be NoNorm")
+    if not isinstance(norm, colors.BoundaryNorm) and not norm.scaled():
+        raise ValueError(f"`{name}` must have both vmin and vmax set")
+    return norm
+
+
+def _normalize(norm, v):
+    """The relative position of values along an axis of the key"""
+    v = np.asarray(v, dtype=float)
+    if isinstance(norm, colors.BoundaryNorm):
+        b = norm.boundaries
+        return (v - b[0]) / (b[-1] - b[0])
+    # Invalid values (e.g. negative in LogNorm) are masked
+    return np.ma.filled(np.ma.asarray(norm(v), dtype=float), np.nan)
+
+
+class BivariateColorArt(Artist):
+    """Color legend for a bivariate colormap
+
+    The colors are drawn as a single image, the x-axis and y-axis
+    are labeled with ticks from their own norm.
+
+    Parameters
+    ----------
+    lut : array-like of shape (M, N, 3) or (M, N, 4)
+        The 2-D lookup table, the row is mapped by `ynorm` and
+        the column is mapped by `xnorm`. The first row is at the bottom.
+    xnorm, ynorm : :class:`Normalize <matplotlib.colors.Normalize>`
+        The normalization of each variable, vmin and vmax must be set.
+        Default to the range from 0 to 1.
+    ax : :class:`Axes <matplotlib.axes.Axes>`
+        The axes to draw the legend.
+    xlabel, ylabel : str
+        The label of each variable.
+    xticks, yticks : list of ticks or Locator
+    xformat, yformat : str or Formatter
+    alpha : float
+        Control the transparency
+    size : float
+        The width and height of the color key, relative to fontsize.
+    tick_width : float
+        The width of tick.
+    tick_size : float
+        The length of tick, relative to the size of the color key.
+    tick_color : color
+        The color of tick.
+    textpad : float, default: `rcParams["legend.handletextpad"]`
+        The space between labels and the color key, in font-size units.
+    borderpad : float, default: `rcParams["legend.borderpad"]`
+        The fractional whitespace inside the legend border,
+        in font-size units.
+    borderaxespad : float, default: `rcParams["legend.borderaxespad"]`
+        The pad between the axes and legend border, in font-size units.
+    prop : :class:`FontProperties <matplotlib.font_manager.FontProperties>`
+        The font properties of the labels.
+    fontsize : float
+        The fontsize
+    title : str
+        The title of legend
+    title_fontsize : float
+        The fontsize of title
+    title_fontproperties : :class:`FontProperties <matplotlib.font_manager.FontProperties>`
+        The fontproperties of title
+    alignment : {'center', 'left', 'right'}, default: 'left'
+        The alignment of the color key and title.
+    loc : str
+        Apart from the default location code, you can add 'out' as prefix
+        to place the legend ouside the axes.
+    deviation : float
+        The space between legend and axes if place outside
+    bbox_to_anchor
+    bbox_transform
+    rasterized : bool
+        Whether to rasterize the color key,
+        reduce file size in vectorized backend.
+    draw : bool, default: True
+        Whether to add the legend to the axes. If False and no axes is given,
+        the legend is built without a figure and can be added to a stack.
+
+    Examples
+    --------
+
+    .. plot::
+
+        >>> from legendkit import bivariate_colorart
+        >>> x, y = np.meshgrid(np.linspace(0, 1, 64), np.linspace(0, 1, 64))
+        >>> lut = np.dstack([x, 0.5 * (x + y), y])
+        >>> bivariate_colorart(lut, xlabel="Var 1", ylabel="Var 2", loc="center")
+
+    """
+
+    def __repr__(self):
+        return "<BivariateColorArt>"
+
+    def __init__(
+        self,
+        lut,
+        xnorm=None,
+        ynorm=None,
+        *,
+        ax: Axes = None,
+        xlabel=None,
+        ylabel=None,
+        xticks=None,
+        yticks=None,
+        xformat=None,
+        yformat=None,
+        alpha=None,
+        size: float = None,  # relative to fontsize
+        tick_width=1,
+        tick_size=0.05,
+        tick_color="white",
+        textpad: float = None,
+        borderpad: float = None,
+        borderaxespad: float = None,
+        prop=None,
+        fontsize=None,
+        title=None,
+        title_fontsize=None,
+        title_fontproperties=None,
+        alignment="left",
+        loc=None,
+        deviation=0.05,
+        bbox_to_anchor=None,
+        bbox_transform=None,
+        rasterized=True,
+        draw=True,
+    ):
+        super().__init__()
+        self._draw = draw
+        headless = ax is None and not draw
+        if ax is None and draw:
+            ax = plt.gca()
+        self.is_axes = isinstance(ax, Axes)
+        if headless:
+            # The figure is set when it's added to a stack
+            pass
+        elif self.is_axes:
+            self.figure = ax.figure
+            self.axes = ax
+        else:
+            self.figure = ax
+        if rasterized:
+            self._rasterized = True
+
+        self.lut = _as_rgba_bytes(lut, alpha=alpha)
+        self.xnorm = _check_norm(xnorm, "xnorm")
+        self.ynorm = _check_norm(ynorm, "ynorm")
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self._xlocator, self._xformatter = parse_ticks_format(xticks, xformat)
+        self._ylocator, self._yformatter = parse_ticks_format(yticks, yformat)
+        self.tick_width = tick_width
+        self.tick_size = tick_size
+        self.tick_color = tick_color
+
+        if fontsize is None:
+            fontsize = mpl.rcParams["legend.fontsize"]
+        if prop is None:
+            self.prop = FontProperties(size=fontsize)
+        else:
+            self.prop = FontProperties._from_any(prop)
+            if isinstance(prop, dict) and "size" not in prop:
+                self.prop.set_size(mpl.rcParams["legend.fontsize"])
+        self._fontsize = self.prop.get_size_in_points()
+        self.size = (8 if size is None else size) * self._fontsize
+
+        self.title = title
+        if title_fontsize is None:
+            title_fontsize = mpl.rcParams["legend.title_fontsize"]
+        self.title_fontsize = title_fontsize
+        self.title_fontproperties = title_fontproperties
+        self.alignment = alignment
+
+        self.textpad = (
+            mpl.rcParams["legend.handletextpad"] if textpad is None else textpad
+        )
+        self.borderpad = (
+            mpl.rcParams["legend.borderpad"] if borderpad is None else borderpad
+        )
+        self.borderaxespad = (
+            mpl.rcParams["legend.borderaxespad"]
+            if borderaxespad is None
+            else borderaxespad
+        )
+
+        if loc is None:
+            loc = "out right center"
+        if ax is not None:
+            self._loc, self._bbox_to_anchor, self._bbox_transform = Locs().transform(
+                ax,
+                loc,
+                bbox_to_anchor=bbox_to_anchor,
+                bbox_transform=bbox_transform,
+                deviation=deviation,
+            )
+        else:
+            # Headless, the stack will position the legend
+            self._loc = Locs.combs.get(loc, (loc,))[0]
+            self._bbox_to_anchor = bbox_to_anchor
+            self._bbox_transform = bbox_transform
+
+        self._make_box()
+
+    def _get_ticks(self, norm, locator, formatter):
+        """Return the tick positions in points and the tick labels"""
+        locator, formatter, _ = get_locator_formatter(
+            norm, locator=locator, formatter=formatter
+        )
+        if isinstance(norm, colors.BoundaryNorm):
+            intv = norm.boundaries[0], norm.boundaries[-1]
+        else:
+            intv = norm.vmin, norm.vmax
+        b, labels, _ = get_tick_values(locator, formatter, intv, norm)
+        locs = _normalize(norm, b) * self.size
+        valid = (locs >= 0) & (locs <= self.size)
+        labels = [label for label, v in zip(labels, valid) if v]
+        return locs[valid], labels
+
+    def _measure(self, labels):
+        if len(labels) == 0:
+            return 0, 0
+        dpi = 72 if self.figure is None else self.figure.dpi
+        sizes = np.array([measure_text(t, self.prop, dpi) for t in labels])
+        return sizes[:, 0].max(), sizes[:, 1].max()
+
+    def _make_box(self):
+        size = self.size
+        pad = self.textpad * self._fontsize
+        xlocs, xlabels = self._get_ticks(self.xnorm, self._xlocator, self._xformatter)
+        ylocs, ylabels = self._get_ticks(self.ynorm, self._ylocator, self._yformatter)
+
+        xw, xh = self._measure(xlabels)
+        yw, yh = self._measure(ylabels)
+        # The axis labels, the y label is rotated
+        xlabel_h = self._measure([self.xlabel])[1] + pad if self.xlabel else 0
+        ylabel_w = self._measure([self.ylabel])[1] + pad if self.ylabel else 0
+
+        # The lower left corner of the color key
+        x0 = ylabel_w + (yw + pad if ylabels else 0)
+        y0 = xlabel_h + (xh + pad if xlabels else 0)
+        # The tick labels at the edges are centered on the tick
+        canvas = DrawingArea(x0 + size + xw / 2, y0 + size + yh / 2, clip=False)
+        if self.figure is not None:
+            canvas.set_figure(self.figure)
+
+        image = GradientImage(self.lut, size, size, x=x0, y=y0)
+        if self._rasterized:
+            image.set_rasterized(True)
+        canvas.add_artist(image)
+
+        tick = self.tick_size * size
+        nx, ny = len(xlocs), len(ylocs)
+        xticks = np.empty((nx, 2, 2))
+        xticks[:, :, 0] = x0 + xlocs[:, np.newaxis]
+        xticks[:, :, 1] = [y0, y0 + tick]
+        yticks = np.empty((ny, 2, 2))
+        yticks[:, :, 0] = [x0, x0 + tick]
+        yticks[:, :, 1] = y0 + ylocs[:, np.newaxis]
+        ticks = LineCollection(
+            np.concatenate([xticks, yticks]),
+            color=self.tick_color,
+            linewidth=self.tick_width,
+            zorder=100,
+        )
+        canvas.add_artist(ticks)
+
+        options = dict(fontsize=self._fontsize, fontproperties=self.prop)
+        for loc, label in zip(xlocs, xlabels):
+            canvas.add_artist(
+                Text(x0 + loc, y0 - pad, label, ha="center", va="top", **options)
+            )
+        for loc, label in zip(ylocs, ylabels):
+            canvas.add_artist(
+                Text(x0 - pad, y0 + loc, label, ha="right", va="center", **options)
+            )
+        if self.xlabel:
+            canvas.add_artist(
+                Text(x0 + size / 2, 0, self.xlabel, ha="center", va="bottom", **options)
+            )
+        if self.ylabel:
+            canvas.add_artist(
+                Text(
+                    0,
+                    y0 + size / 2,
+                    self.ylabel,
+                    ha="left",
+                    va="center",
+                    rotation=90,
+                    **options,
+                )
+            )
+
+        if self.title is not None:
+            if self.title_fontproperties is None:
+                textprops = dict(fontweight="bold", fontsize=self.title_fontsize)
+            elif isinstance(self.title_fontproperties, dict):
+                textprops = dict(self.title_fontproperties)
+            else:
+                textprops = dict(fontproperties=self.title_fontproperties)
+            title_canvas = TextArea(self.title, textprops=textprops)
+            final_pack = VPacker(
+                pad=0,
+                sep=0.4 * self._fontsize,
+                children=[title_canvas, canvas],
+                align=self.alignment,
+            )
+            if self.figure is not None:
+                final_pack.set_figure(self.figure)
+        else:
+            final_pack = canvas
+        self._final_pack = final_pack
+
+        self._box = AnchoredOffsetbox(
+            self._loc,
+            child=final_pack,
+            pad=self.borderpad,
+            borderpad=self.borderaxespad,
+            bbox_transform=self._bbox_transform,
+            bbox_to_anchor=self._bbox_to_anchor,
+            frameon=False,
+        )
+        if self.figure is not None:
+            self._box.set_figure(self.figure)
+
+        if self._draw:
+            if self.is_axes:
+                self.axes.add_artist(self._box)
+            else:
+                self.figure.add_artist(self._box)
+
+    def get_bbox(self, renderer=None):
+        return self._final_pack.get_bbox(renderer=renderer)
+
+    def get_window_extent(self, renderer=None):
+        return self._box.get_window_extent(renderer=renderer)
+
+    def set_offset(self, offset):
+        self._final_pack.set_offset(offset)
+
+    def get_children(self):
+        return [self._box]
+
+    def remove(self):
+        self._box.remove()
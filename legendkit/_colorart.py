@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import partial
+
 import matplotlib as mpl
 import matplotlib.transforms as mtransforms
 import matplotlib.path as mpath
@@ -8,67 +10,242 @@ from matplotlib import cm, contour, ticker, colors
 from matplotlib import pyplot as plt
 from matplotlib.artist import Artist
 from matplotlib.axes import Axes
-from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.font_manager import FontProperties
 from matplotlib.offsetbox import (
     DrawingArea as MatplotlibDrawingArea,
+    HPacker,
     VPacker,
     TextArea,
     AnchoredOffsetbox,
 )
-from matplotlib.patches import Rectangle
 from matplotlib.text import Text
 from matplotlib.backends.backend_mixed import MixedModeRenderer
 
-from ._locs import Locs
+from ._autoscale import (
+    autoscale_norm,
+    collect_mappables,
+    mappables_axes,
+    share_norm,
+)
+from ._gradient import GradientImage, color_blocks, merge_runs
+from ._histogram import check_hist_data, hist_verts, histogram
+from ._locs import Locs, axes_list
+from ._lut import get_lut, get_colormap  # noqa: F401
+from ._text import measure_text
+
+# A listed colormap with at most this number of distinct consecutive colors
+# is drawn as blocks instead of an image
+_MAX_BLOCKS = 64
+
+
+def parse_ticks_format(ticks=None, format=None):
+    """Convert the user input of ticks and format to locator and formatter"""
+    if np.iterable(ticks):
+        locator = ticker.FixedLocator(ticks, nbins=len(ticks))
+    else:
+        locator = ticks  # Handle default in get_locator_formatter()
+
+    if isinstance(format, str):
+        # Check format between FormatStrFormatter and StrMethodFormatter
+        try:
+            formatter = ticker.FormatStrFormatter(format)
+            _ = formatter(0)
+        except TypeError:
+            formatter = ticker.StrMethodFormatter(format)
+    else:
+        formatter = format
+    return locator, formatter
+
+
+def get_locator_formatter(
+    norm, locator=None, formatter=None, boundaries=None, n_values=None
+):
+    """Resolve the default tick locator and formatter of a norm
+
+    Parameters
+    ----------
+    norm : :class:`Normalize <matplotlib.colors.Normalize>`
+    locator, formatter :
+        The user input, only the missing ones are filled with the defaults.
+    boundaries : array-like
+        The boundaries of the colors if they are set by the user.
+    n_values : int
+        The number of colors, used to place ticks for NoNorm.
+
+    Returns
+    -------
+    locator, formatter, minorlocator
+
+    """
+    minorlocator = None
+    if isinstance(norm, colors.BoundaryNorm):
+        b = norm.boundaries
+        if locator is None:
+            locator = ticker.FixedLocator(b, nbins=5)
+        if minorlocator is None:
+            minorlocator = ticker.FixedLocator(b)
+    elif isinstance(norm, colors.NoNorm):
+        if locator is None:
+            # put ticks on integers between the boundaries of NoNorm
+            base = 1 + int(n_values / 10)
+            locator = ticker.IndexLocator(base=base, offset=0)
+    elif isinstance(norm, colors.LogNorm):
+        base = norm._scale.base
+        if locator is None:
+            locator = ticker.LogLocator(base=base)
+        if formatter is None:
+            formatter = ticker.LogFormatterSciNotation(base=base)
+    elif isinstance(norm, colors.SymLogNorm):
+        base = norm._scale.base
+        if locator is None:
+            locator = ticker.SymmetricalLogLocator(linthresh=norm.linthresh, base=base)
+        if formatter is None:
+            formatter = ticker.LogFormatterSciNotation(base=base)
+    elif boundaries is not None:
+        if locator is None:
+            locator = ticker.FixedLocator(boundaries, nbins=5)
+    else:
+        # AsinhNorm is introduced at 3.6
+        if hasattr(colors, "AsinhNorm"):
+            if isinstance(norm, colors.AsinhNorm):
+                base = 10  # norm._scale.base
+                if locator is None:
+                    locator = ticker.AsinhLocator(
+                        linear_width=norm.linear_width, base=base
+                    )
+                if formatter is None:
+                    if base > 1:
+                        formatter = ticker.LogFormatterSciNotation(base=base)
+                    else:
+                        formatter = ticker.StrMethodFormatter("{x:.3g}")
+        # most cases:
+        if locator is None:
+            # we haven't set the locator explicitly, so use the default
+            # for this axis:
+            locator = ticker.MaxNLocator(nbins=5, steps=[1, 2, 2.5, 5, 10])
+        if minorlocator is None:
+            minorlocator = ticker.NullLocator()
+
+    if minorlocator is None:
+        minorlocator = ticker.NullLocator()
+
+    if formatter is None:
+        formatter = ticker.ScalarFormatter()
+
+    return locator, formatter, minorlocator
 
 
-def get_colormap(cmap):
-    if isinstance(cmap, colors.Colormap):
-        return cmap
-    return mpl.colormaps.get(cmap)
+def get_tick_values(locator, formatter, intv, norm=None):
+    """Return the ticks, tick labels and offset text within an interval"""
+    locator.create_dummy_axis(minpos=intv[0])
+    locator.axis.set_view_interval(*intv)
+    locator.axis.set_data_interval(*intv)
+    formatter.set_axis(locator.axis)
+
+    b = np.array(locator())
+    if isinstance(norm, colors.BoundaryNorm):
+        pass
+    elif isinstance(locator, ticker.LogLocator):
+        eps = 1e-10
+        b = b[(b <= intv[1] * (1 + eps)) & (b >= intv[0] * (1 - eps))]
+        # b = b[(b >= intv[0] * (1 - eps))]
+    # else:
+    # eps = (intv[1] - intv[0]) * 1e-10
+    # b = b[(b <= intv[1] + eps) & (b >= intv[0] - eps)]
+    return b, formatter.format_ticks(b), formatter.get_offset()
 
 
 class DrawingArea(MatplotlibDrawingArea):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._clip_key = None
+        self._clip_tpath = None
+
+    def _get_clip_path(self):
+        """The clip path of the children, rebuilt only if the size is changed"""
+        key = (self.width, self.height)
+        if key != self._clip_key:
+            self._clip_key = key
+            self._clip_tpath = mtransforms.TransformedPath(
+                mpath.Path(
+                    [
+                        [0, 0],
+                        [0, self.height],
+                        [self.width, self.height],
+                        [self.width, 0],
+                    ]
+                ),
+                # The transform is updated in place when drawing
+                self.get_transform(),
+            )
+        return self._clip_tpath
+
     def draw(self, renderer):
         dpi_cor = renderer.points_to_pixels(1.0)
         self.dpi_transform.clear()
         self.dpi_transform.scale(dpi_cor)
 
-        tpath = mtransforms.TransformedPath(
-            mpath.Path(
-                [[0, 0], [0, self.height], [self.width, self.height], [self.width, 0]]
-            ),
-            self.get_transform(),
-        )
+        if self._clip_children:
+            last_tpath = self._clip_tpath
+            tpath = self._get_clip_path()
+            for c in self._children:
+                clippath = c._clippath
+                if clippath is not None and clippath is last_tpath:
+                    clippath = None
+                if not (c.clipbox or clippath):
+                    c.set_clip_path(tpath)
+
+        mixed = isinstance(renderer, MixedModeRenderer)
+        group = []
         for c in self._children:
-            if self._clip_children and not (c.clipbox or c._clippath):
-                c.set_clip_path(tpath)
-            if c.get_rasterized() and isinstance(renderer, MixedModeRenderer):
-                # Vector backends (SVG/PDF/PS) use 72 pts/inch internally.
-                # Rasterized children draw into a buffer at renderer.dpi,
-                # so we scale transforms by mag = dpi/72. stop_rasterizing()
-                # divides back by mag when placing the image.
-                figdpi = 72 * dpi_cor
-                mag = renderer.dpi / figdpi
-                raster_dpi_cor = dpi_cor * mag
-                self.dpi_transform.clear()
-                self.dpi_transform.scale(raster_dpi_cor)
-
-                save_mat = self.offset_transform.get_matrix().copy()
-                scaled_mat = save_mat.copy()
-                scaled_mat[:2, 2] *= mag
-                self.offset_transform.set_matrix(scaled_mat)
-                c.draw(renderer)
-                self.dpi_transform.clear()
-                self.dpi_transform.scale(dpi_cor)
-                self.offset_transform.set_matrix(save_mat)
-            else:
-                c.draw(renderer)
+            if mixed and c.get_rasterized():
+                group.append(c)
+                continue
+            if group:
+                self._draw_rasterized(renderer, group, dpi_cor)
+                group = []
+            c.draw(renderer)
+        if group:
+            self._draw_rasterized(renderer, group, dpi_cor)
 
         # _bbox_artist(self, renderer, fill=False, props=dict(pad=0.))
         self.stale = False
 
+    def _draw_rasterized(self, renderer, children, dpi_cor):
+        """Draw adjacent rasterized children in a single raster session"""
+        # Vector backends (SVG/PDF/PS) use 72 pts/inch internally.
+        # Rasterized children draw into a buffer at renderer.dpi,
+        # so we scale transforms by mag = dpi/72. stop_rasterizing()
+        # divides back by mag when placing the image.
+        figdpi = 72 * dpi_cor
+        mag = renderer.dpi / figdpi
+        self.dpi_transform.clear()
+        self.dpi_transform.scale(dpi_cor * mag)
+        save_mat = self.offset_transform.get_matrix().copy()
+        scaled_mat = save_mat.copy()
+        scaled_mat[:2, 2] *= mag
+        self.offset_transform.set_matrix(scaled_mat)
+
+        # Same bookkeeping as matplotlib.artist.allow_rasterization,
+        # the children see an opened session and won't start their own
+        start = renderer._raster_depth == 0 and not renderer._rasterizing
+        if start:
+            renderer.start_rasterizing()
+            renderer._rasterizing = True
+        renderer._raster_depth += 1
+        try:
+            for c in children:
+                c.draw(renderer)
+        finally:
+            renderer._raster_depth -= 1
+            if start:
+                renderer.stop_rasterizing()
+                renderer._rasterizing = False
+            self.dpi_transform.clear()
+            self.dpi_transform.scale(dpi_cor)
+            self.offset_transform.set_matrix(save_mat)
+
 
 class ColorArt(Artist):
     """Axes-independent colorbar
@@ -80,16 +257,25 @@ class ColorArt(Artist):
     ----------
     mappable : :class:`ScalarMapping <matplotlib.cm.ScalarMappable>`
         The mappable whose colormap and norm will be used.
+        If a list of mappables or axes is given, the mappables share
+        the norm of the first one, scaled to the range of all of them.
     norm : :class:`Normalize <matplotlib.colors.Normalize>`
         The normalization to use.
     cmap : :class:`Colormap <matplotlib.colors.Colormap>`
         The colormap to use.
-    ax : :class:`Axes <matplotlib.axes.Axes>`
-        The axes to draw colorbar.
+    ax : :class:`Axes <matplotlib.axes.Axes>` or list of axes
+        The axes to draw colorbar. If a list of axes is given, the colorart
+        is placed relative to the area of all the axes.
     alpha : float
         Control the transparency
     values :
     boundaries :
+    autoscale : {'full', 'sample', 'none'}, default: 'full'
+        How to find the missing limits of the norm from the data,
+        the limits that are already set on the norm are reused.
+        Use 'sample' to estimate them from a strided subsample of a large array.
+    data_range : (vmin, vmax)
+        The precomputed limits of the data, used before scanning the data.
     flip : bool
         Flip the colorart so the colormap is reversed visually
         (low values at top for vertical, right for horizontal).
@@ -100,7 +286,8 @@ class ColorArt(Artist):
     tick_width : float
         The width of tick.
     tick_size : float
-        The length of tick.
+        The length of tick, relative to the width of the colorart.
+        A negative size draws the ticks outward.
     tick_color : color
         The color of tick.
     ticklocation : {'both', 'left', 'right', 'top', 'bottom'}
@@ -139,6 +326,30 @@ class ColorArt(Artist):
     rasterized : bool
         Whether to rasterize the colorart,
         reduce file size in vectorized backend.
+    samples : int or 'auto'
+        The number of colors drawn in the gradient,
+        default to the size of the colormap. If 'auto', the number is
+        chosen from the length of the gradient in pixels when it's drawn.
+    max_samples : int, default: 4096
+        The upper limit of the number of colors when :code:`samples='auto'`.
+    hist : True, array-like, sequence of array-like or callable
+        Show the distribution of the data as a histogram next to the colorart.
+        If True, use the array of the mappable. The data is binned in chunks,
+        a memory-mapped array is not loaded at once. An iterator can only be
+        read once, use a sequence of chunks or a function returning the chunks.
+    hist_bins : int, default: 50
+        The number of bins of the histogram.
+    hist_size : float, default: 1.5
+        The height of the histogram bars, relative to fontsize.
+    hist_color : color, default: '.6'
+        The color of the histogram bars.
+    lazy : bool, default: False
+        Only record the configuration, the colorart is built when it's
+        first drawn or measured and rebuilt after a property is changed.
+    draw : bool, default: True
+        Whether to add the colorart to the axes. If False and no axes is given,
+        the colorart is built without a figure, the text is measured at 72 dpi.
+        Add it later with :meth:`attach` or :func:`legendkit.layout.stack`.
 
     Examples
     --------
@@ -152,6 +363,8 @@ class ColorArt(Artist):
 
     """
 
+    zorder = 5
+
     def __repr__(self):
         return "<ColorArt>"
 
@@ -165,6 +378,8 @@ class ColorArt(Artist):
         alpha=None,
         values=None,
         boundaries=None,
+        autoscale="full",
+        data_range=None,
         # extend=None,
         # extendfrac=None,
         # extendrect=False,
@@ -195,18 +410,50 @@ class ColorArt(Artist):
         bbox_to_anchor=None,
         bbox_transform=None,
         rasterized=True,
+        samples=None,
+        max_samples=4096,
+        hist=None,
+        hist_bins=50,
+        hist_size=1.5,
+        hist_color=".6",
+        lazy=False,
+        draw=True,
     ):
         super().__init__()
-        if ax is None:
+        # Placed outside the axes by default, it's not clipped to the axes
+        self.set_clip_on(False)
+        # the container for title, colorbar, ticks and tick labels
+        self._final_pack = None
+        self._cbar_box = None
+        self._box_stale = True
+        self._lazy = lazy
+        self._updating = False
+        self._mappable_cid = None
+        self._draw = draw
+        # the box that is added to the axes or figure
+        self._attached_box = None
+        if isinstance(mappable, (list, tuple, np.ndarray)):
+            # One colorart for several mappables
+            mappables = collect_mappables(mappable)
+            share_norm(mappables, autoscale=autoscale, data_range=data_range)
+            mappable = mappables[0]
+            if ax is None:
+                ax = mappables_axes(mappables)
+        if ax is None and draw:
             ax = plt.gca()
-        self.is_axes = True
-        if not isinstance(ax, Axes):
-            self.is_axes = False
-            self.figure = ax
-
-        else:
+        self.is_axes = isinstance(ax, Axes)
+        axes = axes_list(ax)
+        if ax is None:
+            # Headless, the figure is set when it's attached or stacked
+            pass
+        elif self.is_axes:
             self.figure = ax.figure
             self.axes = ax
+        elif axes is not None:
+            # Placed around several axes, added to their figure
+            self.figure = axes[0].figure
+        else:
+            self.figure = ax
         if rasterized:
             # Force rasterization
             self._rasterized = True
@@ -214,10 +461,10 @@ class ColorArt(Artist):
         if mappable is None:
             mappable = cm.ScalarMappable(norm=norm, cmap=cmap)
 
-        if mappable.get_array() is not None:
-            mappable.autoscale_None()
+        autoscale_norm(mappable, autoscale=autoscale, data_range=data_range)
 
         self.mappable = mappable
+        self._connect()
         cmap = mappable.cmap
         norm = mappable.norm
 
@@ -243,6 +490,8 @@ class ColorArt(Artist):
         spacing_options = {"uniform", "proportional"}
         if spacing not in spacing_options:
             raise ValueError("`spacing` must be 'uniform' or 'proportional'")
+        if not (samples is None or samples == "auto" or int(samples) > 0):
+            raise ValueError("`samples` must be a positive integer or 'auto'")
 
         extend = None
         if extend is None:
@@ -275,27 +524,25 @@ class ColorArt(Artist):
                 "`extend` must be one of 'min', 'max', 'neither', or 'both'"
             )
         self.orientation = orientation
-
-        # handle locator
+        self.samples = samples
+        self.max_samples = max_samples
+        if hist is not None and hist is not True:
+            check_hist_data(hist)
+        self.hist = hist
+        self.hist_bins = hist_bins
+        self.hist_size = hist_size
+        self.hist_color = hist_color
+        self._hist_bars = None
+        self._hist_cache = None
+
+        # handle locator, the user input is kept so the defaults
+        # can be resolved again when the colorart is rebuilt
         self._locator = None
         self._formatter = None
         self._minorlocator = None
         self.__scale = None
 
-        if np.iterable(ticks):
-            self._locator = ticker.FixedLocator(ticks, nbins=len(ticks))
-        else:
-            self._locator = ticks  # Handle default in _ticker()
-
-        if isinstance(format, str):
-            # Check format between FormatStrFormatter and StrMethodFormatter
-            try:
-                self._formatter = ticker.FormatStrFormatter(format)
-                _ = self._formatter(0)
-            except TypeError:
-                self._formatter = ticker.StrMethodFormatter(format)
-        else:
-            self._formatter = format
+        self._locator_spec, self._formatter_spec = parse_ticks_format(ticks, format)
 
         self.tick_width = tick_width
         self.tick_size = tick_size
@@ -324,14 +571,13 @@ class ColorArt(Artist):
 
         if loc is None:
             loc = "out right center"
-
-        self._loc, self._bbox_to_anchor, self._bbox_transform = Locs().transform(
-            ax,
-            loc,
+        self._loc_options = dict(
+            loc=loc,
             bbox_to_anchor=bbox_to_anchor,
             bbox_transform=bbox_transform,
             deviation=deviation,
         )
+        self._set_loc(ax)
 
         self.textpad = (
             mpl.rcParams["legend.handletextpad"] if textpad is None else textpad
@@ -345,13 +591,108 @@ class ColorArt(Artist):
             else borderaxespad
         )
 
-        # the container for title, colorbar, ticks and tick labels
-        self._final_pack = None
-        self._cbar_box = None
+        if lazy:
+            # Only the configuration is recorded,
+            # the colorart is built when it's first needed
+            if self._draw:
+                self._add_to_parent(self)
+        else:
+            self._ensure_box()
+
+    def _set_loc(self, ax):
+        options = self._loc_options
+        if ax is None:
+            # Headless, the location is resolved when it's attached
+            self._loc = Locs.combs.get(options["loc"], (options["loc"],))[0]
+            self._bbox_to_anchor = options["bbox_to_anchor"]
+            self._bbox_transform = options["bbox_transform"]
+        else:
+            self._loc, self._bbox_to_anchor, self._bbox_transform = Locs().transform(
+                ax,
+                options["loc"],
+                bbox_to_anchor=options["bbox_to_anchor"],
+                bbox_transform=options["bbox_transform"],
+                deviation=options["deviation"],
+            )
+
+    def _add_to_parent(self, artist):
+        if self.is_axes:
+            self.axes.add_artist(artist)
+        else:
+            self.figure.add_artist(artist)
+
+    def attach(self, ax):
+        """Add the colorart to an axes or a figure
+
+        This is used to place a colorart created with :code:`draw=False`,
+        it's rebuilt to fit the resolution and location of the new parent.
+
+        Parameters
+        ----------
+        ax : :class:`Axes <matplotlib.axes.Axes>`, list of axes or :class:`Figure <matplotlib.figure.Figure>`
+
+        """
+        if self._draw:
+            raise RuntimeError("The colorart is already added to the figure")
+        is_axes = isinstance(ax, Axes)
+        axes = axes_list(ax)
+        if is_axes:
+            figure = ax.figure
+        elif axes is not None:
+            figure = axes[0].figure
+        else:
+            figure = ax
+        if self.figure is not None and self.figure is not figure:
+            raise RuntimeError("Cannot attach the colorart to another figure")
+        self.is_axes = is_axes
+        self.figure = figure
+        if is_axes:
+            self.axes = ax
+        self._set_loc(ax)
+        self._draw = True
+        if self._mappable_cid is None:
+            self._connect()
+        # The boxes may be measured without a figure and set to another location
+        self._box_stale = True
+        self.stale = True
+        if self._lazy:
+            self._add_to_parent(self)
+        else:
+            self._ensure_box()
+        return self
+
+    def _ensure_box(self):
+        """Build the colorart if it's not built or outdated"""
+        if not self._box_stale:
+            return
         self._process_values()
         self._get_locator_formatter()
-        self._get_ticks()
         self._make_cbar_box()
+        self._box_stale = False
+        if self._lazy:
+            if self.is_axes:
+                self._cbar_box.axes = self.axes
+        elif self._draw:
+            if self._attached_box is not None:
+                self._attached_box.remove()
+            self._add_to_parent(self._cbar_box)
+            self._attached_box = self._cbar_box
+
+    def _invalidate(self):
+        """Mark the colorart as outdated after a property is changed"""
+        self._box_stale = True
+        self.stale = True
+        # In eager mode, the box is drawn by the parent directly
+        if not self._lazy and self._cbar_box is not None:
+            self._ensure_box()
+
+    def draw(self, renderer):
+        # Only called in lazy mode, otherwise the box is drawn by the parent
+        if not self.get_visible():
+            return
+        self._ensure_box()
+        self._cbar_box.draw(renderer)
+        self.stale = False
 
     def _set_height_width(self, height, width):
         if self.orientation == "vertical":
@@ -376,80 +717,16 @@ class ColorArt(Artist):
 
     def _make_cbar_box(self):
         locs, ticks1, ticks2, ticklabels, offset_string = self._get_ticks()
-        x_offset, y_offset = self._get_text_size(ticklabels)
-        da_width, da_height = self.width, self.height
-        textpad = self.textpad * self._fontsize
-        if self.orientation == "vertical":
-            da_width = self.width + x_offset + textpad
-        else:
-            da_height = self.height + y_offset + textpad
 
-        # Add cbar
-        canvas = DrawingArea(da_width, da_height, clip=False)
+        # Add cbar, the size is set when the ticks are added
+        canvas = DrawingArea(self.width, self.height, clip=False)
         # self._add_color_patches(self._cbar_canvas)
         # canvas.set_figure(self.figure)
         canvas.set_figure(self.figure)
+        self._canvas = canvas
 
-        cmap_caller = get_colormap(self.cmap)
-        colors_list = cmap_caller(np.arange(cmap_caller.N))
-
-        if self.flip:
-            colors_list = colors_list[::-1]
-
-        rects = []
-        if isinstance(self.norm, colors.BoundaryNorm):
-            if self.orientation == "vertical":
-                for i, (y1, y2) in enumerate(zip(locs, locs[1::])):
-                    rects.append(
-                        Rectangle(
-                            (0, y1), width=self.width, height=y2 - y1, fc=colors_list[i]
-                        )
-                    )
-            else:
-                for i, (x1, x2) in enumerate(zip(locs, locs[1::])):
-                    rects.append(
-                        Rectangle(
-                            (x1, 0),
-                            width=x2 - x1,
-                            height=self.height,
-                            fc=colors_list[i],
-                        )
-                    )
-        else:
-            n = len(colors_list)
-            for i, c in enumerate(colors_list):
-                if self.orientation == "vertical":
-                    # compute y0/y1 from index to avoid fp accumulation drift
-                    y0 = self.height * i / n
-                    y1 = self.height * (i + 1) / n
-                    rects.append(
-                        Rectangle(
-                            (0, y0),
-                            width=self.width,
-                            height=y1 - y0,
-                            fc=c,
-                            antialiased=False,
-                            alpha=self.alpha,
-                        )
-                    )
-                else:
-                    x0 = self.width * i / n
-                    x1 = self.width * (i + 1) / n
-                    rects.append(
-                        Rectangle(
-                            (x0, 0),
-                            width=x1 - x0,
-                            height=self.height,
-                            fc=c,
-                            antialiased=False,
-                            alpha=self.alpha,
-                        )
-                    )
-
-        patches = PatchCollection(rects, match_original=True)
-        if self._rasterized:
-            patches.set_rasterized(True)
-        canvas.add_artist(patches)
+        self._gradient = self._make_gradient()
+        canvas.add_artist(self._gradient)
 
         # Add ticks
         # the tick will only be added if shape is rect
@@ -476,19 +753,15 @@ class ColorArt(Artist):
             canvas.add_artist(ticks1_lines)
         else:
             canvas.add_artist(ticks2_lines)
+        self._ticks_lines = ticks1_lines, ticks2_lines
 
-        label_x = self.width + textpad
-        label_y = self.height + textpad
-        va, ha = "bottom", "center"
-        if self.orientation == "vertical":
-            va, ha = "center", "left"
-        options = dict(va=va, ha=ha, fontsize=self._fontsize, fontproperties=self.prop)
-        for loc, label in zip(locs, ticklabels):
-            if self.orientation == "vertical":
-                t = Text(label_x, loc, label, **options)
-            else:
-                t = Text(loc, label_y, label, **options)
-            canvas.add_artist(t)
+        self._ticklabels = []
+        self._set_ticks(locs, ticks1, ticks2, ticklabels)
+
+        body = canvas
+        self._hist_bars = None
+        if self.hist is not None:
+            body = self._make_hist_box(canvas)
 
         if self.title is not None:
             if self.title_fontproperties is None:
@@ -505,14 +778,14 @@ class ColorArt(Artist):
                 # A heuristic value to make the title
                 # not overlap with labels
                 sep=0.4 * self._fontsize,
-                children=[title_canvas, canvas],
+                children=[title_canvas, body],
                 align=self.alignment,
             )
             # title_pack.set_figure(self.figure)
             title_pack.set_figure(self.figure)
             final_pack = title_pack
         else:
-            final_pack = canvas
+            final_pack = body
         self._final_pack = final_pack
         self._cbar_box = AnchoredOffsetbox(
             self._loc,
@@ -525,40 +798,265 @@ class ColorArt(Artist):
         )
         # self._cbar_box.set_figure(self.figure)
         self._cbar_box.set_figure(self.figure)
-        if self.is_axes:
-            self.axes.add_artist(self._cbar_box)
+
+    def _make_hist_box(self, canvas):
+        """Pack the histogram of the data next to the colors"""
+        size = self.hist_size * self._fontsize
+        if self.orientation == "vertical":
+            hist_canvas = DrawingArea(size, self.height, clip=False)
+        else:
+            hist_canvas = DrawingArea(self.width, size, clip=False)
+        hist_canvas.set_figure(self.figure)
+        self._hist_bars = PolyCollection(
+            self._get_hist_verts(),
+            closed=True,
+            facecolors=self.hist_color,
+            edgecolors="none",
+        )
+        hist_canvas.add_artist(self._hist_bars)
+
+        sep = 0.2 * self._fontsize
+        if self.orientation == "vertical":
+            # The tick labels are on the right
+            pack = HPacker(pad=0, sep=sep, children=[hist_canvas, canvas])
+        else:
+            # The tick labels are on the top
+            pack = VPacker(pad=0, sep=sep, children=[canvas, hist_canvas])
+        pack.set_figure(self.figure)
+        return pack
+
+    def _get_hist_verts(self):
+        # The data is only binned again if the mapping is changed
+        boundaries = None
+        if isinstance(self.norm, (colors.NoNorm, colors.BoundaryNorm)):
+            boundaries = tuple(self._boundaries)
+        key = (
+            type(self.norm),
+            self.norm.vmin,
+            self.norm.vmax,
+            boundaries,
+            self.spacing,
+            self.flip,
+            self.hist_bins,
+        )
+        if self._hist_cache is None or self._hist_cache[0] != key:
+            data = self.mappable.get_array() if self.hist is True else self.hist
+            counts = np.zeros(self.hist_bins, dtype=np.int64)
+            if data is not None:
+                counts = histogram(data, self._to_unit, bins=self.hist_bins)
+            self._hist_cache = key, counts
+        counts = self._hist_cache[1]
+        if self.orientation == "vertical":
+            length, size = self.height, self.hist_size * self._fontsize
+        else:
+            length, size = self.width, self.hist_size * self._fontsize
+        return hist_verts(counts, length, size, orientation=self.orientation)
+
+    def _to_unit(self, v):
+        """The relative position of the values along the colorart"""
+        v = np.asanyarray(v, dtype=float)
+        if isinstance(self.norm, colors.BoundaryNorm) and self.spacing == "uniform":
+            # Each color takes the same space
+            b = np.ma.filled(self._boundaries, np.nan)
+            u = np.interp(
+                np.ma.filled(v, np.nan),
+                b,
+                np.linspace(0, 1, len(b)),
+                left=np.nan,
+                right=np.nan,
+            )
+        elif isinstance(self.norm, (colors.NoNorm, colors.BoundaryNorm)):
+            arr = self._boundaries
+            u = colors.Normalize(vmin=np.min(arr), vmax=np.max(arr))(v)
+        else:
+            u = self.norm(v)
+        u = np.ma.filled(np.ma.asarray(u, dtype=float), np.nan)
+        return 1 - u if self.flip else u
+
+    def _use_blocks(self, lut=None):
+        """Whether the colors are drawn as discrete blocks instead of an image"""
+        if isinstance(self.norm, colors.BoundaryNorm):
+            return True
+        if isinstance(get_colormap(self.cmap), colors.ListedColormap):
+            if lut is None:
+                lut = get_lut(self.cmap, flip=self.flip, alpha=self.alpha)
+            return len(merge_runs(lut)) <= _MAX_BLOCKS
+        return False
+
+    def _make_gradient(self):
+        if self.orientation == "vertical":
+            length, size = self.height, self.width
+        else:
+            length, size = self.width, self.height
+
+        if isinstance(self.norm, colors.BoundaryNorm):
+            # One block per bin, the flip is applied to the edges
+            # unless every bin takes the same space
+            lut = get_lut(self.cmap, alpha=self.alpha)
+            index = np.clip(np.asarray(self.norm(self._values)), 0, len(lut) - 1)
+            block_colors = lut[index]
+            if self.flip and self.spacing == "uniform":
+                block_colors = block_colors[::-1]
+            edges, _, _ = self._locate(self._boundaries)
+            patches = color_blocks(
+                block_colors, edges, size, orientation=self.orientation
+            )
         else:
-            self.figure.add_artist(self._cbar_box)
+            lut = self._gradient_colors()
+            if self._use_blocks(lut):
+                patches = color_blocks(
+                    lut,
+                    np.linspace(0, length, len(lut) + 1),
+                    size,
+                    orientation=self.orientation,
+                )
+            else:
+                # The whole gradient is a single image,
+                # alpha overrides the colormap alpha as a patch would do
+                patches = GradientImage(
+                    lut, self.width, self.height, orientation=self.orientation
+                )
+                if self.samples == "auto":
+                    patches.set_sampler(self._gradient_colors, self.max_samples)
+
+        if self._rasterized:
+            patches.set_rasterized(True)
+        return patches
+
+    def _gradient_colors(self, n=None):
+        if n is None and self.samples != "auto":
+            n = self.samples
+        return get_lut(self.cmap, flip=self.flip, alpha=self.alpha, n=n)
+
+    def _set_ticks(self, locs, ticks1, ticks2, ticklabels):
+        """Place the ticks and tick labels, reuse the existing labels"""
+        canvas = self._canvas
+        ticks1_lines, ticks2_lines = self._ticks_lines
+        ticks1_lines.set_segments(ticks1)
+        ticks2_lines.set_segments(ticks2)
+
+        x_offset, y_offset = self._get_text_size(ticklabels)
+        across = self.width if self.orientation == "vertical" else self.height
+        # Outward ticks are drawn beyond the colors
+        textpad = self.textpad * self._fontsize + max(0, -self.tick_size) * across
+        if self.orientation == "vertical":
+            canvas.width = self.width + x_offset + textpad
+        else:
+            canvas.height = self.height + y_offset + textpad
+
+        label_x = self.width + textpad
+        label_y = self.height + textpad
+        va, ha = "bottom", "center"
+        if self.orientation == "vertical":
+            va, ha = "center", "left"
+        options = dict(va=va, ha=ha, fontsize=self._fontsize, fontproperties=self.prop)
+        for i, (loc, label) in enumerate(zip(locs, ticklabels)):
+            xy = (label_x, loc) if self.orientation == "vertical" else (loc, label_y)
+            if i < len(self._ticklabels):
+                t = self._ticklabels[i]
+                t.set_position(xy)
+                t.set_text(label)
+            else:
+                t = Text(*xy, label, **options)
+                canvas.add_artist(t)
+                self._ticklabels.append(t)
+        for t in self._ticklabels[len(ticklabels) :]:
+            canvas._children.remove(t)
+        del self._ticklabels[len(ticklabels) :]
+        canvas.stale = True
+
+    def update_normal(self, mappable=None):
+        """Update the colorart in place after the norm or colormap is changed
+
+        Only the tick positions and tick labels are recomputed when the limits
+        of the norm are changed, the gradient and the containers are reused.
+        This is called automatically when the mappable is changed.
+
+        Parameters
+        ----------
+        mappable : a :class:`ScalarMappable <matplotlib.cm.ScalarMappable>`
+            Update with a new mappable, default to the current one.
+
+        """
+        if mappable is not None and mappable is not self.mappable:
+            self._disconnect()
+            self.mappable = mappable
+            self._connect()
+        mappable = self.mappable
+        norm_replaced = type(mappable.norm) is not type(self.norm)
+        cmap_replaced = get_colormap(mappable.cmap) is not get_colormap(self.cmap)
+        self.norm = mappable.norm
+        self.cmap = mappable.cmap
+        # The norm is modified when processing values,
+        # ignore the callbacks it triggers
+        self._updating = True
+        try:
+            if (
+                self._box_stale
+                or norm_replaced
+                or not isinstance(self._gradient, GradientImage)
+                or (cmap_replaced and self._use_blocks())
+            ):
+                # The layout depends on the norm type, start over
+                self._invalidate()
+                return
+
+            self._process_values()
+            self._get_locator_formatter()
+            locs, ticks1, ticks2, ticklabels, _ = self._get_ticks()
+            self._set_ticks(locs, ticks1, ticks2, ticklabels)
+            if self._hist_bars is not None:
+                self._hist_bars.set_verts(self._get_hist_verts())
+            if cmap_replaced:
+                self._gradient.set_colors(self._gradient_colors())
+                if self.samples == "auto":
+                    self._gradient.set_sampler(self._gradient_colors, self.max_samples)
+        finally:
+            self._updating = False
+        self.stale = True
+        self._cbar_box.stale = True
+
+    def _on_mappable_changed(self, mappable):
+        if not self._updating:
+            self.update_normal()
+
+    def _connect(self):
+        # A bound method is only weakly referenced by the callbacks,
+        # the mappable keeps the colorart alive as it does for a colorbar
+        self._mappable_cid = self.mappable.callbacks.connect(
+            "changed", partial(ColorArt._on_mappable_changed, self)
+        )
+
+    def _disconnect(self):
+        if self._mappable_cid is not None:
+            self.mappable.callbacks.disconnect(self._mappable_cid)
+            self._mappable_cid = None
 
     def get_bbox(self, renderer=None):
+        self._ensure_box()
         return self._final_pack.get_bbox(renderer=renderer)
 
     def get_window_extent(self, renderer=None):
-        return self._final_pack.get_window_extent(renderer=renderer)
+        # The box is placed at the location of the colorart
+        self._ensure_box()
+        return self._cbar_box.get_window_extent(renderer=renderer)
+
+    def get_tightbbox(self, renderer=None):
+        self._ensure_box()
+        return self._cbar_box.get_tightbbox(renderer=renderer)
 
     def set_offset(self, offset):
+        self._ensure_box()
         self._final_pack.set_offset(offset)
 
     def _get_text_size(self, ticklabels):
         """Used to get the proper size for drawing area"""
-        renderer = self.figure.canvas.get_renderer()
-        all_texts = []
-        for t in ticklabels:
-            text_obj = Text(0, 0, t, fontsize=self._fontsize, fontproperties=self.prop)
-            if self.is_axes:
-                self.axes.add_artist(text_obj)
-            else:
-                self.figure.add_artist(text_obj)
-            all_texts.append(text_obj)
-        x_sizes, y_sizes = [], []
-        for t in all_texts:
-            bbox = t.get_window_extent(renderer)
-            x_sizes.append(bbox.xmax - bbox.xmin)
-            y_sizes.append(bbox.ymax - bbox.ymin)
-            t.remove()  # so it won't be drawn
-        dpi_cor = renderer.points_to_pixels(1.0)
-        x_offset = np.max(x_sizes) / dpi_cor
-        y_offset = np.max(y_sizes) / dpi_cor
+        if len(ticklabels) == 0:
+            return 0, 0
+        dpi = 72 if self.figure is None else self.figure.dpi
+        sizes = [measure_text(t, self.prop, dpi) for t in ticklabels]
+        x_offset = np.max([s[0] for s in sizes])
+        y_offset = np.max([s[1] for s in sizes])
         return x_offset, y_offset
 
     def _process_values(self):
@@ -619,70 +1117,20 @@ class ColorArt(Artist):
 
     def _get_locator_formatter(self):
         """Determine the locator to get ticks"""
-        locator = self._locator
-        formatter = self._formatter
-        minorlocator = self._minorlocator
-        if isinstance(self.norm, colors.BoundaryNorm):
-            b = self.norm.boundaries
-            if locator is None:
-                locator = ticker.FixedLocator(b, nbins=5)
-            if minorlocator is None:
-                minorlocator = ticker.FixedLocator(b)
-        elif isinstance(self.norm, colors.NoNorm):
-            if locator is None:
-                # put ticks on integers between the boundaries of NoNorm
-                nv = len(self._values)
-                base = 1 + int(nv / 10)
-                locator = ticker.IndexLocator(base=base, offset=0)
-        elif isinstance(self.norm, colors.LogNorm):
-            base = self.norm._scale.base
-            if locator is None:
-                locator = ticker.LogLocator(base=base)
-            if formatter is None:
-                formatter = ticker.LogFormatterSciNotation(base=base)
-        elif isinstance(self.norm, colors.SymLogNorm):
-            base = self.norm._scale.base
-            if locator is None:
-                locator = ticker.SymmetricalLogLocator(
-                    linthresh=self.norm.linthresh, base=base
-                )
-            if formatter is None:
-                formatter = ticker.LogFormatterSciNotation(base=base)
-        elif self.boundaries is not None:
-            b = self._boundaries[self._inside]
-            if locator is None:
-                locator = ticker.FixedLocator(b, nbins=5)
-        else:
-            # AsinhNorm is introduced at 3.6
-            if hasattr(colors, "AsinhNorm"):
-                if isinstance(self.norm, colors.AsinhNorm):
-                    base = 10  # self.norm._scale.base
-                    if locator is None:
-                        locator = ticker.AsinhLocator(
-                            linear_width=self.norm.linear_width, base=base
-                        )
-                    if formatter is None:
-                        if base > 1:
-                            formatter = ticker.LogFormatterSciNotation(base=base)
-                        else:
-                            formatter = ticker.StrMethodFormatter("{x:.3g}")
-            # most cases:
-            if locator is None:
-                # we haven't set the locator explicitly, so use the default
-                # for this axis:
-                locator = ticker.MaxNLocator(nbins=5, steps=[1, 2, 2.5, 5, 10])
-            if minorlocator is None:
-                minorlocator = ticker.NullLocator()
-
-        if minorlocator is None:
-            minorlocator = ticker.NullLocator()
-
-        if formatter is None:
-            formatter = ticker.ScalarFormatter()
-
-        self._locator = locator
-        self._formatter = formatter
-        self._minorlocator = minorlocator
+        boundaries = None
+        if self.boundaries is not None:
+            boundaries = self._boundaries[self._inside]
+        (
+            self._locator,
+            self._formatter,
+            self._minorlocator,
+        ) = get_locator_formatter(
+            self.norm,
+            locator=self._locator_spec,
+            formatter=self._formatter_spec,
+            boundaries=boundaries,
+            n_values=len(self._values),
+        )
 
     def _get_ticks(self):
         if isinstance(self.norm, colors.NoNorm) and self.boundaries is None:
@@ -690,53 +1138,33 @@ class ColorArt(Artist):
         else:
             intv = (np.nanmin(self._values), np.nanmax(self._values))
 
-        locator = self._locator
-        formatter = self._formatter
-        locator.create_dummy_axis(minpos=intv[0])
-        locator.axis.set_view_interval(*intv)
-        locator.axis.set_data_interval(*intv)
-        formatter.set_axis(locator.axis)
-
-        b = np.array(locator())
-        if isinstance(self.norm, colors.BoundaryNorm):
-            pass
-        elif isinstance(locator, ticker.LogLocator):
-            eps = 1e-10
-            b = b[(b <= intv[1] * (1 + eps)) & (b >= intv[0] * (1 - eps))]
-            # b = b[(b >= intv[0] * (1 - eps))]
-        # else:
-        # eps = (intv[1] - intv[0]) * 1e-10
-        # b = b[(b <= intv[1] + eps) & (b >= intv[0] - eps)]
+        b, ticklabels, offset_string = get_tick_values(
+            self._locator, self._formatter, intv, self.norm
+        )
         locs, ticks1, ticks2 = self._locate(b)
-        ticklabels = formatter.format_ticks(b)
-        offset_string = formatter.get_offset()
 
         # Filter out ticklabels for ticks that are outside the colorbox boundaries
         h = self.height
         if self.orientation == "horizontal":
             h = self.width
-
-        # Create a mask for valid tick positions (within colorbox boundaries)
-        valid_indices = []
-        for i, loc in enumerate(locs):
-            if 0 <= loc <= h:
-                valid_indices.append(i)
-
-        # Filter locs and ticklabels to match the filtered ticks
-        if len(valid_indices) < len(locs):
-            locs = np.array([locs[i] for i in valid_indices])
-            ticklabels = [ticklabels[i] for i in valid_indices]
+        valid = (locs >= 0) & (locs <= h)
+        if not valid.all():
+            locs = locs[valid]
+            ticklabels = [label for label, v in zip(ticklabels, valid) if v]
             # ticks1 and ticks2 are already filtered in _locate()
 
         return locs, ticks1, ticks2, ticklabels, offset_string
 
     def _locate(self, v):
+        v = np.asarray(v, dtype=float)
         if isinstance(self.norm, (colors.NoNorm, colors.BoundaryNorm)):
             arr = self._boundaries
             normalize = colors.Normalize(vmin=np.min(arr), vmax=np.max(arr))
-            locs = np.array([normalize(i) for i in v])
+            locs = normalize(v)
         else:
-            locs = np.array([self.norm(i) for i in v])
+            locs = self.norm(v)
+        # Invalid values (e.g. negative in LogNorm) are masked
+        locs = np.ma.filled(np.ma.asarray(locs, dtype=float), np.nan)
 
         h, w = self.height, self.width
         if self.orientation == "horizontal":
@@ -747,18 +1175,17 @@ class ColorArt(Artist):
         else:
             locs = (1 - locs) * h if self.flip else locs * h
 
-        ticks1, ticks2 = [], []
-        for loc in locs:
-            # Check if the tick is within the colorbox boundaries
-            if 0 <= loc <= h:
-                if self.orientation == "vertical":
-                    t1 = [(0, loc), (w * self.tick_size, loc)]
-                    t2 = [(w, loc), (w * (1 - self.tick_size), loc)]
-                else:
-                    t1 = [(loc, 0), (loc, w * self.tick_size)]
-                    t2 = [(loc, w), (loc, w * (1 - self.tick_size))]
-                ticks1.append(t1)
-                ticks2.append(t2)
+        # Only the ticks within the colorbox boundaries, as (n, 2, 2) segments
+        inside = locs[(locs >= 0) & (locs <= h)]
+        n = len(inside)
+        ticks1 = np.empty((n, 2, 2))
+        ticks2 = np.empty((n, 2, 2))
+        # index the coordinate along the colorbox and across it
+        along, across = (1, 0) if self.orientation == "vertical" else (0, 1)
+        ticks1[:, :, along] = inside[:, np.newaxis]
+        ticks2[:, :, along] = inside[:, np.newaxis]
+        ticks1[:, :, across] = [0, w * self.tick_size]
+        ticks2[:, :, across] = [w, w * (1 - self.tick_size)]
 
         return locs, ticks1, ticks2
 
@@ -774,12 +1201,27 @@ class ColorArt(Artist):
 
     def set_alpha(self, alpha):
         self.alpha = None if isinstance(alpha, np.ndarray) else alpha
+        self._invalidate()
 
     def get_children(self):
-        return self._cbar_box
+        # Don't build the box of a lazy colorart
+        if self._cbar_box is None:
+            return []
+        return [self._cbar_box]
 
     def remove(self):
-        self._cbar_box.remove()
+        self._disconnect()
+        self._detach()
+
+    def _detach(self):
+        """Take the colorart out of its parent, it still follows the mappable"""
+        if self._draw:
+            if self._lazy:
+                super().remove()
+            else:
+                self._attached_box.remove()
+                self._attached_box = None
+        self._draw = False
 
     def set_border(self, *args):
         raise NotImplementedError(
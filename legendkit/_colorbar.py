@@ -4,10 +4,40 @@ import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 from matplotlib.colorbar import Colorbar as MPLColorbar
-from matplotlib.patches import Ellipse, Polygon
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 
-from ._locs import Locs
+from ._autoscale import (
+    autoscale_norm,
+    collect_mappables,
+    mappables_axes,
+    share_norm,
+)
+from ._colorart import ColorArt
+from ._locs import Locs, axes_list
+
+
+def _unit_shapes():
+    """The outline of the shapes in the unit square
+
+    2-----3
+    |     |
+    |     |
+    1-----4
+
+    """
+    circle = Path.unit_circle()
+    corner = [(0, 0), (0, 1), (1, 1), (1, 0)]
+    return {
+        "ellipse": Path((circle.vertices + 1) / 2, circle.codes),
+        "triangle": Path(corner[:3] + corner[:1], closed=True),
+        "trapezoid": Path(corner[:3] + [(0.4, 0), (0, 0)], closed=True),
+    }
+
+
+# The paths are shared, the size is set with the transform
+_SHAPES = _unit_shapes()
 
 
 class Colorbar(MPLColorbar):
@@ -19,12 +49,15 @@ class Colorbar(MPLColorbar):
     ----------
     mappable : :class:`ScalarMapping <matplotlib.cm.ScalarMappable>`
         The mappable whose colormap and norm will be used.
+        If a list of mappables or axes is given, the mappables share
+        the norm of the first one, scaled to the range of all of them.
     norm : :class:`Normalize <matplotlib.colors.Normalize>`
         The normalization to use.
     cmap : :class:`Colormap <matplotlib.colors.Colormap>`
         The colormap to use.
-    ax : :class:`Axes <matplotlib.axes.Axes>`
-        The axes to draw colorbar.
+    ax : :class:`Axes <matplotlib.axes.Axes>` or list of axes
+        The axes to draw colorbar. If a list of axes is given, the colorbar
+        is placed relative to the area of all the axes.
     style : {'white', 'normal'}, default: 'white'
     width : float
         The width of colorbar
@@ -48,6 +81,12 @@ class Colorbar(MPLColorbar):
     alignment : {'left', 'right', 'center'}, default: 'center'
         The alignment of title and colorbar
     title_fontproperties
+    autoscale : {'full', 'sample', 'none'}, default: 'full'
+        How to find the missing limits of the norm from the data,
+        the limits that are already set on the norm are reused.
+        Use 'sample' to estimate them from a strided subsample of a large array.
+    data_range : (vmin, vmax)
+        The precomputed limits of the data, used before scanning the data.
     colorbar_options : mapping
         Pass to :class:`matplotlib.colorbar.Colorbar`
 
@@ -88,25 +127,26 @@ class Colorbar(MPLColorbar):
         title: str = None,
         alignment: str = "left",
         title_fontproperties: Dict = None,
+        autoscale: str = "full",
+        data_range: Any = None,
         **colorbar_options,
     ):
+        if isinstance(mappable, (list, tuple, np.ndarray)):
+            # One colorbar for several mappables
+            mappables = collect_mappables(mappable)
+            share_norm(mappables, autoscale=autoscale, data_range=data_range)
+            mappable = mappables[0]
+            if ax is None:
+                ax = mappables_axes(mappables)
         if ax is None:
             ax = plt.gca()
+        if mappable is not None:
+            # matplotlib won't scan the data again once the norm is scaled
+            autoscale_norm(mappable, autoscale=autoscale, data_range=data_range)
         if loc is None:
             loc = "out right center"
 
-        if (width is None) and (height is None):
-            width, height = (0.3, 1.5)
-            # Flip width and height
-            if orientation == "horizontal":
-                width, height = height, width
-        elif (width is not None) and (height is not None):
-            pass
-        else:
-            if width is None:
-                width = 1.5 if orientation == "horizontal" else 0.3
-            else:
-                height = 0.3 if orientation == "horizontal" else 1.5
+        width, height = _colorbar_size(width, height, orientation)
 
         loc, bbox_to_anchor, bbox_transform = Locs().transform(
             ax,
@@ -116,8 +156,9 @@ class Colorbar(MPLColorbar):
             deviation=deviation,
         )
 
+        axes = axes_list(ax)
         axins = inset_axes(
-            ax,
+            ax if axes is None else axes[0],
             width=width,
             height=height,
             borderpad=borderpad,
@@ -128,6 +169,13 @@ class Colorbar(MPLColorbar):
             axes_kwargs=axes_kwargs,
         )
 
+        # The solids are clipped every time they are drawn
+        self.shape = shape
+        self.style = style
+        if title_fontproperties is None:
+            title_fontproperties = {"weight": "bold", "size": "medium"}
+        self._title_options = dict(loc=alignment, fontdict=title_fontproperties)
+        self._redrawn = False
         super().__init__(
             axins,
             mappable,
@@ -137,7 +185,13 @@ class Colorbar(MPLColorbar):
             **colorbar_options,
         )
 
-        if style == "white":
+        self._apply_style()
+        if title is not None:
+            self.ax.set_title(title, **self._title_options)
+        self.ax.set_facecolor("none")
+
+    def _apply_style(self):
+        if self.style == "white":
             # Inward ticks and white color
             self.long_axis.set_tick_params(
                 direction="in", color="white", width=1, size=5
@@ -150,38 +204,77 @@ class Colorbar(MPLColorbar):
 
             # turn off outlines
             self.outline.set_visible(0)
+        if self.shape in _SHAPES:
+            self.long_axis.set_tick_params(width=0)
 
+    def _draw_all(self):
+        super()._draw_all()
+        # The solids are created again, clip them with the same shape
+        self._clip_shape()
+        self._redrawn = True
+
+    def update(self, mappable=None, norm=None, cmap=None, title=None):
+        """Update the colorbar in place, e.g. for a frame of an animation
+
+        The inset axes is reused, only the solids and the ticks are drawn again.
+        The style and the shape are applied to the new solids.
+
+        Parameters
+        ----------
+        mappable : :class:`ScalarMapping <matplotlib.cm.ScalarMappable>`
+            Follow another mappable.
+        norm : :class:`Normalize <matplotlib.colors.Normalize>`
+            Set the norm of the mappable.
+        cmap : :class:`Colormap <matplotlib.colors.Colormap>`
+            Set the colormap of the mappable.
+        title : str
+            Set the title of the colorbar.
+
+        Returns
+        -------
+        list of :class:`Artist <matplotlib.artist.Artist>`
+            The artists that are changed, to be redrawn when blitting.
+
+        """
+        self._redrawn = False
+        if mappable is not None and mappable is not self.mappable:
+            old = self.mappable
+            old.callbacks.disconnect(old.colorbar_cid)
+            old.colorbar = None
+            old.colorbar_cid = None
+            mappable.colorbar = self
+            mappable.colorbar_cid = mappable.callbacks.connect(
+                "changed", self.update_normal
+            )
+            self.update_normal(mappable)
+        # The colorbar is updated by the callback of the mappable
+        if norm is not None:
+            self.mappable.set_norm(norm)
+        if cmap is not None:
+            self.mappable.set_cmap(cmap)
+        if not self._redrawn:
+            self.update_normal(self.mappable)
+        self._apply_style()
+
+        artists = [] if self.solids is None else [self.solids]
+        artists += list(self.solids_patches)
+        artists.append(self.long_axis)
         if title is not None:
-            if title_fontproperties is None:
-                title_fontproperties = {"weight": "bold", "size": "medium"}
-            self.ax.set_title(title, loc=alignment, fontdict=title_fontproperties)
-        self.ax.set_facecolor("none")
-        # shape clip not work for BoundaryNorm or CounterSet
-        if self.solids is not None:
-            if shape != "rect":
-                self.long_axis.set_tick_params(width=0)
-            if shape == "ellipse":
-                xrange = self.get_xrange()
-                yrange = self.get_yrange()
-                patch = Ellipse(self.get_midpoint(), xrange, yrange, facecolor="none")
-                self.ax.add_patch(patch)
-                self.solids.set_clip_path(patch)
-            elif shape == "triangle":
-                corner = self.get_corner()
-                patch = Polygon([corner[0], corner[1], corner[2]], facecolor="none")
-                self.ax.add_patch(patch)
-                self.solids.set_clip_path(patch)
-            elif shape == "trapezoid":
-                corner = self.get_corner()
-                xrange = self.get_xrange()
-                patch = Polygon(
-                    [corner[0], corner[1], corner[2], (xrange / 2.5, corner[3][1])],
-                    facecolor="none",
-                )
-                self.ax.add_patch(patch)
-                self.solids.set_clip_path(patch)
-            else:
-                pass
+            artists.append(self.ax.set_title(title, **self._title_options))
+        return artists
+
+    def _clip_shape(self):
+        """Clip the solids with the shape, in axes coordinates
+
+        The clip follows the limits and the size of the axes,
+        nothing is computed when the colorbar is updated.
+        """
+        path = _SHAPES.get(getattr(self, "shape", "rect"))
+        if path is None:
+            return
+        solids = [] if self.solids is None else [self.solids]
+        for artist in solids + list(self.solids_patches):
+            artist.set_clip_path(path, self.ax.transAxes)
 
     def set_title(self, *args, **kw):
         self.ax.set_title(*args, **kw)
@@ -220,3 +313,204 @@ class Colorbar(MPLColorbar):
             (xlims[1], ylims[1]),
             (xlims[1], ylims[0]),
         )
+
+
+def _colorbar_size(width, height, orientation):
+    """The size of the colorbar in inches"""
+    if (width is None) and (height is None):
+        width, height = (0.3, 1.5)
+        # Flip width and height
+        if orientation == "horizontal":
+            width, height = height, width
+    elif width is None:
+        width = 1.5 if orientation == "horizontal" else 0.3
+    elif height is None:
+        height = 0.3 if orientation == "horizontal" else 1.5
+    return width, height
+
+
+class _LongAxis:
+    """Tick settings of :class:`LiteColorbar`, in the manner of an axis"""
+
+    _keys = {"direction", "color", "colors", "width", "size", "length"}
+
+    def __init__(self, colorbar):
+        self._colorbar = colorbar
+
+    def set_tick_params(self, which="major", reset=False, **kwargs):
+        unknown = set(kwargs) - self._keys
+        if unknown:
+            raise ValueError(
+                f"keyword {sorted(unknown)[0]} is not recognized; "
+                f"valid keywords are {sorted(self._keys)}"
+            )
+        # There are no minor ticks
+        if which == "minor":
+            return
+        cb = self._colorbar
+        across = cb.width if cb.orientation == "vertical" else cb.height
+        tick_size = cb.tick_size
+        direction = kwargs.get("direction", "out" if tick_size < 0 else "in")
+        if direction not in {"in", "out"}:
+            raise ValueError("`direction` must be 'in' or 'out'")
+        size = kwargs.get("size", kwargs.get("length"))
+        size = abs(tick_size) if size is None else size / across
+        cb.tick_size = -size if direction == "out" else size
+        color = kwargs.get("color", kwargs.get("colors"))
+        if color is not None:
+            cb.tick_color = color
+        if "width" in kwargs:
+            cb.tick_width = kwargs["width"]
+        cb._invalidate()
+
+
+class LiteColorbar(ColorArt):
+    """Colorbar drawn without an inset axes
+
+    A :class:`Colorbar` creates an axes for every colorbar,
+    which is slow for a figure with many colorbars. This has the same
+    parameters and the :attr:`long_axis`, :meth:`set_title` and
+    `shape` of :class:`Colorbar`, but it's drawn like :class:`ColorArt`
+    and does not take part in the layout of the figure.
+
+    Parameters
+    ----------
+    mappable : :class:`ScalarMapping <matplotlib.cm.ScalarMappable>`
+        The mappable whose colormap and norm will be used.
+    norm : :class:`Normalize <matplotlib.colors.Normalize>`
+        The normalization to use.
+    cmap : :class:`Colormap <matplotlib.colors.Colormap>`
+        The colormap to use.
+    ax : :class:`Axes <matplotlib.axes.Axes>`
+        The axes to draw colorbar.
+    style : {'white', 'normal'}, default: 'white'
+    shape : {'rect', 'ellipse', 'triangle', 'trapezoid'}, default: 'rect'
+    width : float
+        The width of colorbar in inches
+    height : float
+        The height of colorbar in inches
+    loc : str
+        Apart from the default location code, you can add 'out' as prefix
+        to place the legend ouside the axes.
+        See :ref:`all available options. <tutorial/title&layout:Legend Placement>`
+    deviation : float
+        The space between colorbar and axes if place outside
+    bbox_to_anchor
+    bbox_transform
+    borderpad
+    orientation : {'vertical', 'horizontal'}
+        The orientation of the colorbar
+    title : str
+        The title of colorbar
+    alignment : {'left', 'right', 'center'}, default: 'left'
+        The alignment of title and colorbar
+    title_fontproperties
+    colorart_options : mapping
+        Pass to :class:`ColorArt`
+
+    Examples
+    --------
+
+    .. plot::
+
+        >>> from legendkit import lite_colorbar
+        >>> data = np.random.rand(10, 10)
+        >>> mp = plt.pcolormesh(data, cmap="RdBu")
+        >>> lite_colorbar(mp)
+
+    """
+
+    def __repr__(self):
+        return "<LiteColorbar>"
+
+    def __init__(
+        self,
+        mappable=None,
+        norm=None,
+        cmap=None,
+        *,
+        ax: Axes = None,
+        style: str = "white",
+        shape: str = "rect",
+        width: float = None,
+        height: float = None,
+        loc=None,
+        deviation=0.05,
+        bbox_to_anchor: Any = None,
+        bbox_transform: Any = None,
+        borderpad: Any = 0,
+        orientation: str = "vertical",
+        title: str = None,
+        alignment: str = "left",
+        title_fontproperties: Dict = None,
+        **colorart_options,
+    ):
+        style_options = {"white", "normal"}
+        if style not in style_options:
+            raise ValueError("`style` must be 'white' or 'normal'")
+        shape_options = {"rect", "ellipse", "triangle", "trapezoid"}
+        if shape not in shape_options:
+            raise ValueError(
+                "`shape` must be 'rect', 'ellipse', 'triangle' or 'trapezoid'"
+            )
+        self.shape = shape
+        width, height = _colorbar_size(width, height, orientation)
+        # The tick size is in points as in Colorbar
+        across = 72 * (width if orientation == "vertical" else height)
+        if style == "white":
+            # Inward ticks and white color
+            tick_options = dict(tick_color="white", tick_width=1, tick_size=5 / across)
+        else:
+            tick_options = dict(
+                tick_color="black",
+                tick_width=0.8,
+                tick_size=-3.5 / across,
+                ticklocation="right" if orientation == "vertical" else "top",
+            )
+        if shape != "rect":
+            tick_options["tick_width"] = 0
+        tick_options.update(colorart_options)
+        if title_fontproperties is None:
+            title_fontproperties = {"weight": "bold", "size": "medium"}
+
+        super().__init__(
+            mappable,
+            cmap,
+            norm,
+            ax=ax,
+            width=width,
+            height=height,
+            loc=loc,
+            deviation=deviation,
+            bbox_to_anchor=bbox_to_anchor,
+            bbox_transform=bbox_transform,
+            borderpad=0,
+            borderaxespad=borderpad,
+            orientation=orientation,
+            title=title,
+            alignment=alignment,
+            title_fontproperties=title_fontproperties,
+            **tick_options,
+        )
+        self.long_axis = _LongAxis(self)
+
+    def _set_height_width(self, height, width):
+        # The size is in inches
+        self.width, self.height = width * 72, height * 72
+
+    def set_title(self, label, fontdict=None, loc=None, **kwargs):
+        self.title = label
+        if loc is not None:
+            self.alignment = loc
+        if fontdict is not None or kwargs:
+            self.title_fontproperties = {**(fontdict or {}), **kwargs}
+        self._invalidate()
+
+    def _make_gradient(self):
+        patches = super()._make_gradient()
+        path = _SHAPES.get(self.shape)
+        if path is not None:
+            # Scale the unit shape to the colors in the canvas
+            transform = Affine2D().scale(self.width, self.height)
+            patches.set_clip_path(path, transform + self._canvas.get_transform())
+        return patches
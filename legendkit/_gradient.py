@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import numpy as np
+import matplotlib.transforms as mtransforms
+from matplotlib.artist import allow_rasterization
+from matplotlib.collections import PolyCollection
+from matplotlib.image import BboxImage
+
+
+class GradientImage(BboxImage):
+    """Draw a list of colors as a single image
+
+    This is used to render the color strip of :class:`ColorArt`,
+    the image is placed in the coordinates of the parent
+    :class:`DrawingArea <legendkit._colorart.DrawingArea>`, so it follows
+    the same offset and dpi scaling as any other children.
+
+    Parameters
+    ----------
+    colors : array-like of shape (N, 3) or (N, 4)
+        The colors from the start to the end of the gradient.
+        An array of shape (M, N, 3) or (M, N, 4) is drawn as a 2-D grid
+        of colors, the first row at the bottom.
+    width, height : float
+        The size of the image in points.
+    orientation : {'vertical', 'horizontal'}
+        The direction of the gradient.
+    x, y : float
+        The lower left corner of the image in points.
+    kwargs :
+        Pass to :class:`BboxImage <matplotlib.image.BboxImage>`
+
+    """
+
+    def __init__(
+        self,
+        colors,
+        width,
+        height,
+        orientation="vertical",
+        x=0,
+        y=0,
+        **kwargs,
+    ):
+        self._box = mtransforms.Bbox.from_bounds(x, y, width, height)
+        super().__init__(
+            mtransforms.TransformedBbox(self._box, mtransforms.IdentityTransform()),
+            interpolation="nearest",
+            origin="lower",
+            **kwargs,
+        )
+        self.orientation = orientation
+        self._sampler = None
+        self._max_samples = None
+        self._samples = None
+        self.set_colors(colors)
+
+    def set_transform(self, t):
+        # The bbox follows the parent transform,
+        # the transform of the image itself is only used internally
+        super().set_transform(t)
+        self.bbox = mtransforms.TransformedBbox(self._box, t)
+
+    def set_sampler(self, sampler, max_samples=None):
+        """Resample the colors from the size of the image at draw time
+
+        Parameters
+        ----------
+        sampler : callable
+            Return the colors of the gradient given the number of colors.
+        max_samples : int
+            The upper limit of the number of colors.
+
+        """
+        self._sampler = sampler
+        self._max_samples = max_samples
+        self._samples = None
+        self.stale = True
+
+    @allow_rasterization
+    def draw(self, renderer):
+        if self._sampler is not None:
+            # One color per pixel along the gradient
+            length = self.bbox.height
+            if self.orientation == "horizontal":
+                length = self.bbox.width
+            n = int(np.ceil(abs(length) * renderer.get_image_magnification()))
+            n = max(n, 2)
+            if self._max_samples is not None:
+                n = min(n, self._max_samples)
+            if n != self._samples:
+                self._samples = n
+                self.set_colors(self._sampler(n))
+        super().draw(renderer)
+
+    def set_colors(self, colors):
+        """Set the colors of the gradient"""
+        colors = np.asarray(colors)
+        if colors.ndim == 3:
+            data = colors
+        elif self.orientation == "vertical":
+            data = colors[:, np.newaxis, :]
+        else:
+            data = colors[np.newaxis, :, :]
+        self.set_data(data)
+
+
+def merge_runs(colors):
+    """Return the start index of each run of equal consecutive colors"""
+    colors = np.asarray(colors)
+    if len(colors) == 0:
+        return np.array([], dtype=int)
+    changed = np.any(colors[1:] != colors[:-1], axis=1)
+    return np.r_[0, np.flatnonzero(changed) + 1]
+
+
+def color_blocks(colors, edges, size, orientation="vertical", **kwargs):
+    """Draw a list of discrete colors as blocks in a single collection
+
+    Consecutive blocks of the same color are merged.
+
+    Parameters
+    ----------
+    colors : array-like of shape (N, 4)
+        The color of each block, either in float or in uint8.
+    edges : array-like of shape (N + 1,)
+        The position of the block edges along the orientation.
+    size : float
+        The size of the blocks across the orientation.
+    orientation : {'vertical', 'horizontal'}
+    kwargs :
+        Pass to :class:`PolyCollection <matplotlib.collections.PolyCollection>`
+
+    """
+    colors = np.asarray(colors)
+    edges = np.asarray(edges, dtype=float)
+    n = max(min(len(colors), len(edges) - 1), 0)
+    colors = colors[:n]
+    starts = merge_runs(colors)
+    lo = edges[starts]
+    hi = edges[np.r_[starts[1:], n]].astype(float)
+    facecolors = colors[starts]
+    if facecolors.dtype == np.uint8:
+        facecolors = facecolors / 255
+
+    along, across = (1, 0) if orientation == "vertical" else (0, 1)
+    verts = np.empty((len(starts), 4, 2))
+    verts[..., along] = np.stack([lo, lo, hi, hi], axis=1)
+    verts[..., across] = [0, size, size, 0]
+    kwargs.setdefault("antialiased", False)
+    return PolyCollection(
+        verts, closed=True, facecolors=facecolors, edgecolors="none", **kwargs
+    )
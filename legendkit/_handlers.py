@@ -1,6 +1,10 @@
-from matplotlib.collections import PatchCollection
+from functools import lru_cache
+
+from matplotlib.collections import PathCollection
 from matplotlib.legend_handler import HandlerPatch
 from matplotlib.patches import Rectangle, Circle
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
 
 
 def min_side(w, h):
@@ -59,6 +63,32 @@ class CircleHandler(HandlerPatch):
         )
 
 
+@lru_cache(maxsize=64)
+def _boxplot_path(x0, y0, width, height, box_w, box_h):
+    """The whiskers, box and median of a boxplot handle as one path
+
+    The whisker is split at the box, so no outline is hidden by the box.
+    The handles of a legend have the same size, the path is shared.
+    """
+    linewidth = 1
+    box_x = x0 + width * (1 - box_w) / 2
+    box_y = y0 + height * (1 - box_h) / 2
+    whisker_x = x0 + width / 2 - linewidth / 2
+    rects = [
+        # lower whisker, box, upper whisker, median
+        (whisker_x, y0, linewidth / 2, box_y - y0),
+        (box_x, box_y, width * box_w, height * box_h),
+        (whisker_x, box_y + height * box_h, linewidth / 2, box_y - y0),
+        (box_x, y0 + height * 0.5 - linewidth / 4, width * box_w, linewidth / 2),
+    ]
+    return Path.make_compound_path(
+        *(
+            Path.unit_rectangle().transformed(Affine2D().scale(w, h).translate(x, y))
+            for x, y, w, h in rects
+        )
+    )
+
+
 class BoxplotHandler(HandlerPatch):
     box_w = 0.8
     box_h = 0.6
@@ -69,28 +99,10 @@ class BoxplotHandler(HandlerPatch):
         if width / height < 1.2:
             height = height * 0.6
             ydescent = ydescent - height * 0.2
-        w_offset = (1 - self.box_w) / 2
-        h_offset = (1 - self.box_h) / 2
-        box = Rectangle(
-            xy=(-xdescent + w_offset * width, -ydescent + height * h_offset),
-            width=width * self.box_w,
-            height=height * self.box_h,
+        path = _boxplot_path(
+            -xdescent, -ydescent, width, height, self.box_w, self.box_h
         )
-
-        linewidth = 1
-        vline = Rectangle(
-            xy=(-xdescent + width / 2 - linewidth / 2, -ydescent),
-            width=linewidth / 2,
-            height=height,
-        )
-
-        hline = Rectangle(
-            xy=(-xdescent + w_offset * width, -ydescent + height * 0.5 - linewidth / 4),
-            width=width * self.box_w,
-            height=linewidth / 2,
-        )
-
-        return PatchCollection([vline, box, hline], match_original=True)
+        return PathCollection([path])
 
 
 # Backward-compat alias for the old typo name
@@ -0,0 +1,100 @@
+"""Histogram of the mapped data along a colorart
+
+The data is binned chunk by chunk, so a memory-mapped array or
+a sequence of chunks is never loaded or copied as a whole.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+
+# The number of values binned at once
+_CHUNK_SIZE = 1 << 20
+
+
+def iter_chunks(data, chunk_size=_CHUNK_SIZE):
+    """Iterate over the values of the data in flat chunks
+
+    Parameters
+    ----------
+    data : array-like, sequence of array-like or callable
+        An array is sliced along the first axis, the slices are views
+        of the array. A callable is called to get the data.
+    chunk_size : int
+        The number of values in a chunk of an array.
+
+    """
+    if callable(data):
+        data = data()
+    if isinstance(data, (list, tuple)) and len(data) and np.ndim(data[0]) == 0:
+        # A list of values
+        data = np.asanyarray(data)
+    if isinstance(data, np.ndarray):
+        if data.ndim == 0:
+            yield data.reshape(-1)
+            return
+        row = int(np.prod(data.shape[1:]))
+        if row == 0:
+            return
+        step = max(1, chunk_size // row)
+        for i in range(0, len(data), step):
+            yield data[i : i + step].reshape(-1)
+    else:
+        for chunk in data:
+            yield from iter_chunks(np.asanyarray(chunk), chunk_size)
+
+
+def check_hist_data(data):
+    if isinstance(data, Iterator):
+        raise ValueError(
+            "An iterator can only be binned once, "
+            "use a sequence of chunks or a function returning the chunks"
+        )
+
+
+def histogram(data, to_unit, bins=50, chunk_size=_CHUNK_SIZE):
+    """Count the values in equal bins between 0 and 1
+
+    Parameters
+    ----------
+    data :
+        See :func:`iter_chunks`
+    to_unit : callable
+        Map the values to the unit interval, invalid values are NaN.
+    bins : int
+    chunk_size : int
+
+    Returns
+    -------
+    np.ndarray of shape (bins,)
+
+    """
+    counts = np.zeros(bins, dtype=np.int64)
+    for chunk in iter_chunks(data, chunk_size):
+        u = to_unit(chunk)
+        u = u[(u >= 0) & (u <= 1)]
+        index = np.minimum((u * bins).astype(np.intp), bins - 1)
+        counts += np.bincount(index, minlength=bins)
+    return counts
+
+
+def hist_verts(counts, length, size, orientation="vertical"):
+    """The vertices of the bars, the bars grow from `size` toward 0
+
+    Empty bins are dropped.
+    """
+    counts = np.asarray(counts)
+    edges = np.linspace(0, length, len(counts) + 1)
+    top = counts.max() if len(counts) else 0
+    heights = counts / top * size if top > 0 else np.zeros(len(counts))
+    keep = counts > 0
+    lo, hi, h = edges[:-1][keep], edges[1:][keep], heights[keep]
+
+    along, across = (1, 0) if orientation == "vertical" else (0, 1)
+    verts = np.empty((len(lo), 4, 2))
+    verts[..., along] = np.stack([lo, lo, hi, hi], axis=1)
+    base = np.full_like(h, size)
+    verts[..., across] = np.stack([base, size - h, size - h, base], axis=1)
+    return verts
@@ -1,22 +1,28 @@
 from __future__ import annotations
 
+import itertools
+from functools import lru_cache
+
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.collections import Collection
-from matplotlib.colors import is_color_like
+from matplotlib.colors import is_color_like, to_rgba, to_rgba_array
+from matplotlib.container import Container
 from matplotlib.figure import FigureBase
 from matplotlib.font_manager import FontProperties
 from matplotlib.legend import Legend
 from matplotlib.lines import Line2D
 from matplotlib.markers import MarkerStyle
-from matplotlib.offsetbox import VPacker, HPacker
+from matplotlib.offsetbox import DrawingArea, HPacker, TextArea, VPacker
 from matplotlib.patches import Patch
 
-from ._handlers import CircleHandler, RectHandler, BoxplotHandler
+from ._batch import make_batches
 from ._locs import Locs
-from .handles import RectItem, CircleItem, LineItem, BoxplotItem
+from ._proxy import make_proxy
+from ._register import default_handler_map
+from .handles import RectItem, LineItem, BoxplotItem
 
 _handlers = {
     # 'square': SquareItem,
@@ -46,43 +52,238 @@ _handle_marker = {
 }
 
 
-def _get_legend_handles(axs, legend_handler_map=None):
+# The colors of the labels taken from the handles, as in Legend
+_label_color_getters = {
+    "linecolor": [
+        "get_markerfacecolor",
+        "get_facecolor",
+        "get_markeredgecolor",
+        "get_edgecolor",
+        "get_color",
+    ],
+    "markerfacecolor": ["get_markerfacecolor", "get_facecolor"],
+    "mfc": ["get_markerfacecolor", "get_facecolor"],
+    "markeredgecolor": ["get_markeredgecolor", "get_edgecolor"],
+    "mec": ["get_markeredgecolor", "get_edgecolor"],
+}
+
+
+def _handle_label_color(handle, getter_names):
+    """The color of a label from its handle, None if it has no single color"""
+    if getattr(handle, "get_array", lambda: None)() is not None:
+        return None
+    for getter_name in getter_names:
+        getter = getattr(handle, getter_name, None)
+        if getter is None:
+            continue
+        color = getter()
+        if isinstance(color, np.ndarray):
+            if color.size == 0:
+                continue
+            if color.shape[0] == 1 or np.isclose(color, color[0]).all():
+                return color[0]
+            return None
+        if isinstance(color, str) and color.lower() == "none":
+            continue
+        if to_rgba(color)[3] == 0:
+            continue
+        return color
+    return None
+
+
+def _set_label_colors(labelcolor, handles, texts):
+    """Color the labels as :class:`Legend` does"""
+    if labelcolor is None:
+        return
+    if isinstance(labelcolor, str) and labelcolor in _label_color_getters:
+        getter_names = _label_color_getters[labelcolor]
+        for handle, text in zip(handles, texts):
+            color = _handle_label_color(handle, getter_names)
+            if color is not None:
+                text.set_color(color)
+    elif isinstance(labelcolor, str) and labelcolor == "none":
+        for text in texts:
+            text.set_color(labelcolor)
+    else:
+        for text, color in zip(texts, itertools.cycle(to_rgba_array(labelcolor))):
+            text.set_color(color)
+
+
+def _first_rgba(colors):
+    colors = np.asarray(colors)
+    if colors.ndim == 2:
+        return tuple(colors[0]) if len(colors) else None
+    return tuple(colors)
+
+
+def _style_fingerprint(handle):
+    """A cheap fingerprint of how a handle is drawn in the legend
+
+    The fingerprint includes the class, colors, marker, linestyle,
+    linewidth and hatch. The colors are compared as RGBA,
+    a collection or a container is represented by its first element.
+    """
+    handle_type = type(handle)
+    if isinstance(handle, Line2D):
+        return (
+            handle_type,
+            to_rgba(handle.get_color(), handle.get_alpha()),
+            str(handle.get_marker()),
+            handle.get_markersize(),
+            to_rgba(handle.get_markerfacecolor(), handle.get_alpha()),
+            to_rgba(handle.get_markeredgecolor(), handle.get_alpha()),
+            str(handle.get_linestyle()),
+            handle.get_linewidth(),
+        )
+    if isinstance(handle, Patch):
+        return (
+            handle_type,
+            tuple(handle.get_facecolor()),
+            tuple(handle.get_edgecolor()),
+            str(handle.get_linestyle()),
+            handle.get_linewidth(),
+            handle.get_hatch(),
+        )
+    if isinstance(handle, Collection):
+        paths = handle.get_paths()
+        sizes = handle.get_sizes() if hasattr(handle, "get_sizes") else ()
+        return (
+            handle_type,
+            _first_rgba(handle.get_facecolor()),
+            _first_rgba(handle.get_edgecolor()),
+            paths[0].vertices.tobytes() if len(paths) else None,
+            sizes[0] if len(sizes) else None,
+            str(handle.get_linestyle()[:1]),
+            tuple(np.atleast_1d(handle.get_linewidth())[:1]),
+            handle.get_hatch(),
+        )
+    if isinstance(handle, Container):
+        children = [c for c in handle if c is not None]
+        first = children[0] if children else None
+        if isinstance(first, (tuple, list)):
+            first = first[0] if first else None
+        if isinstance(first, (Line2D, Patch, Collection)):
+            return handle_type, len(children), _style_fingerprint(first)
+    # Compare other handles by identity
+    return id(handle)
+
+
+def _labeled(artists):
+    """Skip the artists without a label before anything else"""
+    for a in artists:
+        label = a.get_label()
+        if label and not label.startswith("_"):
+            yield a
+
+
+def _iter_handles(ax):
+    # support parasite axes:
+    for axx in (ax, *getattr(ax, "parasites", ())):
+        for a in _labeled(axx._children):
+            if isinstance(a, (Line2D, Patch, Collection)):
+                yield a
+        yield from _labeled(axx.containers)
+
+
+def _get_legend_handles(axs, legend_handler_map=None, dedupe=False):
     """
     Return a generator of artists that can be used as handles in
     a legend.
-    """
-    handles_original = []
-    for ax in axs:
-        handles_original += [
-            *(a for a in ax._children if isinstance(a, (Line2D, Patch, Collection))),
-            *ax.containers,
-        ]
-        # support parasite axes:
-        if hasattr(ax, "parasites"):
-            for axx in ax.parasites:
-                handles_original += [
-                    *(
-                        a
-                        for a in axx._children
-                        if isinstance(a, (Line2D, Patch, Collection))
-                    ),
-                    *axx.containers,
-                ]
 
+    Artists without a label or with a label starting with an underscore
+    are skipped before the handler is looked up, the lookup is cached
+    for each type of artist. If `dedupe` is True, only the first of the
+    artists with the same label and style fingerprint is returned.
+    """
     handler_map = Legend.get_default_handler_map()
 
     if legend_handler_map is not None:
-        handler_map = handler_map.copy()
-        handler_map.update(legend_handler_map)
+        handler_map = {**handler_map, **legend_handler_map}
 
-    has_handler = Legend.get_legend_handler
+    # Whether an artist type has a handler, resolved from its mro
+    type_has_handler = {}
+    seen = set()
 
-    for handle in handles_original:
-        label = handle.get_label()
-        if label != "_nolegend_" and has_handler(handler_map, handle):
+    for ax in axs:
+        for handle in _iter_handles(ax):
+            # A handler can be set for an instance
+            try:
+                has_handler = handle in handler_map
+            except TypeError:
+                has_handler = False
+            if not has_handler:
+                handle_type = type(handle)
+                has_handler = type_has_handler.get(handle_type)
+                if has_handler is None:
+                    has_handler = any(t in handler_map for t in handle_type.mro())
+                    type_has_handler[handle_type] = has_handler
+                if not has_handler:
+                    continue
+            if dedupe:
+                key = (handle.get_label(), _style_fingerprint(handle))
+                if key in seen:
+                    continue
+                seen.add(key)
             yield handle
 
 
+@lru_cache(maxsize=256)
+def _marker_of(handle):
+    """The marker of a handle name, None if it's not a marker"""
+    marker = _handle_marker.get(handle)
+    if marker is None:
+        try:
+            MarkerStyle(handle)
+        except Exception:
+            return None
+        marker = handle
+    return marker
+
+
+def _make_handle(handle, handle_size, fontsize, config):
+    """Create the handle from its name, the config is not modified"""
+    config = dict(config)
+    handler = _handlers.get(handle)
+    # Use predefined legend handler
+    if handler is not None:
+        return handler(**config)
+
+    marker = _marker_of(handle)
+    if marker is None:
+        # If it's not a marker
+        return handle
+    config.setdefault("markersize", fontsize * handle_size)
+    config.setdefault("color", "C0")
+
+    # handle parameters
+    ls = config.pop("ls", config.pop("linestyle", ""))
+    lw = config.pop("lw", config.pop("linewidth", 0))
+    config.setdefault("ls", ls)
+    config.setdefault("lw", lw)
+
+    fc = config.pop("fc", config.pop("facecolor", None))
+    ec = config.pop("ec", config.pop("edgecolor", None))
+    ew = config.pop("ew", config.pop("edgewidth", None))
+    config.setdefault("mfc", fc)
+    config.setdefault("mec", ec)
+    config.setdefault("mew", ew)
+
+    return Line2D([0], [0], marker=marker, **config)
+
+
+def _style_key(handle, config):
+    """The name and style of a handle, None if it's not hashable"""
+    if not isinstance(handle, str):
+        return None
+    key = (handle, tuple(sorted((config or {}).items())))
+    try:
+        hash(key)
+    except TypeError:
+        # e.g. a list of colors
+        return None
+    return key
+
+
 _default_alignment = {
     "top": "left",
     "bottom": "left",
@@ -132,6 +333,19 @@ class ListLegend(Legend):
     draw : bool
         Whether to draw the legend
     handler_map : dict
+    dedupe : bool, default: False
+        When the entries are collected from the axes, only keep the first
+        of the artists with the same label and style. The style is compared
+        by the class, colors, marker, linestyle, linewidth and hatch,
+        e.g. a facet grid of a figure shows each label once.
+    proxy_handles : bool, default: False
+        When the entries are collected from the axes, draw them from copies
+        of the style of the artists. The legend won't keep a reference to
+        the plotted data, its memory does not grow with the size of data.
+    batch_handles : bool, default: False
+        Draw the patch handles of the same type, and the filled markers,
+        e.g. 'circle' and 'square', as one collection, a legend with
+        many entries is drawn with a few draw calls.
     loc : str
         Apart from the default location code, you can add 'out' as prefix
         to place the legend ouside the axes.
@@ -194,6 +408,9 @@ class ListLegend(Legend):
         titlepad=0.5,
         draw=True,
         handler_map=None,
+        dedupe=False,
+        proxy_handles=False,
+        batch_handles=False,
         loc=None,
         deviation=0.05,
         bbox_to_anchor=None,
@@ -247,31 +464,26 @@ class ListLegend(Legend):
 
         self.handlelength = val_or_rc(handlelength, "legend.handlelength")
         self.handleheight = val_or_rc(handleheight, "legend.handleheight")
-        handle_size = min(self.handleheight, self.handlelength)
 
         legend_handles = []
         legend_labels = []
+        legend_keys = None
 
         if (legend_items is None) & (handles is None) & (labels is None):
             legend_handles = []
             legend_labels = []
-            for handle in _get_legend_handles(axes, handler_map):
-                label = handle.get_label()
-                if label and not label.startswith("_"):
-                    legend_handles.append(handle)
-                    legend_labels.append(label)
+            # The number of points of an entry
+            n_points = max(
+                kwargs.get("numpoints") or mpl.rcParams["legend.numpoints"],
+                kwargs.get("scatterpoints") or mpl.rcParams["legend.scatterpoints"],
+            )
+            for handle in _get_legend_handles(axes, handler_map, dedupe=dedupe):
+                if proxy_handles and not (handler_map and handle in handler_map):
+                    handle = make_proxy(handle, n_points)
+                legend_handles.append(handle)
+                legend_labels.append(handle.get_label())
         elif legend_items is not None:
-            for item in legend_items:
-                if len(item) == 2:
-                    handle, label = item
-                    handle_config = None
-                else:
-                    item = item[:3]
-                    handle, label, handle_config = item
-                legend_handles.append(
-                    self._parse_handler(handle, handle_size, config=handle_config)
-                )
-                legend_labels.append(label)
+            legend_handles, legend_labels, legend_keys = self._parse_items(legend_items)
         elif (handles is not None) & (labels is None):
             legend_handles = handles
             legend_labels = [h.get_label() for h in handles]
@@ -295,15 +507,10 @@ class ListLegend(Legend):
                 bbox_transform=bbox_transform,
                 deviation=deviation,
             )
-        if handler_map is None:
-            handler_map = {}
-        handler_map.update(
-            {
-                RectItem: RectHandler(),
-                CircleItem: CircleHandler(),
-                BoxplotItem: BoxplotHandler(),
-            }
-        )
+        if handler_map is not None:
+            # Don't modify the map of the user, without one
+            # the handlers registered to Legend are used directly
+            handler_map = {**default_handler_map, **handler_map}
         default_kwargs = dict(
             loc=loc,
             bbox_to_anchor=bbox_to_anchor,
@@ -325,6 +532,22 @@ class ListLegend(Legend):
             alignment = _default_alignment[self._title_loc]
         self._alignment = alignment
         self._title_layout()
+        self._markerfirst = kwargs.get("markerfirst", True)
+        ncols = kwargs.get("ncols", 1)
+        self._ncols_option = ncols if ncols != 1 else kwargs.get("ncol", 1)
+        labelcolor = kwargs.get("labelcolor")
+        if labelcolor is None:
+            labelcolor = mpl.rcParams["legend.labelcolor"]
+        # Without a labelcolor, the labels use the text color
+        self._labelcolor = None if labelcolor == "None" else labelcolor
+        self._reverse = kwargs.get("reverse", False)
+        if legend_keys is None:
+            legend_keys = list(zip(legend_handles, legend_labels))
+        if self._reverse:
+            legend_keys = legend_keys[::-1]
+        self._entries = self._collect_entries(legend_keys)
+        self._batch_handles = batch_handles
+        self._handle_batches = make_batches(self) if batch_handles else []
 
         if draw:
             # Attach as legend element
@@ -339,41 +562,155 @@ class ListLegend(Legend):
             else:
                 fig.legends.append(self)
 
+    def _parse_items(self, legend_items):
+        """Return the handles, labels and keys of the entries
+
+        The handles of the same name and style are created once,
+        a legend only copies the style of a handle.
+        The key of an entry is its label and the style or the handle.
+        """
+        handle_size = min(self.handleheight, self.handlelength)
+        # Only shared within the items, the handles take defaults from rcParams
+        created = {}
+        handles = []
+        labels = []
+        keys = []
+        for item in legend_items:
+            if len(item) == 2:
+                handle, label = item
+                handle_config = None
+            else:
+                handle, label, handle_config = item[:3]
+            key = _style_key(handle, handle_config)
+            if key is None:
+                parsed = self._parse_handler(handle, handle_size, handle_config)
+                key = parsed
+            elif key in created:
+                parsed = created[key]
+            else:
+                parsed = self._parse_handler(handle, handle_size, handle_config)
+                created[key] = parsed
+            handles.append(parsed)
+            labels.append(label)
+            keys.append((key, label))
+        return handles, labels, keys
+
+    def _collect_entries(self, keys):
+        """Pair the boxes created by the legend with the key of their entry"""
+        itemboxes = iter(
+            itembox
+            for column in self._legend_handle_box.get_children()
+            for itembox in column.get_children()
+        )
+        texts = iter(self.texts)
+        entries = []
+        for key, artist in zip(keys, self.legend_handles):
+            # The handles without a handler are skipped by the legend
+            if artist is not None:
+                entries.append((key, next(itemboxes), artist, next(texts)))
+        return entries
+
+    def _make_entry(self, key, handle, label, handler_map):
+        """Create the boxes of an entry, as :class:`Legend` does"""
+        handler = self.get_legend_handler(handler_map, handle)
+        if handler is None:
+            return None
+        fontsize = self._fontsize
+        descent = 0.35 * fontsize * (self.handleheight - 0.7)
+        height = fontsize * self.handleheight - descent
+        textbox = TextArea(
+            label,
+            multilinebaseline=True,
+            textprops=dict(
+                verticalalignment="baseline",
+                horizontalalignment="left",
+                fontproperties=self.prop,
+            ),
+        )
+        handlebox = DrawingArea(
+            width=self.handlelength * fontsize,
+            height=height,
+            xdescent=0.0,
+            ydescent=descent,
+        )
+        artist = handler.legend_artist(self, handle, fontsize, handlebox)
+        children = [handlebox, textbox] if self._markerfirst else [textbox, handlebox]
+        itembox = HPacker(
+            pad=0,
+            sep=self.handletextpad * fontsize,
+            children=children,
+            align="baseline",
+        )
+        return key, itembox, artist, textbox._text
+
+    def _pack_entries(self):
+        """Pack the entries into columns in the handle box"""
+        fontsize = self._fontsize
+        itemboxes = [itembox for _, itembox, _, _ in self._entries]
+        self._ncols = 1 if len(itemboxes) < 2 else self._ncols_option
+        alignment = "baseline" if self._markerfirst else "right"
+        columnbox = []
+        for column in filter(len, np.array_split(itemboxes, self._ncols)):
+            box = VPacker(
+                pad=0,
+                sep=self.labelspacing * fontsize,
+                align=alignment,
+                children=list(column),
+            )
+            # The legend may be removed from the figure, e.g. when it's stacked
+            box.set_figure(self._legend_handle_box.figure)
+            columnbox.append(box)
+        self._legend_handle_box._children = columnbox
+
+    def set_items(self, legend_items):
+        """Update the entries of the legend in place
+
+        An entry with the same handle and label as a current entry is reused,
+        only the new entries are created. This is faster than creating a
+        new legend when a few entries change, e.g. a live-updating figure.
+
+        Parameters
+        ----------
+        legend_items : list of tuple
+            The (handle, label) or (handle, label, config)
+            of each entry, as the `legend_items` of :class:`ListLegend`.
+
+        """
+        handles, labels, keys = self._parse_items(legend_items)
+        if self._reverse:
+            handles, labels, keys = handles[::-1], labels[::-1], keys[::-1]
+        for batch in self._handle_batches:
+            batch.restore()
+
+        current = {}
+        for entry in self._entries:
+            current.setdefault(entry[0], []).append(entry)
+        handler_map = self.get_legend_handler_map()
+        entries = []
+        for handle, label, key in zip(handles, labels, keys):
+            reused = current.get(key)
+            if reused:
+                entries.append(reused.pop(0))
+                continue
+            entry = self._make_entry(key, handle, label, handler_map)
+            if entry is not None:
+                entries.append(entry)
+
+        self._entries = entries
+        self.legend_handles = [artist for _, _, artist, _ in entries]
+        self.texts = [text for _, _, _, text in entries]
+        # The colors of a list follow the position of the labels
+        _set_label_colors(self._labelcolor, self.legend_handles, self.texts)
+        self._pack_entries()
+        if self._batch_handles:
+            self._handle_batches = make_batches(self)
+        self.stale = True
+
     def _parse_handler(self, handle, handle_size, config=None):
         if not isinstance(handle, str):
             return handle
-        if config is None:
-            config = {}
-        handler = _handlers.get(handle)
-        # Use predefined legend handler
-        if handler is not None:
-            return _handlers[handle].__call__(**config)
-
-        marker = _handle_marker.get(handle)
-        if marker is None:
-            # If it's not a marker
-            try:
-                MarkerStyle(handle)
-            except Exception:
-                return handle
-            marker = handle
-        config.setdefault("markersize", self._fontsize * handle_size)
-        config.setdefault("color", "C0")
-
-        # handle parameters
-        ls = config.pop("ls", config.pop("linestyle", ""))
-        lw = config.pop("lw", config.pop("linewidth", 0))
-        config.setdefault("ls", ls)
-        config.setdefault("lw", lw)
-
-        fc = config.pop("fc", config.pop("facecolor", None))
-        ec = config.pop("ec", config.pop("edgecolor", None))
-        ew = config.pop("ew", config.pop("edgewidth", None))
-        config.setdefault("mfc", fc)
-        config.setdefault("mec", ec)
-        config.setdefault("mew", ew)
-
-        return Line2D([0], [0], marker=marker, **config)
+        config = {} if config is None else config
+        return _make_handle(handle, handle_size, self._fontsize, config)
 
     def set_title_loc(self, loc):
         self._title_loc = loc
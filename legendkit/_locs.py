@@ -1,4 +1,6 @@
+import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.transforms import Bbox, BboxBase, BboxTransformTo
 
 
 def add_x(x, y, offset):
@@ -21,6 +23,32 @@ def blank(x, y, offset):
     return x, y
 
 
+class _UnionBbox(BboxBase):
+    """The union of the bounding boxes of several axes
+
+    It's updated when an axes is moved, e.g. by the layout engine.
+    """
+
+    def __init__(self, axes, **kwargs):
+        super().__init__(**kwargs)
+        self._bboxes = [ax.bbox for ax in axes]
+        self.set_children(*self._bboxes)
+        self._points = None
+
+    def get_points(self):
+        if self._invalid or self._points is None:
+            self._points = Bbox.union(self._bboxes).get_points()
+            self._invalid = 0
+        return self._points
+
+
+def axes_list(ax):
+    """Return the axes in a list or an array of axes, otherwise None"""
+    if isinstance(ax, (list, tuple, np.ndarray)):
+        return list(np.ravel(np.asarray(ax, dtype=object)))
+    return None
+
+
 class Locs:
     combs = {
         "out upper left": ("lower left", (0, 1), add_y),
@@ -120,8 +148,12 @@ class Locs:
                 bbox = replacement[1]
                 offset_func = replacement[2]
                 bbox_to_anchor = offset_func(*bbox, deviation)
+                axes = axes_list(ax)
                 if isinstance(ax, Axes):
                     bbox_transform = ax.transAxes
+                elif axes is not None:
+                    # Place relative to the area of all the axes
+                    bbox_transform = BboxTransformTo(_UnionBbox(axes))
                 else:
                     fig = ax.get_figure()
                     bbox_transform = fig.transSubfigure
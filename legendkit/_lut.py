@@ -0,0 +1,157 @@
+"""Cache of colormap lookup tables
+
+The RGBA lookup table of a colormap is evaluated once and shared
+by every :class:`ColorArt` that use the same colormap.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+import weakref
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib import colors
+
+LUTCacheInfo = namedtuple(
+    "LUTCacheInfo", ["hits", "misses", "maxsize", "size", "nbytes"]
+)
+
+_LUT_CACHE_MAXSIZE = 128
+
+_lut_cache = OrderedDict()
+_lut_lock = Lock()
+_lut_stats = {"hits": 0, "misses": 0}
+# The lookup tables of the registered colormaps, to compare colormap objects
+_registered_luts = {}
+
+
+def get_colormap(cmap):
+    if isinstance(cmap, colors.Colormap):
+        return cmap
+    return mpl.colormaps.get(cmap)
+
+
+def _registered_lut(name):
+    """The lookup table of a registered colormap, None if it's not registered"""
+    lut = _registered_luts.get(name)
+    if lut is None:
+        try:
+            # A copy of the registered colormap
+            cmap = mpl.colormaps[name]
+        except KeyError:
+            return None
+        cmap._init()
+        lut = _registered_luts[name] = cmap._lut
+    return lut
+
+
+def _cmap_key(cmap):
+    """Identify a colormap by its registered name, or by the object itself"""
+    name = cmap.name
+    registered = _registered_lut(name)
+    if registered is not None:
+        if not cmap._isinit:
+            cmap._init()
+        # A derived colormap may keep the name, e.g. with_alpha or an edited copy
+        if cmap._lut.shape == registered.shape and np.array_equal(
+            cmap._lut, registered
+        ):
+            return name
+    return id(cmap), name
+
+
+def _evict(cmap_key):
+    with _lut_lock:
+        for key in [k for k in _lut_cache if k[0] == cmap_key]:
+            del _lut_cache[key]
+
+
+def get_lut(cmap, flip=False, alpha=None, n=None):
+    """Return the RGBA lookup table of a colormap as uint8 array
+
+    The array is read-only and shared, copy it before modification.
+
+    Parameters
+    ----------
+    cmap : str or :class:`Colormap <matplotlib.colors.Colormap>`
+    flip : bool
+        Reverse the lookup table
+    alpha : float
+        Override the alpha channel
+    n : int
+        The number of colors, default to the size of the colormap.
+        Fewer colors are picked from the full lookup table, more colors
+        are only evaluated for continuous colormaps.
+
+    Returns
+    -------
+    np.ndarray of shape (n, 4)
+
+    """
+    # A colormap name is not resolved when its table is cached
+    cmap_key = cmap if isinstance(cmap, str) else _cmap_key(cmap)
+    key = (cmap_key, n, bool(flip), alpha)
+    with _lut_lock:
+        lut = _lut_cache.get(key)
+        if lut is not None:
+            _lut_cache.move_to_end(key)
+            _lut_stats["hits"] += 1
+            return lut
+        _lut_stats["misses"] += 1
+
+    cmap = get_colormap(cmap)
+    if n is None or isinstance(cmap, colors.ListedColormap):
+        n = cmap.N if n is None else min(n, cmap.N)
+    if isinstance(key[0], tuple):
+        # Unregistered colormap, drop its tables when it's garbage collected
+        # so the id cannot be reused by another colormap
+        weakref.finalize(cmap, _evict, key[0])
+
+    if n < cmap.N:
+        full = get_lut(cmap, flip=flip, alpha=alpha)
+        lut = full[np.round(np.linspace(0, cmap.N - 1, n)).astype(int)]
+    else:
+        if n > cmap.N:
+            cmap = cmap.resampled(n)
+        lut = cmap(np.arange(n), bytes=True)
+        if flip:
+            lut = lut[::-1].copy()
+        if alpha is not None:
+            lut[:, -1] = np.round(alpha * 255)
+    lut.setflags(write=False)
+
+    with _lut_lock:
+        _lut_cache[key] = lut
+        while len(_lut_cache) > _LUT_CACHE_MAXSIZE:
+            _lut_cache.popitem(last=False)
+    return lut
+
+
+def lut_cache_info():
+    """Report the statistics of the colormap lookup table cache
+
+    Returns
+    -------
+    LUTCacheInfo
+        A named tuple of (hits, misses, maxsize, size, nbytes)
+
+    """
+    with _lut_lock:
+        return LUTCacheInfo(
+            _lut_stats["hits"],
+            _lut_stats["misses"],
+            _LUT_CACHE_MAXSIZE,
+            len(_lut_cache),
+            sum(lut.nbytes for lut in _lut_cache.values()),
+        )
+
+
+def clear_lut_cache():
+    """Clear the colormap lookup table cache and its statistics"""
+    with _lut_lock:
+        _lut_cache.clear()
+        _registered_luts.clear()
+        _lut_stats["hits"] = 0
+        _lut_stats["misses"] = 0
@@ -24,6 +24,7 @@ from matplotlib.patches import Circle, Polygon
 
 from ._colorart import DrawingArea
 from ._locs import Locs
+from ._text import measure_text
 
 
 _ORIENT_OPTIONS = {"horizontal", "vertical"}
@@ -387,10 +388,11 @@ class PairedSizeLegend(Artist):
         d_min = float(np.sqrt(s_min))
         d_max = float(np.sqrt(s_max))
         r_min, r_max = d_min / 2, d_max / 2
-        # rough label width in points (0.6 * fontsize per char is a reasonable
-        # mono-ish estimate; refined later by matplotlib via offsetbox).
-        approx_char_w = 0.6 * self._fontsize
-        max_label_w = approx_char_w * max(len(min_label), len(max_label))
+        # label width in points, measured from the font metrics
+        dpi = 72 if self.figure is None else self.figure.dpi
+        max_label_w = max(
+            measure_text(label, self.prop, dpi)[0] for label in (min_label, max_label)
+        )
         if gap is None:
             # default gap: enough so the two labels don't collide when stacked
             # below circles (label width straddles each circle center).
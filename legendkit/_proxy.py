@@ -0,0 +1,131 @@
+"""Style-only copies of the legend handles
+
+A legend handle is drawn by copying the style of the original artist,
+for a collection mapped from data, the data array is copied along.
+A proxy only keeps what the legend handler needs, so the legend does not
+hold a reference to the plotted data.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from matplotlib.collections import (
+    Collection,
+    LineCollection,
+    PathCollection,
+    PolyCollection,
+)
+from matplotlib.container import BarContainer, ErrorbarContainer
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch, StepPatch
+
+
+def _keep(handle, n):
+    return handle
+
+
+def _proxy_line(handle, n):
+    proxy = Line2D([], [])
+    proxy.update_from(handle)
+    return proxy
+
+
+def _proxy_patch(handle, n):
+    proxy = Patch()
+    proxy.update_from(handle)
+    return proxy
+
+
+def _proxy_collection(handle, n):
+    if isinstance(handle, PathCollection):
+        # The legend interpolates the markers between the smallest and largest
+        sizes = handle.get_sizes()
+        if len(sizes) > 1:
+            sizes = np.unique([np.min(sizes), np.max(sizes)])
+        proxy = PathCollection(handle.get_paths()[:1], sizes=sizes)
+    elif isinstance(handle, LineCollection):
+        proxy = LineCollection([])
+    elif isinstance(handle, PolyCollection):
+        proxy = PolyCollection([])
+    else:
+        return handle
+    # e.g. the markers of a scatter are scaled in display space
+    if handle.is_transform_set():
+        proxy.set_transform(handle.get_transform())
+    facecolors, edgecolors = _collection_colors(handle, n)
+    if np.ndim(handle.get_alpha()) == 0:
+        proxy.set_alpha(handle.get_alpha())
+    proxy.set_facecolor(facecolors)
+    proxy.set_edgecolor(edgecolors)
+    proxy.set_linewidth(handle.get_linewidth()[:n])
+    proxy.set_linestyle(handle.get_linestyle()[:n])
+    proxy.set_hatch(handle.get_hatch())
+    return proxy
+
+
+def _collection_colors(handle, n):
+    """The first n colors of a collection, only these are mapped from the data"""
+    facecolors = handle.get_facecolor()[:n]
+    edgecolors = handle.get_edgecolor()[:n]
+    A = handle.get_array()
+    if A is not None:
+        handle._set_mappable_flags()
+        alpha = handle.get_alpha()
+        if np.ndim(alpha) > 0:
+            alpha = np.ravel(alpha)[:n]
+        mapped = handle.to_rgba(np.ma.ravel(A)[:n], alpha)
+        if handle._face_is_mapped:
+            facecolors = mapped
+        if handle._edge_is_mapped:
+            edgecolors = mapped
+    return facecolors, edgecolors
+
+
+def _proxy_bar(handle, n):
+    patches = [_proxy_patch(p, n) for p in handle.patches[:1]]
+    return BarContainer(patches)
+
+
+def _proxy_errorbar(handle, n):
+    data_line, caplines, barlinecols = handle.lines
+    return ErrorbarContainer(
+        (
+            None if data_line is None else make_proxy(data_line, n),
+            tuple(make_proxy(c, n) for c in caplines),
+            tuple(make_proxy(c, n) for c in barlinecols),
+        ),
+        has_xerr=handle.has_xerr,
+        has_yerr=handle.has_yerr,
+    )
+
+
+_proxy_makers = {
+    StepPatch: _keep,
+    BarContainer: _proxy_bar,
+    ErrorbarContainer: _proxy_errorbar,
+    Line2D: _proxy_line,
+    Patch: _proxy_patch,
+    Collection: _proxy_collection,
+}
+
+
+def make_proxy(handle, n=1):
+    """Return a copy of the style of a handle without its data
+
+    Parameters
+    ----------
+    handle : artist or container
+        Other types of handle are returned as is.
+    n : int
+        The number of colors kept for a collection,
+        the legend cycles through them for the points of an entry.
+
+    """
+    for handle_type in type(handle).mro():
+        maker = _proxy_makers.get(handle_type)
+        if maker is not None:
+            proxy = maker(handle, n)
+            if proxy is not handle:
+                proxy.set_label(handle.get_label())
+            return proxy
+    return handle
@@ -1,6 +1,18 @@
+from types import MappingProxyType
+
 from ._handlers import SquareHandler, RectHandler, CircleHandler, BoxplotHandler
 from .handles import SquareItem, RectItem, CircleItem, BoxplotItem
 
+# The handlers have no state, the same instances are used by every legend
+default_handler_map = MappingProxyType(
+    {
+        SquareItem: SquareHandler(),
+        RectItem: RectHandler(),
+        CircleItem: CircleHandler(),
+        BoxplotItem: BoxplotHandler(),
+    }
+)
+
 
 def register():
     import matplotlib as mpl
@@ -38,9 +50,6 @@ def register():
     Legend.set_default_handler_map(
         {
             **_default_handlers,
-            SquareItem: SquareHandler(),
-            RectItem: RectHandler(),
-            CircleItem: CircleHandler(),
-            BoxplotItem: BoxplotHandler(),
+            **default_handler_map,
         }
     )
@@ -0,0 +1,46 @@
+"""Measure text without the figure canvas
+
+The text is laid out by a detached :class:`Text <matplotlib.text.Text>`
+with a tiny scratch renderer, so no full-figure pixel buffer is allocated
+and the artist tree of the figure is left untouched.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import matplotlib as mpl
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+
+
+@lru_cache(maxsize=None)
+def _scratch(dpi):
+    """A detached figure and a 1x1 pixel renderer at the given dpi"""
+    return Figure(dpi=dpi), RendererAgg(1, 1, dpi)
+
+
+@lru_cache(maxsize=4096)
+def _measure_text(text, prop, dpi, usetex):
+    fig, renderer = _scratch(dpi)
+    t = Text(0, 0, text, fontproperties=prop, usetex=usetex)
+    t.set_figure(fig)
+    bbox = t.get_window_extent(renderer)
+    return bbox.width * 72 / dpi, bbox.height * 72 / dpi
+
+
+def measure_text(text, prop, dpi=72):
+    """Return the width and height of a text in points
+
+    Parameters
+    ----------
+    text : str
+    prop : :class:`FontProperties <matplotlib.font_manager.FontProperties>`
+    dpi : float
+        The resolution where the text will be rendered,
+        font hinting makes the size slightly depends on it.
+
+    """
+    # FontProperties is mutable, the cache must hold a copy
+    return _measure_text(text, prop.copy(), dpi, mpl.rcParams["text.usetex"])
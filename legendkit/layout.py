@@ -6,6 +6,7 @@ from matplotlib.legend import Legend
 from matplotlib.offsetbox import VPacker, HPacker, AnchoredOffsetbox, TextArea
 from matplotlib.patches import FancyBboxPatch
 
+from ._bivariate import BivariateColorArt
 from ._colorart import ColorArt
 from ._locs import Locs
 from ._paired_size import PairedSizeLegend
@@ -23,8 +24,10 @@ def _create_children(artists: List[Artist]):
         elif isinstance(art, AnchoredOffsetbox):
             children += art.get_children()
         elif isinstance(art, ColorArt):
-            children += art.get_children().get_children()
-        elif isinstance(art, PairedSizeLegend):
+            art._ensure_box()
+            (box,) = art.get_children()
+            children += box.get_children()
+        elif isinstance(art, (PairedSizeLegend, BivariateColorArt)):
             children.append(art._final_pack)
         elif isinstance(art, Artist):
             children.append(art)
@@ -32,7 +35,11 @@ def _create_children(artists: List[Artist]):
             raise TypeError(f"Cannot parse object {str(art)} with type {type(art)}")
         try:
             # remove artist from the canvas to avoid rendering overlay
-            art.remove()
+            if isinstance(art, ColorArt):
+                # The box is reused, keep the colorart updated with its mappable
+                art._detach()
+            else:
+                art.remove()
         except Exception:
             try:
                 art.set_visible(False)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.colors import BoundaryNorm, LogNorm, Normalize, NoNorm
+
+from legendkit import bivariate_colorart, vstack, cat_legend
+from legendkit._gradient import GradientImage
+
+matplotlib.use("Agg")
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    yield
+    plt.close("all")
+
+
+def make_lut(n=256):
+    x, y = np.meshgrid(np.linspace(0, 1, n), np.linspace(0, 1, n))
+    return np.dstack([x, 0.5 * (x + y), y])
+
+
+def get_images(art):
+    canvas = art._final_pack
+    return [c for c in canvas.get_children() if isinstance(c, GradientImage)]
+
+
+# ------------------------------------------------------------------
+# Basic construction
+# ------------------------------------------------------------------
+
+
+def test_bivariate_single_image():
+    _, ax = plt.subplots()
+    art = bivariate_colorart(
+        make_lut(), Normalize(0, 10), LogNorm(1, 1000), ax=ax, xlabel="X", ylabel="Y"
+    )
+    images = get_images(art)
+    assert len(images) == 1
+    data = images[0].get_array()
+    assert data.shape == (256, 256, 4)
+    assert data.dtype == np.uint8
+    # the first row is the lowest y
+    np.testing.assert_array_equal(data[0, 0], [0, 0, 0, 255])
+    ax.figure.canvas.draw()
+
+
+def test_bivariate_ticks():
+    _, ax = plt.subplots()
+    art = bivariate_colorart(
+        make_lut(8), Normalize(0, 10), BoundaryNorm([0, 1, 5], 2), ax=ax, yticks=[1]
+    )
+    labels = [
+        t.get_text() for t in art._final_pack.get_children() if hasattr(t, "get_text")
+    ]
+    assert "10" in labels
+    assert "1" in labels
+
+
+@pytest.mark.parametrize("fmt", ["png", "svg", "pdf"])
+def test_bivariate_save(tmp_path, fmt):
+    _, ax = plt.subplots()
+    bivariate_colorart(make_lut(), ax=ax, title="Key", xlabel="X", ylabel="Y")
+    ax.figure.savefig(tmp_path / f"bivariate.{fmt}")
+
+
+def test_bivariate_stack():
+    fig, ax = plt.subplots()
+    art = bivariate_colorart(make_lut(16), draw=False)
+    assert art.figure is None
+    leg = cat_legend(ax=ax, colors=["red", "blue"], labels=["A", "B"])
+    vstack([leg, art], ax=ax)
+    fig.canvas.draw()
+
+
+def test_bivariate_invalid():
+    _, ax = plt.subplots()
+    with pytest.raises(ValueError):
+        bivariate_colorart(np.zeros((4, 4)), ax=ax)
+    with pytest.raises(ValueError):
+        bivariate_colorart(make_lut(4), Normalize(), ax=ax)
+    with pytest.raises(ValueError):
+        bivariate_colorart(make_lut(4), NoNorm(), ax=ax)
@@ -2,7 +2,8 @@ import numpy as np
 import pytest
 import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib.colors import BoundaryNorm, LogNorm
+from matplotlib.colors import BoundaryNorm, LogNorm, NoNorm, SymLogNorm
+from matplotlib.text import Text
 
 from legendkit import colorart
 
@@ -192,3 +193,573 @@ def test_colorart_remove():
     ax, m = make_mappable()
     ca = colorart(m, ax=ax)
     ca.remove()  # should not raise
+
+
+# ------------------------------------------------------------------
+# Gradient rendering
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
+def test_colorart_gradient_single_image(orientation):
+    from legendkit._gradient import GradientImage
+
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax, orientation=orientation, flip=True)
+    canvas = ca._cbar_box.get_children()[0]
+    images = [c for c in canvas.get_children() if isinstance(c, GradientImage)]
+    assert len(images) == 1
+    data = images[0].get_array()
+    assert max(data.shape[:2]) == m.cmap.N
+    # flipped, the first color is the end of colormap
+    np.testing.assert_array_equal(
+        data.reshape(-1, 4)[0], m.cmap(m.cmap.N - 1, bytes=True)
+    )
+
+
+@pytest.mark.parametrize("fmt", ["png", "svg", "pdf"])
+@pytest.mark.parametrize("rasterized", [True, False])
+def test_colorart_gradient_save(tmp_path, fmt, rasterized):
+    ax, m = make_mappable()
+    colorart(m, ax=ax, rasterized=rasterized)
+    ax.figure.savefig(tmp_path / f"colorart.{fmt}")
+
+
+def test_colorart_boundarynorm_blocks():
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import ListedColormap
+
+    cmap = ListedColormap(["red"] * 3 + ["blue"] * 2)
+    norm = BoundaryNorm(np.arange(6), ncolors=5)
+    ax, m = make_mappable(cmap=cmap, norm=norm)
+    ca = colorart(m, ax=ax)
+    blocks = [c for c in ca._canvas.get_children() if isinstance(c, PolyCollection)]
+    assert len(blocks) == 1
+    np.testing.assert_allclose(blocks[0].get_facecolor()[:, :3], [[1, 0, 0], [0, 0, 1]])
+    ax.figure.canvas.draw()
+
+
+@pytest.mark.parametrize("spacing", ["uniform", "proportional"])
+def test_colorart_boundarynorm_flip(spacing):
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import ListedColormap
+
+    def red_center(flip):
+        cmap = ListedColormap(["red", "blue"])
+        norm = BoundaryNorm([0, 1, 5], ncolors=2)
+        ax, m = make_mappable(cmap=cmap, norm=norm)
+        ca = colorart(m, ax=ax, spacing=spacing, flip=flip)
+        (blocks,) = [
+            c for c in ca._canvas.get_children() if isinstance(c, PolyCollection)
+        ]
+        red = blocks.get_facecolor()[:, 0] == 1
+        (path,) = np.asarray(blocks.get_paths(), dtype=object)[red]
+        return path.vertices[:, 1].mean() / ca.height
+
+    # red is at the bottom, flipped at the top
+    assert red_center(False) < 0.5 < red_center(True)
+
+
+@pytest.mark.parametrize("cmap, discrete", [("tab10", True), ("viridis", False)])
+def test_colorart_listed_cmap_blocks(cmap, discrete):
+    from matplotlib.collections import PolyCollection
+
+    ax, m = make_mappable(cmap=cmap)
+    ca = colorart(m, ax=ax)
+    assert isinstance(ca._gradient, PolyCollection) == discrete
+    ax.figure.canvas.draw()
+
+
+def test_merge_runs():
+    from legendkit._gradient import merge_runs
+
+    colors = np.array([[0, 0, 0, 1]] * 2 + [[1, 1, 1, 1]] + [[0, 0, 0, 1]] * 3)
+    np.testing.assert_array_equal(merge_runs(colors), [0, 2, 3])
+    assert len(merge_runs(np.empty((0, 4)))) == 0
+
+
+def test_drawing_area_single_raster_session(monkeypatch, tmp_path):
+    from matplotlib.backends.backend_mixed import MixedModeRenderer
+    from matplotlib.offsetbox import AnchoredOffsetbox
+    from matplotlib.patches import Rectangle
+    from legendkit._colorart import DrawingArea
+
+    sessions = []
+    start = MixedModeRenderer.start_rasterizing
+
+    def start_rasterizing(self):
+        sessions.append(self)
+        start(self)
+
+    monkeypatch.setattr(MixedModeRenderer, "start_rasterizing", start_rasterizing)
+
+    fig, ax = plt.subplots()
+    da = DrawingArea(30, 30, clip=True)
+    for i in range(3):
+        rect = Rectangle((i * 10, 0), 10, 30, fc=f"C{i}")
+        rect.set_rasterized(True)
+        da.add_artist(rect)
+    da.add_artist(Text(0, 0, "text"))
+    ax.add_artist(AnchoredOffsetbox("center", child=da))
+    fig.savefig(tmp_path / "raster.pdf")
+    assert len(sessions) == 1
+    # the clip path is reused across draws
+    tpath = da._clip_tpath
+    fig.savefig(tmp_path / "raster.svg")
+    assert da._clip_tpath is tpath
+    assert all(c._clippath is tpath for c in da.get_children())
+
+
+# ------------------------------------------------------------------
+# Colormap lookup table cache
+# ------------------------------------------------------------------
+
+
+def test_lut_cache_shared():
+    from legendkit import clear_lut_cache, lut_cache_info
+
+    clear_lut_cache()
+    for _ in range(3):
+        ax, m = make_mappable(cmap="viridis")
+        colorart(m, ax=ax)
+    info = lut_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.size == 1
+    assert info.nbytes == 256 * 4
+    clear_lut_cache()
+    assert lut_cache_info().size == 0
+
+
+def test_lut_cache_key():
+    from matplotlib.colors import ListedColormap
+    from legendkit._lut import get_lut
+
+    lut = get_lut("viridis")
+    assert lut.dtype == np.uint8
+    assert not lut.flags.writeable
+    np.testing.assert_array_equal(get_lut("viridis", flip=True), lut[::-1])
+    assert (get_lut("viridis", alpha=0.5)[:, -1] == 128).all()
+    # a custom colormap with a registered name is not mixed up
+    custom = ListedColormap(["red", "blue"], name="viridis")
+    np.testing.assert_array_equal(get_lut(custom)[:, 0], [255, 0])
+    # so is a colormap derived from a registered one
+    derived = matplotlib.colormaps["viridis"].with_alpha(0.3)
+    assert (get_lut(derived)[:, -1] == 76).all()
+    edited = matplotlib.colormaps["viridis"].copy()
+    edited.colors = ["red"] * 256
+    assert (get_lut(edited)[:, 0] == 255).all()
+
+
+def test_lut_samples():
+    from legendkit._lut import get_lut
+
+    lut = get_lut("viridis")
+    small = get_lut("viridis", n=16)
+    assert small.shape == (16, 4)
+    np.testing.assert_array_equal(small[[0, -1]], lut[[0, -1]])
+    # a continuous colormap is evaluated with more colors
+    assert get_lut("RdBu", n=1000).shape == (1000, 4)
+    # a listed colormap has no more colors to offer
+    assert get_lut("viridis", n=1000).shape == (256, 4)
+
+
+@pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
+def test_colorart_samples_auto(orientation):
+    ax, m = make_mappable(cmap="RdBu")
+    ca = colorart(m, ax=ax, samples="auto", orientation=orientation)
+    gradient = ca._gradient
+    fig = ax.figure
+    fig.set_dpi(72)
+    fig.canvas.draw()
+    n_low = len(gradient.get_array().reshape(-1, 4))
+    assert n_low == int(np.ceil(max(ca.width, ca.height)))
+    fig.set_dpi(600)
+    fig.canvas.draw()
+    n_high = len(gradient.get_array().reshape(-1, 4))
+    assert n_high > n_low
+
+    ca = colorart(m, ax=ax, samples="auto", max_samples=100)
+    fig.canvas.draw()
+    assert len(ca._gradient.get_array().reshape(-1, 4)) == 100
+
+
+def test_colorart_samples_fixed():
+    ax, m = make_mappable(cmap="RdBu")
+    ca = colorart(m, ax=ax, samples=10)
+    assert ca._gradient.get_array().shape == (10, 1, 4)
+    with pytest.raises(ValueError):
+        colorart(m, ax=ax, samples=0)
+
+
+# ------------------------------------------------------------------
+# Text measurement
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("text", ["0.5", "1000", r"$\mathdefault{10^{-2}}$", "a\nb"])
+def test_measure_text_matches_renderer(text):
+    from matplotlib.font_manager import FontProperties
+    from legendkit._text import measure_text
+
+    fig = plt.figure(dpi=150)
+    prop = FontProperties(size=12)
+    t = fig.text(0, 0, text, fontproperties=prop)
+    bbox = t.get_window_extent(fig.canvas.get_renderer())
+    w, h = measure_text(text, prop, dpi=fig.dpi)
+    assert w == pytest.approx(bbox.width * 72 / fig.dpi)
+    assert h == pytest.approx(bbox.height * 72 / fig.dpi)
+
+
+def test_colorart_does_not_touch_canvas(monkeypatch):
+    ax, m = make_mappable()
+
+    def no_renderer(*args, **kwargs):
+        raise AssertionError("canvas renderer should not be used")
+
+    monkeypatch.setattr(ax.figure.canvas, "get_renderer", no_renderer)
+    n_artists = len(ax.get_children())
+    colorart(m, ax=ax)
+    # only the colorart box is added
+    assert len(ax.get_children()) == n_artists + 1
+
+
+# ------------------------------------------------------------------
+# Tick location
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "norm",
+    [
+        None,
+        LogNorm(vmin=0.01, vmax=1.0),
+        SymLogNorm(linthresh=0.1, vmin=-1, vmax=1),
+        BoundaryNorm(np.linspace(0, 1, 101), ncolors=256),
+        NoNorm(),
+    ],
+)
+@pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
+def test_colorart_ticks_in_colorbox(norm, orientation):
+    ax, m = make_mappable(norm=norm)
+    ca = colorart(m, ax=ax, orientation=orientation, flip=True)
+    locs, ticks1, ticks2, ticklabels, _ = ca._get_ticks()
+    assert len(locs) == len(ticklabels) == len(ticks1) == len(ticks2)
+    length = ca.height if orientation == "vertical" else ca.width
+    assert ((locs >= 0) & (locs <= length)).all()
+    assert ticks1.shape == (len(locs), 2, 2)
+    along = 1 if orientation == "vertical" else 0
+    np.testing.assert_allclose(ticks1[:, 0, along], locs)
+    np.testing.assert_allclose(ticks2[:, 1, along], locs)
+
+
+# ------------------------------------------------------------------
+# Lazy construction
+# ------------------------------------------------------------------
+
+
+def test_colorart_lazy_build_on_draw():
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax, lazy=True)
+    assert ca._cbar_box is None
+    ax.figure.canvas.draw()
+    box = ca._cbar_box
+    assert box is not None
+    # memoized across draws
+    ax.figure.canvas.draw()
+    assert ca._cbar_box is box
+    # rebuilt after a property is changed
+    ca.set_alpha(0.5)
+    ax.figure.canvas.draw()
+    assert ca._cbar_box is not box
+
+
+def test_colorart_lazy_window_extent():
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax, lazy=True)
+    bbox = ca.get_window_extent(ax.figure.canvas.get_renderer())
+    assert bbox.width > 0
+    assert ca._cbar_box is not None
+
+
+def test_colorart_lazy_children():
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax, lazy=True)
+    assert ca.get_children() == []
+    ax.figure.findobj()
+    assert ca._cbar_box is None
+    ax.figure.canvas.draw()
+    assert ca.get_children() == [ca._cbar_box]
+    assert ca._cbar_box in ax.figure.findobj()
+
+
+def test_colorart_lazy_tightbbox():
+    def tight_width(**kwargs):
+        ax, m = make_mappable()
+        if kwargs:
+            colorart(m, ax=ax, **kwargs)
+        fig = ax.figure
+        return fig.get_tightbbox(fig.canvas.get_renderer()).width
+
+    eager = tight_width(lazy=False)
+    # the colorart outside the axes is kept
+    assert eager > tight_width()
+    assert tight_width(lazy=True) == pytest.approx(eager)
+
+
+def test_colorart_lazy_remove():
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax, lazy=True)
+    ca.remove()
+    assert ca not in ax.get_children()
+
+
+# ------------------------------------------------------------------
+# In-place update
+# ------------------------------------------------------------------
+
+
+def test_colorart_update_clim():
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax)
+    box, gradient = ca._cbar_box, ca._gradient
+    m.set_clim(0, 100)
+    # the containers are reused
+    assert ca._cbar_box is box
+    assert ca._gradient is gradient
+    labels = [t.get_text() for t in ca._ticklabels]
+    assert labels[-1] == "100"
+    texts = [c for c in ca._canvas.get_children() if isinstance(c, Text)]
+    assert texts == ca._ticklabels
+    ax.figure.canvas.draw()
+
+
+def test_colorart_update_cmap():
+    ax, m = make_mappable(cmap="cool")
+    ca = colorart(m, ax=ax)
+    gradient = ca._gradient
+    m.set_cmap("viridis")
+    assert ca._gradient is gradient
+    np.testing.assert_array_equal(
+        gradient.get_array()[-1, 0], matplotlib.colormaps["viridis"](255, bytes=True)
+    )
+
+
+def test_colorart_update_norm_type():
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax)
+    box = ca._cbar_box
+    m.set_norm(LogNorm(0.01, 1))
+    assert ca._cbar_box is not box
+    assert ca._cbar_box in ax.get_children()
+    assert box not in ax.get_children()
+
+
+def test_colorart_update_without_reference():
+    import gc
+    import weakref
+
+    ax, m = make_mappable()
+    ref = weakref.ref(colorart(m, ax=ax))
+    gc.collect()
+    m.set_clim(0, 100)
+    ca = ref()
+    assert ca is not None
+    assert ca._ticklabels[-1].get_text() == "100"
+
+
+def test_colorart_update_after_remove():
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax)
+    ticks = [t.get_text() for t in ca._ticklabels]
+    ca.remove()
+    m.set_clim(0, 100)
+    assert [t.get_text() for t in ca._ticklabels] == ticks
+
+
+# ------------------------------------------------------------------
+# Headless construction
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_colorart_headless_attach(lazy):
+    from matplotlib.colors import Normalize
+
+    n_figs = len(plt.get_fignums())
+    ca = colorart(cmap="cool", norm=Normalize(0, 1), draw=False, lazy=lazy, title="T")
+    assert ca.figure is None
+    assert len(plt.get_fignums()) == n_figs
+    ca.get_children()
+
+    fig, ax = plt.subplots()
+    ca.attach(ax)
+    assert ca.figure is fig
+    fig.canvas.draw()
+    assert ca.get_window_extent(fig.canvas.get_renderer()).width > 0
+    with pytest.raises(RuntimeError):
+        ca.attach(ax)
+    ca.remove()
+    assert ca._cbar_box not in ax.get_children()
+    assert ca not in ax.get_children()
+
+
+def test_colorart_draw_false_with_axes():
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax, draw=False)
+    assert ca._cbar_box not in ax.get_children()
+    ca.attach(ax)
+    assert ca._cbar_box in ax.get_children()
+
+
+# ------------------------------------------------------------------
+# Autoscale
+# ------------------------------------------------------------------
+
+
+def big_mappable():
+    from matplotlib.cm import ScalarMappable
+
+    data = np.zeros((2000, 2000))
+    data[1, 1] = 5
+    data[0, 0] = -1
+    m = ScalarMappable(cmap="viridis")
+    m.set_array(data)
+    # some matplotlib versions scale the norm in set_array
+    m.norm.vmin = None
+    m.norm.vmax = None
+    return m
+
+
+def test_colorart_autoscale_full():
+    m = big_mappable()
+    _, ax = plt.subplots()
+    colorart(m, ax=ax)
+    assert (m.norm.vmin, m.norm.vmax) == (-1, 5)
+
+
+def test_colorart_autoscale_sample():
+    m = big_mappable()
+    _, ax = plt.subplots()
+    colorart(m, ax=ax, autoscale="sample")
+    # the strided sample keeps the first element only
+    assert (m.norm.vmin, m.norm.vmax) == (-1, 0)
+
+
+def test_colorart_autoscale_data_range(monkeypatch):
+    m = big_mappable()
+
+    def scan(A):
+        raise AssertionError("The data should not be scanned")
+
+    monkeypatch.setattr(m.norm, "autoscale_None", scan)
+    _, ax = plt.subplots()
+    colorart(m, ax=ax, data_range=(-2, 10))
+    assert (m.norm.vmin, m.norm.vmax) == (-2, 10)
+    # limits already on the norm are reused
+    colorart(m, ax=ax)
+
+
+def test_autoscale_invalid():
+    _, ax = plt.subplots()
+    with pytest.raises(ValueError):
+        colorart(big_mappable(), ax=ax, autoscale="fast")
+
+
+# ------------------------------------------------------------------
+# Histogram
+# ------------------------------------------------------------------
+
+
+def test_histogram_memmap_chunks(tmp_path):
+    from legendkit._histogram import histogram
+
+    data = np.lib.format.open_memmap(
+        tmp_path / "data.npy", mode="w+", dtype=float, shape=(300, 40)
+    )
+    data[:] = np.random.rand(300, 40)
+    expected, _ = np.histogram(data, bins=10, range=(0, 1))
+    counts = histogram(data, lambda v: v, bins=10, chunk_size=1000)
+    np.testing.assert_array_equal(counts, expected)
+    # a sequence of chunks and a function returning the chunks
+    chunks = [data[:100], data[100:]]
+    np.testing.assert_array_equal(histogram(chunks, lambda v: v, bins=10), expected)
+    np.testing.assert_array_equal(
+        histogram(lambda: iter(chunks), lambda v: v, bins=10), expected
+    )
+
+
+@pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
+def test_colorart_hist(orientation):
+    ax, m = make_mappable()
+    ca = colorart(m, ax=ax, hist=True, hist_bins=5, orientation=orientation)
+    ax.figure.canvas.draw()
+    assert 0 < len(ca._hist_bars.get_paths()) <= 5
+    verts = ca._hist_bars.get_paths()[0].vertices
+    # the colors and the bars have the same length
+    along = 1 if orientation == "vertical" else 0
+    assert verts[:, along].min() >= 0
+    assert verts[:, along].max() <= (ca.height if along else ca.width) + 1e-9
+
+
+def test_colorart_hist_update():
+    ax, m = make_mappable(vmin=0, vmax=1)
+    ca = colorart(m, ax=ax, hist=np.full(10, 0.9), hist_bins=10)
+    bars = ca._hist_bars
+    (path,) = bars.get_paths()
+    m.set_clim(0, 2)
+    assert ca._hist_bars is bars
+    (new_path,) = bars.get_paths()
+    # the bar moves down along the colors
+    assert new_path.vertices[:, 1].max() < path.vertices[:, 1].min()
+
+
+def test_colorart_hist_iterator():
+    ax, m = make_mappable()
+    with pytest.raises(ValueError):
+        colorart(m, ax=ax, hist=iter([np.arange(3)]))
+
+
+# ------------------------------------------------------------------
+# Shared by several mappables
+# ------------------------------------------------------------------
+
+
+def test_colorart_shared_mappables():
+    fig, axes = plt.subplots(1, 3)
+    ms = [ax.imshow(np.full((2, 2), i) + [[0, 1], [0, 1]]) for i, ax in enumerate(axes)]
+    ca = colorart(ms)
+    assert ca.figure is fig
+    assert ca._cbar_box in fig.artists
+    assert all(m.norm is ms[0].norm for m in ms)
+    assert ms[0].norm.vmin == 0 and ms[0].norm.vmax == 3
+    # the norm is shared after the colorart is created
+    ms[2].set_clim(0, 10)
+    assert ms[0].get_clim() == (0, 10)
+    assert ca._ticklabels[-1].get_text() == "10"
+
+
+def test_colorart_shared_axes_placement():
+    fig, axes = plt.subplots(2, 2)
+    for ax in axes.flat:
+        ax.imshow(np.random.rand(2, 2))
+    ca = colorart(ax=axes, mappable=axes, loc="out right center")
+    fig.canvas.draw()
+    right = max(ax.get_window_extent().x1 for ax in axes.flat)
+    assert ca.get_window_extent().x0 >= right
+    # follows the axes when they are moved
+    for ax in axes.flat:
+        pos = ax.get_position()
+        ax.set_position([pos.x0 * 0.5, pos.y0, pos.width * 0.5, pos.height])
+    fig.canvas.draw()
+    new_right = max(ax.get_window_extent().x1 for ax in axes.flat)
+    assert new_right < ca.get_window_extent().x0 < right
+
+
+def test_colorart_shared_data_range(monkeypatch):
+    fig, axes = plt.subplots(1, 2)
+    ms = [ax.imshow(np.random.rand(2, 2)) for ax in axes]
+    for m in ms:
+        monkeypatch.setattr(m.norm, "autoscale_None", None)
+    colorart(ms, data_range=(-1, 2))
+    assert ms[1].get_clim() == (-1, 2)
@@ -149,6 +149,29 @@ def test_colorbar_only_height():
 # ------------------------------------------------------------------
 
 
+def test_colorbar_autoscale_sample():
+    from matplotlib.cm import ScalarMappable
+
+    data = np.zeros((2000, 2000))
+    data[0, 0] = -1
+    data[1, 1] = 5
+    _, ax = plt.subplots()
+    m = ScalarMappable(cmap="viridis")
+    m.set_array(data)
+    # some matplotlib versions scale the norm in set_array
+    m.norm.vmin = None
+    m.norm.vmax = None
+    colorbar(m, ax=ax, autoscale="sample")
+    # the strided sample keeps the first element only
+    assert (m.norm.vmin, m.norm.vmax) == (-1, 0)
+    m = ScalarMappable(cmap="viridis")
+    m.set_array(data)
+    m.norm.vmin = None
+    m.norm.vmax = None
+    colorbar(m, ax=ax, data_range=(0, 10))
+    assert (m.norm.vmin, m.norm.vmax) == (0, 10)
+
+
 def test_colorbar_boundary_norm():
     bounds = [0, 0.2, 0.5, 0.8, 1.0]
     norm = BoundaryNorm(bounds, ncolors=4)
@@ -168,3 +191,133 @@ def test_colorbar_title_fontproperties():
         m, ax=ax, title="T", title_fontproperties={"weight": "normal", "size": "small"}
     )
     assert cb is not None
+
+
+# ------------------------------------------------------------------
+# LiteColorbar
+# ------------------------------------------------------------------
+
+
+def test_lite_colorbar_no_axes():
+    from legendkit import lite_colorbar
+
+    ax, m = make_mappable()
+    n_axes = len(ax.figure.axes)
+    cb = lite_colorbar(m, ax=ax, title="Title")
+    ax.figure.canvas.draw()
+    assert repr(cb) == "<LiteColorbar>"
+    assert len(ax.figure.axes) == n_axes
+    # the size is in inches as Colorbar
+    assert (cb.width, cb.height) == (0.3 * 72, 1.5 * 72)
+
+
+def test_lite_colorbar_long_axis():
+    from legendkit import lite_colorbar
+
+    ax, m = make_mappable()
+    cb = lite_colorbar(m, ax=ax)
+    cb.long_axis.set_tick_params(direction="out", color="red", width=2, size=7)
+    cb.long_axis.set_tick_params(which="minor", color="blue")
+    lines = cb._ticks_lines[0]
+    assert lines.get_linewidth()[0] == 2
+    assert cb.tick_color == "red"
+    assert cb.tick_size == pytest.approx(-7 / cb.width)
+    with pytest.raises(ValueError):
+        cb.long_axis.set_tick_params(pad=3)
+
+
+def test_lite_colorbar_set_title():
+    from legendkit import lite_colorbar
+
+    ax, m = make_mappable()
+    cb = lite_colorbar(m, ax=ax)
+    cb.set_title("Title", loc="right")
+    assert cb._final_pack.get_children()[0].get_text() == "Title"
+
+
+@pytest.mark.parametrize("shape", ["ellipse", "triangle", "trapezoid"])
+def test_lite_colorbar_shape(shape):
+    from legendkit import lite_colorbar
+
+    ax, m = make_mappable()
+    cb = lite_colorbar(m, ax=ax, shape=shape)
+    assert cb._gradient.get_clip_path() is not None
+    ax.figure.canvas.draw()
+
+
+def test_lite_colorbar_invalid_shape():
+    from legendkit import lite_colorbar
+
+    ax, m = make_mappable()
+    with pytest.raises(ValueError):
+        lite_colorbar(m, ax=ax, shape="star")
+
+
+def test_colorbar_shared_axes():
+    fig, axes = plt.subplots(1, 2)
+    ms = [ax.imshow(np.random.rand(2, 2) + i) for i, ax in enumerate(axes)]
+    cb = colorbar(axes)
+    assert cb.mappable is ms[0]
+    assert ms[1].norm is ms[0].norm
+    vmin, vmax = ms[0].get_clim()
+    assert vmin < 1 and vmax > 1
+    fig.canvas.draw()
+    assert cb.ax.get_window_extent().x0 > axes[1].get_window_extent().x1
+
+
+@pytest.mark.parametrize("shape", ["ellipse", "triangle", "trapezoid"])
+def test_colorbar_shape_after_update(shape):
+    ax, m = make_mappable()
+    cb = colorbar(m, ax=ax, shape=shape)
+    clip = cb.solids.get_clip_path()
+    assert clip is not None
+    n_patches = len(cb.ax.patches)
+    m.set_clim(-1, 3)
+    # the solids are created again with the same cached clip path
+    new_clip = cb.solids.get_clip_path()
+    assert new_clip is not None
+    assert new_clip._path is clip._path
+    assert len(cb.ax.patches) == n_patches
+    ax.figure.canvas.draw()
+
+
+def test_colorbar_shape_boundary_norm():
+    ax, m = make_mappable(norm=BoundaryNorm([0, 0.3, 0.6, 1], 256))
+    cb = colorbar(m, ax=ax, shape="ellipse")
+    assert cb.solids.get_clip_path() is not None
+
+
+# ------------------------------------------------------------------
+# In-place update
+# ------------------------------------------------------------------
+
+
+def test_colorbar_update_reuses_axes():
+    from matplotlib.colors import LogNorm
+
+    ax, m = make_mappable()
+    cb = colorbar(m, ax=ax, shape="ellipse", title="A")
+    cax = cb.ax
+    n_axes = len(ax.figure.axes)
+    artists = cb.update(norm=LogNorm(0.1, 1), cmap="viridis", title="B")
+    assert cb.ax is cax
+    assert len(ax.figure.axes) == n_axes
+    assert cb.solids in artists
+    assert cb.solids.get_clip_path() is not None
+    assert cb.cmap.name == "viridis"
+    assert cax.get_title(loc="left") == "B"
+    # the white style is kept
+    tick = cb.long_axis.get_major_ticks()[0]
+    assert tick.tick1line.get_color() == "white"
+    ax.figure.canvas.draw()
+
+
+def test_colorbar_update_mappable():
+    ax, m = make_mappable()
+    cb = colorbar(m, ax=ax)
+    m2 = ax.pcolormesh(np.random.rand(3, 3) * 10, cmap="magma")
+    cb.update(m2)
+    assert cb.mappable is m2
+    assert m.colorbar is None
+    m2.set_clim(0, 20)
+    assert cb.vmax == 20
@@ -179,3 +179,60 @@ def test_stack_bad_type_raises():
 
     with pytest.raises(TypeError):
         stack(["not_an_artist"], ax=make_ax())
+
+
+def test_vstack_lazy_colorart():
+    fig, ax = plt.subplots()
+    m = ax.pcolormesh(np.random.rand(5, 5), cmap="cool")
+    ca = colorart(m, ax=ax, lazy=True)
+    leg = cat_legend(ax=ax, colors=["red", "blue"], labels=["A", "B"])
+    box = vstack([leg, ca], loc="out right center", ax=ax)
+    fig.canvas.draw()
+    assert ca not in ax.get_children()
+    assert box is not None
+
+
+def test_vstack_headless_colorart():
+    n_figs = len(plt.get_fignums())
+    ca = colorart(cmap="cool", norm=matplotlib.colors.Normalize(0, 1), draw=False)
+    assert ca.figure is None
+    # no pyplot figure is created
+    assert len(plt.get_fignums()) == n_figs
+    fig, ax = plt.subplots()
+    leg = cat_legend(ax=ax, colors=["red", "blue"], labels=["A", "B"])
+    vstack([leg, ca], loc="out right center", ax=ax)
+    fig.canvas.draw()
+
+
+def test_vstack_colorart_follows_mappable():
+    from matplotlib.text import Text
+
+    fig, ax = plt.subplots()
+    m = ax.pcolormesh(np.random.rand(5, 5), cmap="cool", vmin=0, vmax=1)
+    ca = colorart(m, ax=ax)
+    vstack([ca], loc="out right center", ax=ax)
+    m.set_clim(0, 100)
+    fig.canvas.draw()
+    texts = [c.get_text() for c in ca._canvas.get_children() if isinstance(c, Text)]
+    assert "100" in texts
+
+
+def test_vstack_batched_legend():
+    def red_pixels(batch_handles):
+        fig, ax = plt.subplots()
+        ax.set_axis_off()
+        leg = cat_legend(
+            ax=ax,
+            colors=["red", "red"],
+            labels=["A", "B"],
+            handle="rect",
+            batch_handles=batch_handles,
+        )
+        vstack([leg], loc="center", ax=ax)
+        fig.canvas.draw()
+        img = np.asarray(fig.canvas.buffer_rgba())
+        return ((img[..., 0] == 255) & (img[..., 1] == 0)).sum()
+
+    n = red_pixels(False)
+    assert n > 0
+    assert red_pixels(True) == n
@@ -1,9 +1,11 @@
+import io
 import itertools
 
 import matplotlib
 import pytest
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.colors import to_rgba
 from matplotlib.lines import Line2D
 
 from legendkit import legend, cat_legend, size_legend
@@ -178,3 +180,296 @@ def test_loc_inside_options():
         leg = legend(ax, loc=loc)
         assert leg is not None
         plt.close("all")
+
+
+def test_legend_skips_unlabeled_artists():
+    _, ax = plt.subplots()
+    for _ in range(5):
+        ax.plot([0, 1])
+    ax.plot([0, 1], label="_hidden")
+    ax.plot([0, 1], label="Line")
+    ax.bar([0, 1], [1, 2], label="Bar")
+    leg = legend(ax)
+    assert [t.get_text() for t in leg.get_texts()] == ["Line", "Bar"]
+
+
+def test_legend_handles_type_cache():
+    from matplotlib.legend_handler import HandlerLine2D
+
+    from legendkit._legend import _get_legend_handles
+
+    _, ax = plt.subplots()
+    line1 = ax.plot([0, 1], label="A")[0]
+    ax.plot([0, 1], label="B")
+    # a handler set for an instance is still found
+    text = ax.text(0, 0, "text", label="Text")
+    handles = list(_get_legend_handles([ax], {line1: HandlerLine2D()}))
+    assert [h.get_label() for h in handles] == ["A", "B"]
+    assert text not in handles
+
+
+def test_legend_figure_dedupe():
+    fig, axes = plt.subplots(2, 2)
+    for ax in axes.flat:
+        ax.plot([0, 1], color="r", label="Control")
+        ax.plot([0, 1], color="b", label="Treated")
+    axes[0, 0].plot([0, 1], color="g", label="Control")
+    assert len(legend(fig).get_texts()) == 9
+    texts = [t.get_text() for t in legend(fig, dedupe=True).get_texts()]
+    assert texts == ["Control", "Treated", "Control"]
+
+
+def test_legend_dedupe_style_fingerprint():
+    fig, axes = plt.subplots(3, 3)
+    for i, ax in enumerate(axes.flat):
+        # the same color in different forms
+        ax.plot([0, 1], color="C0" if i % 2 else "#1f77b4", label="Control")
+        ax.scatter([0, 1], [0, 1], color="r", label="Points")
+        ax.bar([0, 1], [1, 2], color="g", label="Bar")
+    axes[0, 0].scatter([0, 1], [0, 1], color="r", marker="^", label="Points")
+    axes[0, 0].plot([0, 1], color="C0", ls="--", label="Control")
+    leg = legend(fig, dedupe=True)
+    texts = [t.get_text() for t in leg.get_texts()]
+    assert texts == ["Control", "Points", "Points", "Control", "Bar"]
+
+
+def _legend_memory(n, proxy_handles):
+    import tracemalloc
+
+    fig, ax = plt.subplots()
+    x = np.random.rand(n)
+    ax.scatter(x, x, c=x, label="Points")
+    ax.plot(x, label="Line")
+    ax.fill_between(np.arange(n), x, label="Fill")
+    ax.errorbar(x[:1000], x[:1000], yerr=0.1, label="Error")
+    renderer = fig.canvas.get_renderer()
+    tracemalloc.start()
+    leg = legend(ax, proxy_handles=proxy_handles, loc="upper right")
+    leg.draw(renderer)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return leg, peak
+
+
+def test_legend_proxy_handles_memory():
+    _, small = _legend_memory(1_000, proxy_handles=True)
+    leg, large = _legend_memory(200_000, proxy_handles=True)
+    # the colors of all the points are not mapped for the legend
+    assert large < small + 1_000_000
+    _, unbounded = _legend_memory(200_000, proxy_handles=False)
+    assert unbounded > large + 4_000_000
+    assert [t.get_text() for t in leg.get_texts()] == [
+        "Points",
+        "Line",
+        "Fill",
+        "Error",
+    ]
+    points = leg.legend_handles[0]
+    assert points.get_array() is None
+
+
+def test_legend_items_handle_cache():
+    _, ax = plt.subplots()
+    config = {"fc": "red", "ec": "black"}
+    leg = legend(
+        ax,
+        legend_items=[
+            ("circle", "A", config),
+            ("circle", "B", dict(config)),
+            ("circle", "C", {"fc": "blue"}),
+            ("star", "D", {"ls": (0, [2, 1])}),
+            ("rect", "E", config),
+        ],
+    )
+    # the user's config is not modified
+    assert config == {"fc": "red", "ec": "black"}
+    assert len(leg.get_texts()) == 5
+    handles, _, _ = leg._parse_items(
+        [("circle", "A", config), ("circle", "B", dict(config)), ("circle", "C")]
+    )
+    a, b, c = handles
+    assert a is b
+    assert a is not c
+    assert a.get_markerfacecolor() == "red"
+
+
+def test_legend_items_follow_rcparams():
+    _, ax = plt.subplots()
+    items = [("rect", "A"), ("circle", "B")]
+    legend(ax, legend_items=items)
+    with matplotlib.rc_context({"patch.facecolor": "red", "lines.markeredgewidth": 3}):
+        leg = legend(ax, legend_items=items)
+    rect, circle = leg.legend_handles
+    np.testing.assert_array_equal(rect.get_facecolor(), [1, 0, 0, 1])
+    assert circle.get_markeredgewidth() == 3
+
+
+def test_legend_shared_handler_map():
+    from legendkit._register import default_handler_map
+
+    _, ax = plt.subplots()
+    items = [("rect", "A", {}), ("circle", "B", {})]
+    handler_map = {}
+    leg1 = legend(ax, legend_items=items, handler_map=handler_map)
+    leg2 = legend(ax, legend_items=items)
+    # the user's map is not modified
+    assert handler_map == {}
+    assert not leg2._custom_handler_map
+    map1, map2 = leg1.get_legend_handler_map(), leg2.get_legend_handler_map()
+    for item_type, handler in default_handler_map.items():
+        assert map1[item_type] is handler
+        assert map2[item_type] is handler
+
+
+def test_legend_batch_handles():
+    def render(**kwargs):
+        fig, ax = plt.subplots(figsize=(3, 3))
+        leg = cat_legend(
+            ax,
+            colors=["red", "green", "blue"] * 10,
+            labels=[f"Item {i}" for i in range(30)],
+            handle="rect",
+            loc="center",
+            ncols=3,
+            **kwargs,
+        )
+        fig.canvas.draw()
+        return leg, np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    leg, batched = render(batch_handles=True)
+    _, unbatched = render()
+    np.testing.assert_array_equal(batched, unbatched)
+
+    (batch,) = leg._handle_batches
+    assert len(batch.handles) == 30
+    assert len(batch.get_paths()) == 30
+    # the handles are still the source of the style
+    leg.legend_handles[0].set_facecolor("black")
+    leg.figure.canvas.draw()
+    np.testing.assert_array_equal(batch.get_facecolor()[0], [0, 0, 0, 1])
+
+
+@pytest.mark.parametrize("handle", ["circle", "square", "triangle"])
+@pytest.mark.parametrize("dpi", [72, 100, 150])
+def test_legend_batch_marker_handles(handle, dpi):
+    def render(**kwargs):
+        fig, ax = plt.subplots(figsize=(3, 3), dpi=dpi)
+        leg = cat_legend(
+            ax,
+            colors=[f"C{i}" for i in range(10)],
+            labels=[f"Item {i}" for i in range(10)],
+            handle=handle,
+            loc="center",
+            ncols=2,
+            **kwargs,
+        )
+        fig.canvas.draw()
+        return leg, np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    leg, batched = render(batch_handles=True)
+    _, unbatched = render()
+    np.testing.assert_array_equal(batched, unbatched)
+
+    (batch,) = leg._handle_batches
+    assert len(batch.handles) == 10
+    # the markers share one path
+    assert len(batch.get_paths()) == 1
+    assert len(batch.get_offsets()) == 10
+    leg.figure.savefig(io.BytesIO(), format="svg")
+
+
+def test_legend_batch_mixed_markers():
+    def render(**kwargs):
+        fig, ax = plt.subplots(figsize=(3, 3))
+        handles = [
+            Line2D([], [], ls="", marker="o", ms=4, mfc="r", alpha=0.5),
+            Line2D([], [], ls="", marker="s", ms=12, mfc="b", mec="k", mew=2),
+            Line2D([], [], ls="", marker="^", ms=7, mfc="g", alpha=0.3),
+            Line2D([], [], ls="", marker="D", ms=3, mfc="m", mec="y"),
+            Line2D([], [], ls="", marker="x", ms=8),
+        ]
+        leg = legend(ax, handles=handles, labels=list("ABCDE"), loc="center", **kwargs)
+        fig.canvas.draw()
+        return leg, np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    leg, batched = render(batch_handles=True)
+    _, unbatched = render()
+    np.testing.assert_array_equal(batched, unbatched)
+    # grouped by join style, an unfilled marker is drawn on its own
+    assert sorted(len(b.handles) for b in leg._handle_batches) == [1, 3]
+
+
+def test_legend_boxplot_shared_path():
+    _, ax = plt.subplots()
+    leg = legend(
+        ax,
+        legend_items=[("boxplot", "A", {"fc": "red"}), ("boxplot", "B")],
+    )
+    a, b = leg.legend_handles
+    # one artist and one path for each boxplot handle
+    assert len(a.get_paths()) == 1
+    assert a.get_paths()[0] is b.get_paths()[0]
+    np.testing.assert_array_equal(a.get_facecolor()[0], [1, 0, 0, 1])
+
+
+@pytest.mark.parametrize("batch_handles", [False, True])
+def test_legend_set_items(batch_handles):
+    def items(labels):
+        return [("rect", label, {"fc": f"C{i}"}) for i, label in enumerate(labels)]
+
+    def render(leg):
+        leg.figure.canvas.draw()
+        return np.asarray(leg.figure.canvas.buffer_rgba()).copy()
+
+    options = dict(loc="center", ncols=2, batch_handles=batch_handles)
+    _, ax = plt.subplots(figsize=(3, 3))
+    leg = legend(ax, legend_items=items(["A", "B", "C"]), **options)
+    render(leg)
+    boxes = [itembox for _, itembox, _, _ in leg._entries]
+
+    leg.set_items(items(["A", "B", "D", "E"]))
+    assert [t.get_text() for t in leg.get_texts()] == ["A", "B", "D", "E"]
+    assert len(leg.legend_handles) == 4
+    # the unchanged entries are reused
+    assert leg._entries[0][1] is boxes[0]
+    assert leg._entries[1][1] is boxes[1]
+    assert leg._entries[2][1] is not boxes[2]
+
+    _, ax = plt.subplots(figsize=(3, 3))
+    expected = legend(ax, legend_items=items(["A", "B", "D", "E"]), **options)
+    np.testing.assert_array_equal(render(leg), render(expected))
+
+
+def test_legend_set_items_reverse():
+    _, ax = plt.subplots()
+    leg = legend(ax, legend_items=[("rect", "A"), ("rect", "B")], reverse=True)
+    leg.set_items([("rect", "A"), ("rect", "B"), ("rect", "D")])
+    assert [t.get_text() for t in leg.get_texts()] == ["D", "B", "A"]
+
+
+def test_legend_set_items_labelcolor():
+    _, ax = plt.subplots()
+    items = [("circle", label, {"color": c}) for label, c in zip("AB", "rb")]
+    leg = legend(ax, legend_items=items, labelcolor="linecolor")
+    leg.set_items(items + [("circle", "C", {"color": "g"})])
+    colors = [to_rgba(t.get_color()) for t in leg.get_texts()]
+    assert colors == [to_rgba(c) for c in "rbg"]
+
+    leg = legend(ax, legend_items=items, labelcolor=["r", "b"])
+    leg.set_items(items[1:] + items[:1])
+    colors = [to_rgba(t.get_color()) for t in leg.get_texts()]
+    assert colors == [to_rgba(c) for c in "rb"]
+
+
+def test_legend_set_items_stacked():
+    from legendkit import vstack
+
+    fig, ax = plt.subplots()
+    legend(ax, legend_items=[("rect", "Z")])
+    # an extra legend, it's removed from the axes when stacked
+    leg = legend(ax, legend_items=[("rect", "A")])
+    vstack([leg], ax=ax)
+    assert leg.figure is None
+    leg.set_items([("rect", "A"), ("rect", "B")])
+    fig.canvas.draw()
+    assert [t.get_text() for t in leg.get_texts()] == ["A", "B"]